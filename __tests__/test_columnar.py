@@ -0,0 +1,121 @@
+# Copyright 2024 Stichting Health-RI
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from datetime import date
+
+import pytest
+
+from sempyro.columnar import (
+    EMAIL_CHECK,
+    HTTP_URL_CHECK,
+    NON_NEGATIVE_INTEGER_CHECK,
+    TEMPORAL_CHECK,
+    TEMPORAL_PATTERN,
+    URL_CHECK,
+    field_checks,
+    validate_batch,
+)
+from sempyro.hri_dcat import HRIAgent, HRIDataset, HRIVCard
+from sempyro.utils.temporal import classify_temporal
+
+
+def test_field_checks():
+    dataset_checks = field_checks(HRIDataset)
+    assert dataset_checks["landing_page"] == HTTP_URL_CHECK
+    assert dataset_checks["release_date"] == TEMPORAL_CHECK
+    assert dataset_checks["modification_date"] == TEMPORAL_CHECK
+    assert dataset_checks["number_of_records"] == NON_NEGATIVE_INTEGER_CHECK
+    assert dataset_checks["minimum_typical_age"] == NON_NEGATIVE_INTEGER_CHECK
+    assert "title" not in dataset_checks
+    assert "access_rights" not in dataset_checks
+    assert field_checks(HRIAgent)["mbox"] == EMAIL_CHECK
+    assert field_checks(HRIAgent)["homepage"] == URL_CHECK
+    assert field_checks(HRIVCard)["hasEmail"] == EMAIL_CHECK
+
+
+def test_validate_batch():
+    batch = {"landing_page": ["https://example.com", "example.com", None, "http://example.com/a b"],
+             "records": ["10", "-1", 5, ""],
+             "release_date": ["2024-01", "yesterday", date(2024, 1, 1), "1 January 2024"],
+             "title": ["a", "b", "c", "d"]}
+    result = validate_batch(batch, HRIDataset, columns={"landing_page": "landing_page",
+                                                        "number_of_records": "records",
+                                                        "release_date": "release_date",
+                                                        "title": "title"})
+    assert result.mask == [True, False, True, True]
+    assert result.errors == {1: [("landing_page", HTTP_URL_CHECK), ("records", NON_NEGATIVE_INTEGER_CHECK),
+                                 ("release_date", TEMPORAL_CHECK)]}
+    assert result.valid_rows() == [0, 2, 3]
+
+
+@pytest.mark.parametrize("value, valid", [("info@example.com", True), ("mailto:info@example.com", True),
+                                          ("info", False), ("info@example", False), ("in fo@example.com", False)])
+def test_validate_batch_email(value, valid):
+    assert validate_batch({"hasEmail": [value]}, HRIVCard).mask == [valid]
+
+
+def test_validate_batch_list_cells():
+    batch = {"health_category": [["http://example.com/1", "http://example.com/2"], ["http://example.com/1", "x"]],
+             "number_of_records": [1, -1]}
+    result = validate_batch(batch, HRIDataset)
+    assert result.errors == {1: [("health_category", HTTP_URL_CHECK), ("number_of_records",
+                                                                        NON_NEGATIVE_INTEGER_CHECK)]}
+
+
+@pytest.mark.parametrize("values, mask", [([3, 3.0, 3.5], [True, True, False]),
+                                          ([3.5, 3, 3.0], [False, True, True]),
+                                          ([1, True, -1.0, float("inf")], [True, True, False, False]),
+                                          ([[2, 2.5], [2, 2.0]], [False, True])])
+def test_validate_batch_numbers(values, mask):
+    assert validate_batch({"number_of_records": values}, HRIDataset).mask == mask
+
+
+TEMPORAL_VALUES = ["2024", "2024Z", "-0044", "12024", "2024-01", "2024-01+02:00", "2024-01-31", "2024-01-31Z",
+                   "2024-01-31T10:00:00", "2024-01-31T10:00:00.5+01:00", "2024-01-31T24:00:00", "1 January 2024",
+                   "024", "2024-13", "2024-13-45", "2024-01-01T", "2024-01-01Tnoon", "2024-01-01T25:00:00",
+                   "2024-01-01T10:00:00+15:00", "2024-01-31 10:00", "not a date", ""]
+
+
+def test_temporal_pattern_matches_classify_temporal():
+    assert ([TEMPORAL_PATTERN.fullmatch(x) is not None for x in TEMPORAL_VALUES] ==
+            [classify_temporal(x) is not None for x in TEMPORAL_VALUES])
+
+
+def test_validate_batch_temporal_dataframe():
+    pandas = pytest.importorskip("pandas")
+    frame = pandas.DataFrame({"release_date": TEMPORAL_VALUES})
+    assert (validate_batch(frame, HRIDataset).mask ==
+            validate_batch({"release_date": TEMPORAL_VALUES}, HRIDataset).mask)
+
+
+def test_validate_batch_dataframe():
+    pandas = pytest.importorskip("pandas")
+    frame = pandas.DataFrame({"mbox": ["info@example.com", "info", ""],
+                              "homepage": ["https://example.com", "https://example.com", "no url"]})
+    result = validate_batch(frame, HRIAgent)
+    assert result.mask == [True, False, False]
+    assert result.errors == {1: [("mbox", EMAIL_CHECK)], 2: [("homepage", URL_CHECK)]}
+
+
+def test_validate_batch_dataframe_numbers():
+    pandas = pytest.importorskip("pandas")
+    numpy = pytest.importorskip("numpy")
+    frame = pandas.DataFrame({"number_of_records": numpy.array([3, 0, -2], dtype=numpy.int64),
+                              "minimum_typical_age": [18.0, 18.5, None]})
+    result = validate_batch(frame, HRIDataset)
+    assert result.mask == [True, False, False]
+    assert result.errors == {1: [("minimum_typical_age", NON_NEGATIVE_INTEGER_CHECK)],
+                             2: [("number_of_records", NON_NEGATIVE_INTEGER_CHECK)]}
+    batch = {"number_of_records": [numpy.int64(4), numpy.float64(4.0), numpy.int64(-1)]}
+    assert validate_batch(batch, HRIDataset).mask == [True, True, False]
@@ -0,0 +1,142 @@
+# Copyright 2024 Stichting Health-RI
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import io
+from pathlib import Path
+
+import pytest
+from rdflib import DCAT, DCTERMS, FOAF, Graph, Literal, URIRef
+
+from sempyro import SerializationSession
+from sempyro.dcat import AccessRights, DCATDataset
+from sempyro.foaf import Agent
+from sempyro.hri_dcat import DatasetTheme, HRIDataset, HRIVCard
+from sempyro.ingest import Column, Constant, Nested, ingest_csv, map_row
+
+EXAMPLE_DATA = Path(__file__).parents[1] / "docs" / "example_data.csv"
+
+DCAT_MAPPING = {"identifier": "id",
+                "title": "name",
+                "description": "description",
+                "keyword": Column("keywords", split=","),
+                "creator": Nested(Agent, {"name": "author_name", "identifier": "author_id"})}
+
+HRI_CSV = """id,title,description,email,records,keywords
+1,Cohort study,Cohort of patients,info@example.com,100,cohort;patients
+2,,No title,info@example.com,10,cohort
+3,Registry,Disease registry,info@example.com,many,registry
+4,Biobank,Samples,info@example.com,5,biobank
+"""
+
+HRI_MAPPING = {"identifier": "id",
+               "title": "title",
+               "description": "description",
+               "keyword": Column("keywords", split=";"),
+               "number_of_records": Column("records"),
+               "contact_point": {"hasEmail": "email", "formatted_name": Constant("Data steward")},
+               "access_rights": Constant(AccessRights.public),
+               "creator": Constant(["https://example.com/organisation"]),
+               "publisher": Constant("https://example.com/organisation"),
+               "theme": Constant([DatasetTheme.heal]),
+               "applicable_legislation": Constant(["http://data.europa.eu/eli/reg/2025/327/oj"]),
+               "health_category": Constant(["http://example.com/category/1"])}
+
+
+def test_map_row():
+    row = {"id": "1", "name": "Project", "description": "", "keywords": "magic, spells", "author_name": "Luna",
+           "author_id": "https://example.com/luna"}
+    assert map_row(DCATDataset, DCAT_MAPPING, row) == {
+        "identifier": ["1"], "title": ["Project"], "keyword": ["magic", "spells"],
+        "creator": [{"name": ["Luna"], "identifier": "https://example.com/luna"}]}
+
+
+def test_map_row_ambiguous_nested_model():
+    with pytest.raises(ValueError, match="Nested"):
+        map_row(DCATDataset, {"creator": {"name": "author_name"}}, {"author_name": "Luna"})
+
+
+def test_ingest_csv_ntriples():
+    output = io.StringIO()
+    progress = []
+    result = ingest_csv(EXAMPLE_DATA, DCATDataset, DCAT_MAPPING, output, subject="https://example.com/dataset/{id}",
+                        delimiter=";", chunk_size=3, progress=progress.append)
+    assert (result.rows, result.written, result.errors) == (4, 4, [])
+    assert [x.rows for x in progress] == [3, 4]
+    assert all(x.rows_per_second > 0 for x in progress)
+    graph = Graph().parse(data=output.getvalue(), format="nt")
+    assert len(graph) == result.triples
+    assert set(graph.subjects(predicate=DCTERMS.title)) == {URIRef(f"https://example.com/dataset/{x}")
+                                                            for x in range(1, 5)}
+    assert (None, FOAF.name, Literal("Luna Lovegood")) in graph
+
+
+def test_ingest_csv_collects_row_errors():
+    graph = Graph()
+    result = ingest_csv(io.StringIO(HRI_CSV), HRIDataset, HRI_MAPPING, graph,
+                        subject="https://example.com/dataset/{id}", chunk_size=2)
+    assert (result.rows, result.written) == (4, 2)
+    assert [x.row for x in result.errors] == [2, 3]
+    assert result.errors[0].errors[0]["loc"] == ("title",)
+    assert result.errors[1].errors[0]["loc"][0] == "number_of_records"
+    assert result.triples == len(graph)
+    assert set(graph.subjects(predicate=DCAT.keyword)) == {URIRef("https://example.com/dataset/1"),
+                                                           URIRef("https://example.com/dataset/4")}
+    dataset = HRIDataset.model_validate(map_row(HRIDataset, HRI_MAPPING, {"id": "4", "title": "Biobank",
+                                                                          "description": "Samples",
+                                                                          "email": "info@example.com",
+                                                                          "keywords": "biobank"}))
+    assert dataset.contact_point == HRIVCard(hasEmail="info@example.com", formatted_name="Data steward")
+
+
+def test_ingest_csv_invalid_mapping():
+    with pytest.raises(ValueError, match="no field 'name'"):
+        ingest_csv(EXAMPLE_DATA, DCATDataset, {"name": "name"}, io.StringIO(), delimiter=";")
+    with pytest.raises(ValueError, match="Nested"):
+        ingest_csv(EXAMPLE_DATA, DCATDataset, {"creator": {"name": "author_name"}}, io.StringIO(), delimiter=";")
+
+
+def test_ingest_csv_prevalidate():
+    graph = Graph()
+    result = ingest_csv(io.StringIO(HRI_CSV), HRIDataset, HRI_MAPPING, graph, subject="https://example.com/dataset/{id}",
+                        prevalidate=True)
+    assert (result.rows, result.written) == (4, 2)
+    assert [x.row for x in result.errors] == [2, 3]
+    assert result.errors[0].errors[0]["loc"] == ("title",)
+    assert result.errors[1].errors == [{"type": "non_negative_integer", "loc": ("records",),
+                                        "msg": "Invalid non_negative_integer in column records"}]
+
+
+def test_ingest_csv_session_attached_to_graph_sink():
+    graph = Graph()
+    session = SerializationSession(deduplicate=True)
+    result = ingest_csv(EXAMPLE_DATA, DCATDataset, DCAT_MAPPING, graph, delimiter=";", session=session)
+    assert result.written == 4
+    assert session.graph is graph
+    assert len(graph) == result.triples
+    with pytest.raises(ValueError, match="another graph"):
+        ingest_csv(EXAMPLE_DATA, DCATDataset, DCAT_MAPPING, Graph(), delimiter=";", session=session)
+
+
+def test_ingest_csv_subject_errors():
+    with pytest.raises(ValueError, match="missing from the header: uid"):
+        ingest_csv(io.StringIO(HRI_CSV), HRIDataset, HRI_MAPPING, io.StringIO(),
+                   subject="https://example.com/dataset/{uid}")
+    rows = HRI_CSV.replace("4,Biobank", "4 5,Biobank")
+    output = io.StringIO()
+    result = ingest_csv(io.StringIO(rows), HRIDataset, HRI_MAPPING, output, subject="https://example.com/dataset/{id}")
+    assert (result.rows, result.written) == (4, 1)
+    assert [x.row for x in result.errors] == [2, 3, 4]
+    assert result.errors[2].errors == [{"type": "subject", "loc": ("subject",),
+                                        "msg": "'https://example.com/dataset/4 5' is not a valid IRI"}]
+    assert len(Graph().parse(data=output.getvalue(), format="nt")) == result.triples
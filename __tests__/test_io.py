@@ -0,0 +1,102 @@
+# Copyright 2024 Stichting Health-RI
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import gzip
+import io
+import json
+import logging
+
+import pytest
+from pydantic import ValidationError
+
+from sempyro.dcat import DCATDataset
+from sempyro.healthdcatap import HEALTHDCATAPDataset, HEALTHDCATAPDistribution
+from sempyro.hri_dcat import HRICatalog, HRIDataset, HRIDistribution
+from sempyro.io import dump_json, read_ndjson, write_ndjson
+from sempyro.synthetic import CatalogGenerator
+
+
+def _datasets(count: int):
+    return (DCATDataset(title=[f"Dataset {x}"], description=["A test dataset"], keyword=["test"],
+                        release_date="2024-01-01") for x in range(count))
+
+
+def test_ndjson_round_trip(tmp_path):
+    path = tmp_path / "datasets.ndjson"
+    assert write_ndjson(path, _datasets(3)) == 3
+    lines = path.read_text().splitlines()
+    assert [json.loads(x)["title"][0]["value"] for x in lines] == ["Dataset 0", "Dataset 1", "Dataset 2"]
+    assert list(read_ndjson(path, DCATDataset)) == list(_datasets(3))
+
+
+def test_ndjson_gzip(tmp_path):
+    path = tmp_path / "distributions.ndjson.gz"
+    distributions = [CatalogGenerator(seed=1).distribution(0, x) for x in range(2)]
+    assert write_ndjson(path, distributions) == 2
+    with gzip.open(path, "rt") as compressed:
+        assert len(compressed.read().splitlines()) == 2
+    # compression is detected from the content, not from the file name
+    renamed = path.rename(tmp_path / "distributions.ndjson")
+    assert [dump_json(x) for x in read_ndjson(renamed, HRIDistribution)] == [dump_json(x) for x in distributions]
+
+
+HRI_NESTED_MODELS = {HEALTHDCATAPDataset: HRIDataset, HEALTHDCATAPDistribution: HRIDistribution}
+
+
+def test_ndjson_hri_round_trip(tmp_path):
+    generator = CatalogGenerator(datasets=5, seed=3)
+    path = tmp_path / "datasets.ndjson"
+    assert generator.write_ndjson(path) == 5
+    datasets = list(read_ndjson(path, HRIDataset, nested_models=HRI_NESTED_MODELS))
+    assert [dump_json(x) for x in datasets] == [dump_json(x) for x in generator.iter_datasets()]
+    assert all(isinstance(x, HRIDistribution) for dataset in datasets for x in dataset.distribution)
+    catalog = generator.catalog()
+    [read_catalog] = read_ndjson(io.StringIO(dump_json(catalog)), HRICatalog, nested_models=HRI_NESTED_MODELS)
+    assert dump_json(read_catalog) == dump_json(catalog)
+    assert all(isinstance(x, HRIDataset) for x in read_catalog.dataset)
+    assert all(isinstance(x, HRIDistribution) for dataset in read_catalog.dataset for x in dataset.distribution)
+
+
+def test_ndjson_nested_models_errors():
+    record = json.loads(dump_json(CatalogGenerator(seed=1).dataset(0)))
+    # without substitution the HRIDistribution fields are unknown to HEALTHDCATAPDistribution
+    with pytest.raises(ValidationError):
+        next(read_ndjson(io.StringIO(json.dumps(record)), HRIDataset))
+    del record["distribution"][0]["access_url"]
+    with pytest.raises(ValidationError) as error:
+        next(read_ndjson(io.StringIO(json.dumps(record)), HRIDataset, nested_models=HRI_NESTED_MODELS))
+    assert error.value.title == "HRIDistribution"
+    assert [x["loc"] for x in error.value.errors()] == [("access_url",)]
+
+
+def test_ndjson_file_objects():
+    text, binary = io.StringIO(), io.BytesIO()
+    write_ndjson(text, _datasets(2))
+    write_ndjson(binary, _datasets(2))
+    assert binary.getvalue().decode("utf-8") == text.getvalue()
+    binary.seek(0)
+    reader = read_ndjson(binary, DCATDataset)
+    assert next(reader).title[0].value == "Dataset 0"
+    assert [x.title[0].value for x in reader] == ["Dataset 1"]
+
+
+def test_read_ndjson_invalid_lines(caplog):
+    lines = '{"title": ["First"], "description": ["Valid"]}\n\n{"title": ["Second"]}\n'
+    with pytest.raises(ValidationError):
+        list(read_ndjson(io.StringIO(lines), DCATDataset))
+    with caplog.at_level(logging.WARNING):
+        assert len(list(read_ndjson(io.StringIO(lines), DCATDataset, on_error="skip"))) == 1
+    assert "Line 3 skipped" in caplog.text
+    with pytest.raises(ValueError, match="on_error"):
+        read_ndjson(io.StringIO(lines), DCATDataset, on_error="collect")
@@ -0,0 +1,55 @@
+# Copyright 2024 Stichting Health-RI
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import subprocess
+import sys
+
+import pytest
+
+import sempyro
+from sempyro import hri_dcat
+
+
+def loaded_modules(statement: str) -> set:
+    code = f"import json, sys; {statement}; print(json.dumps([x for x in sys.modules if x.startswith('sempyro')]))"
+    output = subprocess.run([sys.executable, "-c", code], check=True, capture_output=True, text=True).stdout
+    return set(json.loads(output))
+
+
+def test_import_sempyro_is_lazy():
+    modules = loaded_modules("import sempyro")
+    assert "sempyro.rdf_model" not in modules
+    assert not any(x.startswith("sempyro.dcat") for x in modules)
+
+
+def test_import_model_loads_its_dependencies_only():
+    modules = loaded_modules("from sempyro.hri_dcat import HRIAgent")
+    assert "sempyro.hri_dcat.hri_agent" in modules
+    assert "sempyro.hri_dcat.hri_dataset" not in modules
+    assert "sempyro.dcat.dcat_dataset" not in modules
+
+
+def test_lazy_attributes():
+    assert sempyro.RDFModel is sempyro.rdf_model.RDFModel
+    assert sempyro.hri_dcat is hri_dcat
+    assert "HRIDataset" in dir(hri_dcat)
+    assert isinstance(sempyro.__version__, str)
+    with pytest.raises(AttributeError):
+        _ = hri_dcat.NotAModel
+
+
+def test_namespace_submodule_imported_first():
+    modules = loaded_modules("from sempyro.namespaces.ADMS import ADMSStatus; from sempyro.dcat import DCATDataset")
+    assert "sempyro.dcat.dcat_dataset" in modules
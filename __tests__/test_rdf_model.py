@@ -16,12 +16,14 @@ from datetime import date, datetime
 from typing import Union
 
 import pytest
-from pydantic import AwareDatetime, NaiveDatetime, field_validator
+from pydantic import AwareDatetime, ConfigDict, Field, NaiveDatetime, ValidationError, field_validator
 from rdflib import XSD, Graph, Literal, URIRef
 from rdflib.compare import to_isomorphic
 
-from sempyro import RDFModel
+from sempyro import RDFModel, validate_many
 from sempyro.dcat import DCATDataset
+from sempyro.hri_dcat import HRIDistribution
+from sempyro.rdf_model import RDFModelError
 from sempyro.utils.validator_functions import date_handler
 
 
@@ -30,7 +32,9 @@ from sempyro.utils.validator_functions import date_handler
     (1707995797, Literal("2024-02-15T11:16:37+00:00", datatype=XSD.dateTime)),
     ("November 9, 1999", Literal("1999-11-09T00:00:00", datatype=XSD.dateTime)),
     (datetime.date(datetime.now()), Literal(str(datetime.now().date()), datatype=XSD.date)),
-    ("2006-09", Literal("2006-09", datatype=XSD.gYearMonth))
+    ("2006-09", Literal("2006-09", datatype=XSD.gYearMonth)),
+    ("2006-09-15", Literal("2006-09-15", datatype=XSD.date)),
+    ("2006-09-15T10:20:30Z", Literal("2006-09-15T10:20:30+00:00", datatype=XSD.dateTime))
 ])
 def test_time_literal(date_input, output):
     class myModel(RDFModel):
@@ -72,3 +76,75 @@ def test_time_serialization(issued, expected_date):
     actual = dataset.to_graph(URIRef("http://example.com/1"))
     expected = Graph().parse(data=expected, format="ttl")
     assert to_isomorphic(actual) == to_isomorphic(expected)
+
+
+def test_serialization_plan():
+    plan = DCATDataset.serialization_plan()
+    assert plan is DCATDataset.serialization_plan()
+    assert plan.rdf_type == URIRef("http://www.w3.org/ns/dcat#Dataset")
+    fields = {field_plan.name: field_plan for field_plan in plan.fields}
+    assert fields["release_date"].predicate == URIRef("http://purl.org/dc/terms/issued")
+    assert fields["theme"].kind == "value"
+    assert fields["temporal_coverage"].kind == "nested"
+    assert fields["keyword"].kind == "literal_field"
+    assert fields["title"].kind == "mixed"
+    assert fields["theme"].converter("http://example.com/theme") == URIRef("http://example.com/theme")
+
+
+def test_serialization_plan_is_per_class():
+    class ParentModel(RDFModel):
+        model_config = ConfigDict(json_schema_extra={"$IRI": URIRef("http://example.com/Parent")})
+        name: str = Field(json_schema_extra={"rdf_term": URIRef("http://example.com/name"), "rdf_type": "literal"})
+
+    class ChildModel(ParentModel):
+        model_config = ConfigDict(json_schema_extra={"$IRI": URIRef("http://example.com/Child")})
+        size: int = Field(json_schema_extra={"rdf_term": URIRef("http://example.com/size"),
+                                             "rdf_type": "xsd:integer"})
+
+    assert ParentModel.serialization_plan().rdf_type == URIRef("http://example.com/Parent")
+    assert ChildModel.serialization_plan().rdf_type == URIRef("http://example.com/Child")
+    assert [x.name for x in ChildModel.serialization_plan().fields] == ["name", "size"]
+
+
+def test_serialization_plan_unknown_rdf_type():
+    class BrokenModel(RDFModel):
+        model_config = ConfigDict(json_schema_extra={"$IRI": URIRef("http://example.com/Broken")})
+        name: str = Field(default=None,
+                          json_schema_extra={"rdf_term": URIRef("http://example.com/name"), "rdf_type": "unknown"})
+
+    assert BrokenModel.serialization_plan()
+    assert BrokenModel().to_graph(URIRef("http://example.com/1"))
+    with pytest.raises(RDFModelError):
+        BrokenModel(name="broken").to_graph(URIRef("http://example.com/1"))
+
+
+def test_validate_many():
+    existing = DCATDataset(title=["Existing"], description=["Already validated"])
+    records = [{"title": ["First"], "description": ["Valid"]},
+               {"title": ["Second"]},
+               {"title": ["Third"], "description": ["Valid"], "release_date": "not a date", "extra": 1},
+               existing]
+    result = validate_many(DCATDataset, records)
+    assert result.indexes == [0, 3]
+    assert result.models[0].title[0].value == "First"
+    assert result.models[1] is existing
+    assert result.errors[1] == [{"type": "missing", "loc": ("description",), "msg": "Field required"}]
+    assert sorted(x["loc"][0] for x in result.errors[2]) == ["extra", "release_date"]
+    assert all("input" not in x for x in result.errors[2])
+    assert DCATDataset.list_adapter() is DCATDataset.list_adapter()
+    with pytest.raises(ValidationError):
+        validate_many(DCATDataset, records, on_error="raise")
+    with pytest.raises(ValueError, match="on_error"):
+        validate_many(DCATDataset, records, on_error="skip")
+
+
+def test_validate_many_hri_distribution():
+    distribution = {"access_url": "https://example.com/download", "byte_size": 10,
+                    "license": "https://creativecommons.org/licenses/by/4.0/", "rights": "https://example.com/rights",
+                    "format": "http://publications.europa.eu/resource/authority/file-type/CSV"}
+    records = (dict(distribution, access_url=x) for x in ("https://example.com/1", "no url", "https://example.com/3"))
+    result = validate_many(HRIDistribution, records)
+    assert [str(x.access_url) for x in result.models] == ["https://example.com/1", "https://example.com/3"]
+    assert list(result.errors) == [1]
+    assert result.errors[1][0]["loc"] == ("access_url",)
+    assert validate_many(HRIDistribution, []) == ([], [], {})
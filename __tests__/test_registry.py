@@ -0,0 +1,90 @@
+# Copyright 2024 Stichting Health-RI
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pickle
+import subprocess
+import sys
+from typing import List, Union
+
+from pydantic import ConfigDict, Field
+from rdflib import DCTERMS, Namespace
+
+from sempyro import LiteralField, RDFModel, warmup
+from sempyro.hri_dcat import HRIAgent, HRIDataset
+from sempyro.io import dump_json
+from sempyro.registry import discover_models
+from sempyro.synthetic import CatalogGenerator
+
+EX = Namespace("http://www.example.com/")
+
+
+def make_model():
+    class Document(RDFModel):
+        model_config = ConfigDict(json_schema_extra={"$IRI": EX.Document, "$prefix": "ex", "$namespace": str(EX)})
+        title: List[Union[str, LiteralField]] = Field(json_schema_extra={"rdf_term": DCTERMS.title,
+                                                                         "rdf_type": "rdfs_literal"})
+    return Document
+
+
+def test_models_are_built_on_first_use():
+    model = make_model()
+    assert not model.__pydantic_complete__
+    assert model(title=["Document"]).title == ["Document"]
+    assert model.__pydantic_complete__
+
+
+def test_warmup():
+    model = make_model()
+    assert warmup([model]) is None
+    assert model.__pydantic_complete__
+    assert model.__dict__["_serialization_plan"] is not None
+
+
+def test_warmup_background():
+    model = make_model()
+    thread = warmup([model], background=True)
+    thread.join()
+    assert model.__pydantic_complete__
+
+
+def test_discover_models():
+    models = discover_models()
+    assert HRIDataset in models
+    assert HRIAgent in models
+    assert RDFModel not in models
+    assert all(x.__module__.startswith("sempyro.") for x in models)
+
+
+def dump_in_fresh_process(statement: str, data: bytes) -> str:
+    """Runs a statement binding `model` in a new interpreter, in which no model is built yet, and dumps the model"""
+    code = f"import pickle, sys; data = pickle.loads(sys.stdin.buffer.read()); {statement}; " \
+           f"from sempyro.io import dump_json; print(dump_json(model))"
+    return subprocess.run([sys.executable, "-c", code], input=data, check=True, capture_output=True).stdout.decode()
+
+
+def test_unpickled_model_is_built():
+    catalog = CatalogGenerator(datasets=2, seed=1).catalog()
+    output = dump_in_fresh_process("model = data", pickle.dumps(catalog))
+    assert output.strip() == dump_json(catalog)
+
+
+def test_trusted_model_is_built():
+    catalog = CatalogGenerator(datasets=2, seed=1).catalog()
+    record = catalog.model_dump(exclude_none=True, serialize_as_any=True)
+    statement = "from sempyro.hri_dcat import HRICatalog, HRIDataset, HRIDistribution; " \
+                "from sempyro.healthdcatap import HEALTHDCATAPDataset, HEALTHDCATAPDistribution; " \
+                "model = HRICatalog.construct_trusted(data, nested_models={HEALTHDCATAPDataset: HRIDataset, " \
+                "HEALTHDCATAPDistribution: HRIDistribution})"
+    output = dump_in_fresh_process(statement, pickle.dumps(record))
+    assert output.strip() == dump_json(catalog)
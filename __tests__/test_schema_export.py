@@ -0,0 +1,51 @@
+# Copyright 2024 Stichting Health-RI
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+
+from sempyro.dcat import DCATDataset
+from sempyro.healthdcatap import HEALTHDCATAPDataset
+from sempyro.hri_dcat import HRIAgent
+from sempyro.schema_export import export_schemas, main, model_folder
+
+
+def test_model_folder():
+    assert model_folder(DCATDataset) == "dcat"
+    assert model_folder(HRIAgent) == "hri_dcat"
+    assert model_folder(HEALTHDCATAPDataset) == "health_dcat"
+
+
+def test_export_schemas(tmp_path):
+    result = export_schemas(tmp_path, models=[DCATDataset, HRIAgent], workers=1)
+    assert sorted(x.relative_to(tmp_path).as_posix() for x in result.written) == [
+        "dcat/DCATDataset.json", "dcat/DCATDataset.yaml", "hri_dcat/HRIAgent.json", "hri_dcat/HRIAgent.yaml"]
+    assert result.unchanged == []
+    schema = json.loads((tmp_path / "dcat" / "DCATDataset.json").read_text())
+    assert schema == json.loads(DCATDataset.schema_to_string("json"))
+    assert (tmp_path / "dcat" / "DCATDataset.yaml").read_text() == DCATDataset.schema_to_string("yaml")
+
+
+def test_export_schemas_skips_unchanged_files(tmp_path):
+    export_schemas(tmp_path, models=[DCATDataset, HRIAgent], workers=2)
+    (tmp_path / "hri_dcat" / "HRIAgent.json").write_text("{}")
+    result = export_schemas(tmp_path, models=[DCATDataset, HRIAgent], workers=2)
+    assert result.written == [tmp_path / "hri_dcat" / "HRIAgent.json"]
+    assert len(result.unchanged) == 3
+
+
+def test_main(tmp_path, capsys):
+    result = main(["--output", str(tmp_path), "--workers", "2"])
+    assert (tmp_path / "health_dcat" / "HEALTHDCATAPDataset.yaml").is_file()
+    assert len(result.written) == len(list(tmp_path.rglob("*.*")))
+    assert f"{len(result.written)} schema files written, 0 unchanged" in capsys.readouterr().out
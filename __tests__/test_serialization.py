@@ -0,0 +1,467 @@
+# Copyright 2024 Stichting Health-RI
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import gzip
+import io
+import json
+import logging
+from datetime import datetime
+from typing import List, Union
+
+import pytest
+from pydantic import ConfigDict, Field
+from rdflib import DCAT, DCTERMS, FOAF, RDF, XSD, BNode, Dataset, Graph, Literal, Namespace, URIRef
+from rdflib.compare import to_isomorphic
+
+from sempyro import (
+    GraphDelta,
+    LiteralField,
+    RDFModel,
+    SerializationSession,
+    serialize_many,
+    write_ntriples_parallel,
+)
+from sempyro.dcat import AccessRights
+from sempyro.foaf import Agent
+from sempyro.geo import Location
+from sempyro.healthdcatap import HEALTHDCATAPDataset, HEALTHDCATAPDistribution
+from sempyro.hri_dcat import (
+    DatasetTheme,
+    HRIAgent,
+    HRICatalog,
+    HRIDataService,
+    HRIDataset,
+    HRIDistribution,
+    HRIVCard,
+)
+from sempyro.synthetic import CatalogGenerator
+from sempyro.time import PeriodOfTime
+from sempyro.vcard import VCARD
+
+EX = Namespace("http://www.example.com/")
+
+
+def make_dataset(number: int = 0) -> HRIDataset:
+    publisher = HRIAgent(name=["Health-RI"],
+                         identifier=["https://health-ri.nl"],
+                         mbox="info@health-ri.nl",
+                         homepage="https://health-ri.nl")
+    distribution = HRIDistribution(title=["CSV"],
+                                   description=["Dataset as CSV \"dump\"\nwith a line break"],
+                                   access_url="https://example.com/download",
+                                   license="https://creativecommons.org/licenses/by/4.0/",
+                                   rights="https://example.com/rights",
+                                   byte_size=10,
+                                   format="http://publications.europa.eu/resource/authority/file-type/CSV")
+    return HRIDataset(access_rights=AccessRights.public,
+                      contact_point=HRIVCard(hasEmail="contact@example.com", formatted_name="Contact point"),
+                      creator=[publisher],
+                      publisher=publisher,
+                      description=["A test dataset"],
+                      title=[f"Dataset {number}"],
+                      identifier=f"dataset-{number}",
+                      keyword=["health", "test"],
+                      theme=[DatasetTheme.heal],
+                      applicable_legislation=["http://data.europa.eu/eli/reg/2025/327/oj"],
+                      health_category=["http://example.com/category/1"],
+                      release_date="2006-09",
+                      modification_date=datetime(2024, 1, 1, 12, 0),
+                      number_of_records=100,
+                      temporal_coverage=[PeriodOfTime(start_date="2020-01-01", end_date="2021-01-01")],
+                      distribution=[distribution])
+
+
+def make_catalog(datasets: int = 10) -> HRICatalog:
+    return HRICatalog(title=["Catalog"],
+                      description=["A test catalog"],
+                      publisher=HRIAgent(name=["Health-RI"], identifier=["https://health-ri.nl"],
+                                         mbox="info@health-ri.nl", homepage="https://health-ri.nl"),
+                      contact_point=HRIVCard(hasEmail="contact@example.com", formatted_name="Contact point"),
+                      dataset=[make_dataset(x) for x in range(datasets)] + ["https://example.com/dataset/external"])
+
+
+def test_iter_triples():
+    dataset = make_dataset()
+    actual = Graph()
+    for triple in dataset.iter_triples(EX.dataset):
+        actual.add(triple)
+    assert to_isomorphic(actual) == to_isomorphic(dataset.to_graph(EX.dataset))
+
+
+def test_iter_quads():
+    dataset = make_dataset()
+    quads = list(dataset.iter_triples(EX.dataset, graph_name=EX.graph))
+    assert quads
+    assert all(len(quad) == 4 and quad[3] == EX.graph for quad in quads)
+
+
+def test_write_ntriples():
+    dataset = make_dataset()
+    output = io.StringIO()
+    count = dataset.write_ntriples(output, EX.dataset)
+    actual = Graph().parse(data=output.getvalue(), format="nt")
+    assert count == len(actual)
+    assert to_isomorphic(actual) == to_isomorphic(dataset.to_graph(EX.dataset))
+
+
+def test_write_nquads_gzip():
+    dataset = make_dataset()
+    buffer = io.BytesIO()
+    with gzip.GzipFile(fileobj=buffer, mode="wb") as gzip_file:
+        dataset.write_ntriples(gzip_file, EX.dataset, graph_name=EX.graph)
+    actual = Dataset()
+    actual.parse(data=gzip.decompress(buffer.getvalue()).decode("utf-8"), format="nquads")
+    assert to_isomorphic(actual.graph(EX.graph)) == to_isomorphic(dataset.to_graph(EX.dataset))
+
+
+def test_to_graph_existing_graph():
+    graph = Graph()
+    graph.bind("ex", EX)
+    first, second = make_dataset(1), make_dataset(2)
+    result = first.to_graph(EX.dataset1, graph=graph)
+    assert result is graph
+    second.to_graph(EX.dataset2, graph=graph)
+    expected = first.to_graph(EX.dataset1) + second.to_graph(EX.dataset2)
+    assert to_isomorphic(graph) == to_isomorphic(expected)
+    assert ("ex", URIRef(EX)) in list(graph.namespaces())
+
+
+def test_serialize_many():
+    datasets = [(EX[f"dataset{number}"], make_dataset(number)) for number in range(3)]
+    actual = serialize_many(datasets)
+    expected = Graph()
+    for subject, dataset in datasets:
+        expected += dataset.to_graph(subject)
+    assert to_isomorphic(actual) == to_isomorphic(expected)
+    target = Graph()
+    assert serialize_many(datasets, graph=target) is target
+
+
+class BindCountingGraph(Graph):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.bind_calls = []
+
+    def bind(self, prefix, namespace, *args, **kwargs):
+        self.bind_calls.append((prefix, str(namespace)))
+        return super().bind(prefix, namespace, *args, **kwargs)
+
+
+def test_session_binds_namespaces_once():
+    graph = BindCountingGraph()
+    datasets = [(EX[f"dataset{number}"], make_dataset(number)) for number in range(3)]
+    serialize_many(datasets, graph=graph)
+    assert graph.bind_calls
+    assert len(graph.bind_calls) == len(set(graph.bind_calls))
+    assert ("v", "http://www.w3.org/2006/vcard/ns#") in graph.bind_calls
+
+
+def test_session_graph_mismatch():
+    session = SerializationSession(Graph())
+    with pytest.raises(ValueError):
+        make_dataset().to_graph(EX.dataset, graph=Graph(), session=session)
+
+
+def test_content_ids_are_deterministic():
+    dataset = make_dataset()
+    outputs = []
+    for _ in range(2):
+        output = io.StringIO()
+        dataset.write_ntriples(output, EX.dataset, session=SerializationSession(content_ids=True))
+        outputs.append(output.getvalue())
+    assert outputs[0] == outputs[1]
+    actual = Graph().parse(data=outputs[0], format="nt")
+    expected = dataset.to_graph(EX.dataset, session=SerializationSession(content_ids=True))
+    assert to_isomorphic(actual) == to_isomorphic(expected)
+
+
+def test_deduplicate_nested_nodes():
+    datasets = [(EX[f"dataset{number}"], make_dataset(number)) for number in range(3)]
+    session = SerializationSession(deduplicate=True)
+    graph = serialize_many(datasets, session=session)
+    # publisher and creator of every dataset are the same agent
+    assert len(set(graph.subjects(RDF.type, FOAF.Agent))) == 1
+    assert len(set(graph.subjects(RDF.type, VCARD.Kind))) == 1
+    assert len(set(graph.objects(None, DCTERMS.publisher))) == 1
+    output = io.StringIO()
+    for subject, dataset in datasets:
+        dataset.write_ntriples(output, subject, session=SerializationSession(deduplicate=True))
+    assert len(output.getvalue().splitlines()) > len(graph)
+
+
+def test_skolem_node_ids():
+    base = "https://example.com/.well-known/genid/"
+    graph = make_dataset().to_graph(EX.dataset, session=SerializationSession(skolem_base=base))
+    publisher = graph.value(EX.dataset, DCTERMS.publisher)
+    assert isinstance(publisher, URIRef)
+    assert publisher.startswith(base)
+    assert not any(isinstance(term, BNode) for triple in graph for term in triple)
+
+
+def test_from_graph_round_trip():
+    graph = make_dataset().to_graph(EX.dataset)
+    parsed = HRIDataset.from_graph(graph, EX.dataset, nested_models={HEALTHDCATAPDistribution: HRIDistribution})
+    assert isinstance(parsed.distribution[0], HRIDistribution)
+    assert isinstance(parsed.publisher, HRIAgent)
+    assert to_isomorphic(parsed.to_graph(EX.dataset)) == to_isomorphic(graph)
+
+
+def test_from_graph_ignores_unknown_predicates():
+    graph = make_dataset().to_graph(EX.dataset)
+    graph.add((EX.dataset, EX.unknownPredicate, Literal("ignored")))
+    parsed = HRIDataset.from_graph(graph, EX.dataset, nested_models={HEALTHDCATAPDistribution: HRIDistribution})
+    assert (EX.dataset, EX.unknownPredicate, None) not in parsed.to_graph(EX.dataset)
+
+
+def test_from_graph_language_literal():
+    graph = Graph()
+    graph.add((EX.agent, RDF.type, FOAF.Agent))
+    graph.add((EX.agent, FOAF.name, Literal("Gezondheid", lang="nl")))
+    graph.add((EX.agent, DCTERMS.identifier, Literal("agent-1")))
+    parsed = Agent.from_graph(graph, EX.agent)
+    assert parsed.name == [LiteralField(value="Gezondheid", language="nl")]
+    assert parsed.identifier == "agent-1"
+
+
+def test_from_graph_shared_predicate(caplog):
+    assert HRIDataService.shared_predicates()[DCTERMS.conformsTo] == ("conforms_to", "application_profile")
+    service = CatalogGenerator().service(0)
+    service.application_profile = ["https://example.com/profile"]
+    graph = service.to_graph(EX.service)
+    with caplog.at_level(logging.WARNING):
+        parsed = HRIDataService.from_graph(graph, EX.service)
+    # both fields are serialized as dct:conformsTo, values are read back into the first one
+    assert str(parsed.conforms_to) == "https://example.com/profile"
+    assert parsed.application_profile is None
+    assert "is shared by fields conforms_to, application_profile of HRIDataService" in caplog.text
+    assert to_isomorphic(parsed.to_graph(EX.service)) == to_isomorphic(graph)
+
+
+@pytest.mark.parametrize("workers,chunk_size", [(1, None), (2, None), (3, 2)])
+def test_write_ntriples_parallel(workers, chunk_size):
+    catalog = make_catalog()
+    serial = io.StringIO()
+    serial_count = catalog.write_ntriples(serial, EX.catalog, session=SerializationSession(content_ids=True))
+    parallel = io.BytesIO()
+    count = write_ntriples_parallel(parallel, catalog, EX.catalog, workers=workers, chunk_size=chunk_size)
+    assert count == serial_count
+    assert parallel.getvalue() == serial.getvalue().encode("utf-8")
+
+
+def test_write_nquads_parallel():
+    catalog = make_catalog(3)
+    serial = io.StringIO()
+    catalog.write_ntriples(serial, EX.catalog, graph_name=EX.graph, session=SerializationSession(content_ids=True))
+    parallel = io.StringIO()
+    write_ntriples_parallel(parallel, catalog, EX.catalog, graph_name=EX.graph, workers=2, chunk_size=1)
+    assert parallel.getvalue() == serial.getvalue()
+
+
+def test_write_ntriples_parallel_unknown_field():
+    with pytest.raises(ValueError):
+        write_ntriples_parallel(io.StringIO(), make_catalog(1), EX.catalog, shard_field="datasets")
+
+
+def test_to_jsonld_matches_graph():
+    catalog = make_catalog(2)
+    document = catalog.to_jsonld(EX.catalog)
+    assert document["@context"] is HRICatalog.jsonld_context()
+    assert document["@id"] == str(EX.catalog)
+    assert document["@type"] == "dcat:Catalog"
+    graph = Graph().parse(data=json.dumps(document), format="json-ld")
+    assert to_isomorphic(graph) == to_isomorphic(catalog.to_graph(EX.catalog))
+
+
+def test_to_jsonld_literals():
+    agent = Agent(name=[LiteralField(value="Gezondheid", language="nl"), "Health"], identifier="agent-1")
+    document = agent.to_jsonld()
+    assert "@id" not in document
+    assert document["name"] == [{"@value": "Gezondheid", "@language": "nl"}, "Health"]
+    assert document["identifier"] == "agent-1"
+    assert Agent.jsonld_context()["name"] == {"@id": str(FOAF.name), "@container": "@set"}
+
+
+def test_graph_delta_first_call_is_full_description():
+    dataset = make_dataset()
+    delta = dataset.graph_delta(EX.dataset)
+    assert delta.removed == []
+    expected = dataset.to_graph(EX.dataset, session=SerializationSession(content_ids=True))
+    assert to_isomorphic(delta.apply(Graph())) == to_isomorphic(expected)
+    assert dataset.graph_delta(EX.dataset) == GraphDelta(removed=[], added=[])
+    assert dataset == make_dataset()
+
+
+def test_graph_delta_changed_field():
+    dataset = make_dataset()
+    dataset.graph_delta(EX.dataset)
+    dataset.modification_date = datetime(2025, 1, 1)
+    delta = dataset.graph_delta(EX.dataset)
+    assert [x[1] for x in delta.removed] == [DCTERMS.modified]
+    assert [x[1] for x in delta.added] == [DCTERMS.modified]
+    assert delta.added[0][2] == Literal("2025-01-01T00:00:00", datatype=XSD.dateTime)
+
+
+def test_graph_delta_nested_and_in_place_changes():
+    dataset = make_dataset()
+    graph = dataset.graph_delta(EX.dataset).apply(Graph())
+    dataset.distribution[0].title = ["New title"]
+    dataset.keyword.append("updated")
+    dataset.mark_changed("keyword")
+    delta = dataset.graph_delta(EX.dataset)
+    assert (EX.dataset, DCAT.keyword, Literal("updated")) in delta.added
+    assert all(x[1] not in (DCTERMS.publisher, DCTERMS.creator) for x in delta.added + delta.removed)
+    expected = dataset.to_graph(EX.dataset, session=SerializationSession(content_ids=True))
+    assert to_isomorphic(delta.apply(graph)) == to_isomorphic(expected)
+
+
+def test_graph_delta_shared_nested_model():
+    dataset = make_dataset()
+    other = make_dataset(1)
+    other.publisher = dataset.publisher
+    assert dataset.creator[0] is dataset.publisher
+    graph = dataset.graph_delta(EX.dataset).apply(Graph())
+    other_graph = other.graph_delta(EX.other).apply(Graph())
+    dataset.publisher.name = ["Health-RI foundation"]
+    delta = dataset.graph_delta(EX.dataset)
+    assert {x[1] for x in delta.added if x[0] == EX.dataset} == {DCTERMS.publisher, DCTERMS.creator}
+    expected = dataset.to_graph(EX.dataset, session=SerializationSession(content_ids=True))
+    assert to_isomorphic(delta.apply(graph)) == to_isomorphic(expected)
+    # the change is not consumed by the first baseline
+    other_delta = other.graph_delta(EX.other)
+    assert (EX.other, DCTERMS.publisher, None) in other_delta.apply(Graph())
+    expected = other.to_graph(EX.other, session=SerializationSession(content_ids=True))
+    assert to_isomorphic(other_delta.apply(other_graph)) == to_isomorphic(expected)
+    assert dataset.graph_delta(EX.dataset) == GraphDelta(removed=[], added=[])
+
+
+def test_construct_trusted_matches_validated():
+    catalog = make_catalog(2)
+    record = catalog.model_dump(exclude_none=True, serialize_as_any=True)
+    trusted = HRICatalog.construct_trusted(record, nested_models={HEALTHDCATAPDataset: HRIDataset,
+                                                                  HEALTHDCATAPDistribution: HRIDistribution})
+    assert isinstance(trusted.dataset[0], HRIDataset)
+    assert isinstance(trusted.dataset[0].distribution[0], HRIDistribution)
+    assert trusted == catalog
+    assert trusted.model_dump_json(exclude_none=True, serialize_as_any=True) == \
+        catalog.model_dump_json(exclude_none=True, serialize_as_any=True)
+    serial = io.StringIO()
+    catalog.write_ntriples(serial, EX.catalog, session=SerializationSession(content_ids=True))
+    trusted_serial = io.StringIO()
+    trusted.write_ntriples(trusted_serial, EX.catalog, session=SerializationSession(content_ids=True))
+    assert trusted_serial.getvalue() == serial.getvalue()
+
+
+def test_construct_trusted_literal_fields():
+    distribution = HRIDistribution.construct_trusted({"title": ["CSV"],
+                                                      "description": [{"value": "Tabel", "language": "nl"}],
+                                                      "temporal_resolution": {"value": "P1D",
+                                                                              "datatype": "xsd:duration"},
+                                                      "access_url": "https://example.com/download"})
+    assert distribution.title == [LiteralField(value="CSV")]
+    assert distribution.description == [LiteralField(value="Tabel", language="nl")]
+    assert distribution.temporal_resolution.datatype == XSD.duration
+    graph = distribution.to_graph(EX.distribution)
+    assert (EX.distribution, DCAT.accessURL, URIRef("https://example.com/download")) in graph
+
+
+def test_construct_trusted_defaults_and_literal_dicts():
+    location = Location(geometry="POINT(4.7 50.9)", centroid="POINT(4.7 50.9)")
+    trusted = Location.construct_trusted(location.model_dump())
+    assert trusted == location
+    assert isinstance(trusted.geometry, LiteralField)
+    first, second = (Event.construct_trusted({"note": "Event", "date": "2024-05"}) for _ in range(2))
+    assert first.tags == [] and first.tags is not second.tags
+    assert first.model_fields_set == {"note", "date"}
+    assert first == Event(note="Event", date="2024-05")
+    assert list(first.__dict__) == list(Event.model_fields)
+    assert "note" not in Event.construct_trusted({"date": "2024-05"}).__dict__
+
+
+def test_profile_report():
+    catalog = make_catalog(datasets=3)
+    session = SerializationSession(content_ids=True, profile=True)
+    graph = catalog.to_graph(EX.catalog, session=session)
+    assert to_isomorphic(graph) == to_isomorphic(catalog.to_graph(EX.catalog,
+                                                                  session=SerializationSession(content_ids=True)))
+    report = session.profile_report()
+    models = {x.model: x for x in report.models}
+    # triples of nested models are included, the rdf:type triple of the catalog is not emitted by a field
+    assert models["HRICatalog"].triples == len(list(catalog.iter_triples(EX.catalog))) - 1
+    assert models["HRICatalog"].calls == 1
+    assert models["HRIDataset"].calls == 3
+    assert models["HRIAgent"].calls == 7
+    fields = {(x.model, x.field): x for x in report.fields}
+    assert fields[("HRIDataset", "keyword")].calls == 3
+    assert fields[("HRIDataset", "keyword")].values == 6
+    assert fields[("HRIDataset", "keyword")].triples == 6
+    assert fields[("HRICatalog", "dataset")].values == 4
+    assert fields[("HRICatalog", "dataset")].self_seconds < fields[("HRICatalog", "dataset")].seconds
+    assert report.namespace_bindings > 0
+    assert "HRIDataset.keyword" in report.format()
+
+
+def test_profile_report_after_error():
+    session = SerializationSession(profile=True)
+    event = Event.model_construct(note="Event", date=5, tags=[])
+    catalog = HRICatalog.model_construct(**{**make_catalog().__dict__, "dataset": [event]})
+    with pytest.raises(TypeError):
+        catalog.to_graph(EX.catalog, session=session)
+    assert session.profiler._nested_seconds == []
+    make_catalog().to_graph(EX.catalog, session=session)
+    fields = {(x.model, x.field): x for x in session.profile_report().fields}
+    assert all(x.self_seconds <= x.seconds for x in fields.values())
+
+
+def test_profile_report_requires_profiling_session():
+    session = SerializationSession()
+    make_dataset().to_graph(EX.dataset, session=session)
+    assert session.profiler is None
+    with pytest.raises(ValueError):
+        session.profile_report()
+
+
+class Event(RDFModel):
+    model_config = ConfigDict(json_schema_extra={"$IRI": EX.Event, "$prefix": "ex", "$namespace": str(EX)})
+    note: str = Field(json_schema_extra={"rdf_term": EX.note})
+    date: Union[str, datetime] = Field(json_schema_extra={"rdf_term": DCTERMS.date, "rdf_type": "datetime_literal"})
+    tags: List[str] = Field(default=[], json_schema_extra={"rdf_term": EX.tag})
+
+
+def test_warnings_summary(caplog):
+    session = SerializationSession()
+    events = [Event(note=f"Event {x}", date="sometime in May", tags=["a", "b"]) for x in range(100)]
+    with caplog.at_level(logging.WARNING):
+        triples = [x for number, event in enumerate(events) for x in event.iter_triples(EX[f"event{number}"],
+                                                                                       session=session)]
+    assert (EX.event0, DCTERMS.date, Literal("sometime in May")) in triples
+    assert (EX.event0, EX.note, Literal("Event 0")) in triples
+    assert len(caplog.records) == 3
+    summary = {(x.model, x.field, x.reason): x for x in session.warnings_summary()}
+    assert {key: x.count for key, x in summary.items()} == {("Event", "note", "missing_rdf_type"): 100,
+                                                            ("Event", "date", "unknown_temporal_format"): 100,
+                                                            ("Event", "tags", "missing_rdf_type"): 200}
+    assert "sometime in May" in summary[("Event", "date", "unknown_temporal_format")].message
+
+
+def test_warnings_summary_valid_dates():
+    session = SerializationSession()
+    triples = list(Event(note="Event", date="2024-05").iter_triples(EX.event, session=session))
+    assert (EX.event, DCTERMS.date, Literal("2024-05", datatype=XSD.gYearMonth)) in triples
+    assert [x.field for x in session.warnings_summary()] == ["note"]
+
+
+def test_to_graph_missing_rdf_type():
+    graph = Event(note="Event", date="2024-05", tags=["a"]).to_graph(EX.event)
+    assert (EX.event, EX.note, Literal("Event")) in graph
+    assert (EX.event, EX.tag, Literal("a")) in graph
@@ -0,0 +1,91 @@
+# Copyright 2024 Stichting Health-RI
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import io
+import json
+
+import pytest
+from rdflib import DCAT, URIRef
+
+from sempyro.hri_dcat import HRICatalog, HRIDataService, HRIDataset, HRIDistribution
+from sempyro.synthetic import CatalogGenerator
+
+
+def test_catalog_structure():
+    generator = CatalogGenerator(datasets=4, distributions=3, services=2, agents=2, seed=1)
+    catalog = generator.catalog()
+    assert isinstance(catalog, HRICatalog)
+    assert len(catalog.dataset) == 4
+    assert all(isinstance(x, HRIDataset) for x in catalog.dataset)
+    assert all(len(x.distribution) == 3 and isinstance(x.distribution[0], HRIDistribution) for x in catalog.dataset)
+    assert all(isinstance(x, HRIDataService) for x in catalog.service)
+    assert {x.publisher.name[0] for x in catalog.dataset} <= {"Organisation 0", "Organisation 1"}
+    graph = catalog.to_graph(URIRef("https://example.org/catalog"))
+    assert len(list(graph.subjects(predicate=DCAT.accessURL))) == 12
+
+
+def test_generator_is_deterministic():
+    first = CatalogGenerator(datasets=3, optional_fields=0.8, seed=7)
+    second = CatalogGenerator(datasets=3, optional_fields=0.8, seed=7)
+    assert first.catalog() == second.catalog()
+    assert first.dataset(2) == second.dataset(2)
+    assert first.dataset(2) != CatalogGenerator(datasets=3, optional_fields=0.8, seed=8).dataset(2)
+
+
+@pytest.mark.parametrize("arguments, message", [
+    ({"agents": 0}, "agents should be 1 or more"),
+    ({"contact_points": 0}, "contact_points should be 1 or more"),
+    ({"datasets": -1}, "datasets should be 0 or more"),
+    ({"distributions": -1}, "distributions should be 0 or more"),
+    ({"services": -1}, "services should be 0 or more"),
+    ({"temporal_coverage": -1}, "temporal_coverage should be 0 or more"),
+    ({"spatial_coverage": -1}, "spatial_coverage should be 0 or more"),
+    ({"optional_fields": 1.5}, "optional_fields should be a probability"),
+    ({"optional_fields": -0.1}, "optional_fields should be a probability"),
+])
+def test_invalid_arguments(arguments, message):
+    with pytest.raises(ValueError, match=message):
+        CatalogGenerator(**arguments)
+
+
+def test_empty_catalog():
+    catalog = CatalogGenerator(datasets=0, distributions=0, services=0, agents=1, contact_points=1).catalog()
+    assert isinstance(catalog, HRICatalog)
+
+
+def test_optional_fields():
+    assert CatalogGenerator(optional_fields=0).dataset(0).landing_page is None
+    datasets = [CatalogGenerator(optional_fields=1, seed=x).dataset(0) for x in range(3)]
+    assert all(x.landing_page and x.status for x in datasets)
+
+
+def test_write_ndjson():
+    generator = CatalogGenerator(datasets=5)
+    output = io.StringIO()
+    assert generator.write_ndjson(output) == 5
+    lines = output.getvalue().splitlines()
+    assert len(lines) == 5
+    assert [json.loads(x)["identifier"] for x in lines] == [f"dataset-{x}" for x in range(5)]
+    assert json.loads(lines[3]) == json.loads(generator.dataset(3).model_dump_json(exclude_none=True,
+                                                                                   serialize_as_any=True))
+
+
+def test_write_json():
+    generator = CatalogGenerator(datasets=3, services=1)
+    output = io.StringIO()
+    generator.write_json(output)
+    document = json.loads(output.getvalue())
+    assert document["title"] == [{"value": "Synthetic catalog"}]
+    assert [x["identifier"] for x in document["dataset"]] == ["dataset-0", "dataset-1", "dataset-2"]
+    assert document["service"][0]["identifier"] == "service-0"
@@ -0,0 +1,68 @@
+# Copyright 2024 Stichting Health-RI
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from pydantic import AnyHttpUrl
+from rdflib import XSD, Literal, URIRef
+
+from sempyro.dcat import AccessRights
+from sempyro.utils.terms import (
+    TERM_CACHE_SIZE,
+    clear_term_cache,
+    literal_term,
+    term_cache_info,
+    uri_term,
+)
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    clear_term_cache()
+    yield
+    clear_term_cache()
+
+
+def test_uri_term_interned():
+    first = uri_term(AnyHttpUrl("https://example.com/licence"))
+    second = uri_term("https://example.com/licence")
+    assert first == URIRef("https://example.com/licence")
+    assert first is second
+    assert uri_term(AccessRights.public) is uri_term(str(AccessRights.public))
+    info = term_cache_info()["uri"]
+    assert (info.hits, info.misses) == (2, 2)
+
+
+def test_literal_term_interned():
+    assert literal_term(100, XSD.nonNegativeInteger) is literal_term(100, XSD.nonNegativeInteger)
+    assert literal_term(1) is not literal_term(True)
+    assert literal_term(True) == Literal(True)
+    assert literal_term("2006-09", XSD.gYearMonth) == Literal("2006-09", datatype=XSD.gYearMonth)
+
+
+def test_literal_term_not_interned_types():
+    utc = literal_term(datetime(2024, 1, 1, 11, tzinfo=timezone.utc), XSD.dateTime)
+    cet = literal_term(datetime(2024, 1, 1, 12, tzinfo=timezone(timedelta(hours=1))), XSD.dateTime)
+    assert str(utc) != str(cet)
+    assert term_cache_info()["literal"].currsize == 0
+
+
+def test_clear_term_cache():
+    uri_term("https://example.com/a")
+    uri_term("https://example.com/b")
+    assert term_cache_info()["uri"].currsize == 2
+    assert term_cache_info()["uri"].maxsize == TERM_CACHE_SIZE
+    clear_term_cache()
+    assert term_cache_info()["uri"].currsize == 0
@@ -307,3 +307,30 @@ def test_time_instant_validation():
         data = {"inXSDDate": "2023-08-08",
                 "inXSDDateTimeStamp": "2023-08-08T15:32:00Z"}
         assert TimeInstant.model_validate_json(json.dumps(data))
+
+
+@pytest.mark.parametrize("model, input_file", [(GeneralDateTimeDescription, "general_date_time_description.json"),
+                                               (DateTimeDescription, "date_time_description.json")])
+def test_date_time_descr_from_graph(model, input_file):
+    with open(Path(TEST_DATA_DIRECTORY, input_file)) as test_data_file:
+        obj = model.model_validate_json(test_data_file.read())
+    parsed = model.from_graph(obj.to_graph(EX.description), EX.description)
+    assert parsed == obj
+
+
+def test_time_instant_from_graph():
+    obj = TimeInstant(inDateTime=DateTimeDescription(year="2001", month="--05", dayOfWeek=DayOfWeek.Monday,
+                                                     unitType=TIME.unitDay))
+    graph = obj.to_graph(EX.instant)
+    parsed = TimeInstant.from_graph(graph, EX.instant,
+                                    nested_models={GeneralDateTimeDescription: DateTimeDescription})
+    assert parsed == obj
+    assert to_isomorphic(parsed.to_graph(EX.instant)) == to_isomorphic(graph)
+
+
+@pytest.mark.parametrize("obj", [PeriodOfTime(start_date="2001-05-07", end_date="2001-06"),
+                                 PeriodOfTime(beginning=TimeInstant(inXSDDateTimeStamp="2001-05-07T08:20:00Z"),
+                                              end=TimeInstant(inXSDgYear="2002"))])
+def test_period_of_time_from_graph(obj):
+    graph = obj.to_graph(EX.period)
+    assert to_isomorphic(PeriodOfTime.from_graph(graph, EX.period).to_graph(EX.period)) == to_isomorphic(graph)
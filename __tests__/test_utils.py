@@ -1,8 +1,22 @@
+from datetime import date, datetime, timedelta, timezone
+
 import pytest
-from pydantic import AnyUrl
+from pydantic import AnyUrl, ValidationError
 from pydantic_core import PydanticCustomError
+from rdflib import XSD
 
-from sempyro.utils.validator_functions import convert_to_mailto, validate_convert_email
+from sempyro.dcat import AccessRights, DCATDataset, Frequency
+from sempyro.hri_dcat import DatasetTheme, GeonovumLicences, HRIDataService
+from sempyro.time import DayOfWeek
+from sempyro.utils.temporal import classify_temporal, parse_temporal
+from sempyro.utils.validator_functions import (
+    EMAIL_CACHE_SIZE,
+    convert_to_mailto,
+    date_handler,
+    email_cache_clear,
+    email_cache_info,
+    validate_convert_email,
+)
 
 @pytest.mark.parametrize("email", ["mailto:exampleemail@domain.com",
                                    "mailto://exampleemail@domain.com",
@@ -23,3 +37,101 @@ def test_convert_to_mailto(email):
 def test_email_validation(email):
     with pytest.raises(PydanticCustomError):
         _ = validate_convert_email(email)
+
+
+def test_email_cache():
+    email_cache_clear()
+    first = validate_convert_email(["info@health-ri.nl", "mailto:info@health-ri.nl"])
+    assert first == [AnyUrl("mailto:info@health-ri.nl")] * 2
+    assert convert_to_mailto("info@health-ri.nl") is first[0]
+    info = email_cache_info()
+    assert (info.hits, info.misses, info.maxsize) == (1, 2, EMAIL_CACHE_SIZE)
+    with pytest.raises(PydanticCustomError):
+        convert_to_mailto("not-an-email")
+    assert email_cache_info().currsize == 2
+    email_cache_clear()
+    assert email_cache_info().currsize == 0
+
+
+@pytest.mark.parametrize("value,expected", [("1992", XSD.gYear),
+                                            ("1992Z", XSD.gYear),
+                                            ("2006-09", XSD.gYearMonth),
+                                            ("2006-09+01:00", XSD.gYearMonth),
+                                            ("2006-09-15", XSD.date),
+                                            ("2006-09-15T10:20:30", XSD.dateTime),
+                                            ("2006-09-15T10:20:30.5Z", XSD.dateTimeStamp),
+                                            ("2006-09-15T10:20:30-05:00", XSD.dateTimeStamp),
+                                            ("2006-13", None),
+                                            ("2006-09-15T25:00:00", None),
+                                            ("November 9, 1999", None)])
+def test_classify_temporal(value, expected):
+    assert classify_temporal(value) == expected
+
+
+@pytest.mark.parametrize("value,expected", [("1992", "1992"),
+                                            ("2006-09", "2006-09"),
+                                            ("2006-09-15", date(2006, 9, 15)),
+                                            ("2006-09-15T10:20:30", datetime(2006, 9, 15, 10, 20, 30)),
+                                            ("2006-09-15T10:20:30Z", datetime(2006, 9, 15, 10, 20, 30,
+                                                                              tzinfo=timezone.utc)),
+                                            ("2006-09-15T10:20:30+02:00",
+                                             datetime(2006, 9, 15, 10, 20, 30, tzinfo=timezone(timedelta(hours=2)))),
+                                            ("2006-09-15Z", date(2006, 9, 15)),
+                                            ("2006-09-15+02:00", date(2006, 9, 15)),
+                                            ("2006-09-15-05:00", date(2006, 9, 15)),
+                                            ("2006-09-15T24:00:00", datetime(2006, 9, 16)),
+                                            ("2006-12-31T24:00:00Z", datetime(2007, 1, 1, tzinfo=timezone.utc)),
+                                            ("November 9, 1999", datetime(1999, 11, 9)),
+                                            ("25-05-1998", datetime(1998, 5, 25))])
+def test_parse_temporal(value, expected):
+    assert parse_temporal(value) == expected
+    assert date_handler(value) == expected
+
+
+@pytest.mark.parametrize("value", ["not a date", "2006-02-30", "2006-02-30Z"])
+def test_parse_temporal_invalid(value):
+    with pytest.raises(ValueError):
+        parse_temporal(value)
+
+
+def test_release_date_with_time_zone():
+    dataset = DCATDataset(title=["Dataset"], description=["A dataset"], release_date="2006-09-15+02:00",
+                          modification_date="2006-09-15T24:00:00")
+    assert dataset.release_date == date(2006, 9, 15)
+    assert dataset.modification_date == datetime(2006, 9, 16)
+
+
+@pytest.mark.parametrize("value", ["http://publications.europa.eu/resource/authority/data-theme/HEAL",
+                                   "HEAL", "heal", " Heal ", "data-theme:HEAL", DatasetTheme.heal])
+def test_vocabulary_lookup(value):
+    assert DatasetTheme.lookup(value) is DatasetTheme.heal
+    assert DatasetTheme(value) is DatasetTheme.heal
+
+
+def test_vocabulary_lookup_prefixes():
+    assert Frequency("freq:annual") is Frequency.annual
+    assert DayOfWeek("time:monday") is DayOfWeek.Monday
+    assert AccessRights("NON_PUBLIC") is AccessRights.non_public
+    assert AccessRights.aliases() is AccessRights.aliases()
+
+
+def test_vocabulary_unknown_value():
+    with pytest.raises(ValueError, match="did you mean heal"):
+        DatasetTheme.lookup("heath")
+    with pytest.raises(ValueError, match="not a value of DatasetTheme$"):
+        DatasetTheme.lookup("xyz")
+    with pytest.raises(ValueError):
+        DatasetTheme("heath")
+
+
+def test_vocabulary_validation():
+    record = {"access_rights": "public", "theme": ["HEAL", "data-theme:ECON"], "license": "cc0", "title": ["Service"],
+              "description": ["A service"], "identifier": "service", "contact_point": "https://example.com/contact",
+              "publisher": "https://example.com/publisher", "endpoint_url": "https://example.com/api",
+              "endpoint_description": "https://example.com/docs"}
+    service = HRIDataService.model_validate(record)
+    assert service.access_rights == AccessRights.public.value
+    assert service.theme == [DatasetTheme.heal.value, DatasetTheme.econ.value]
+    assert service.license == GeonovumLicences.cc0.value
+    with pytest.raises(ValidationError, match="did you mean public"):
+        HRIDataService.model_validate({**record, "access_rights": "publik"})
@@ -0,0 +1,73 @@
+# Copyright 2024 Stichting Health-RI
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Compares validated construction of HRIDataset records with `RDFModel.construct_trusted`.
+Run with `python benchmarks/construction.py [--records N] [--repeat N]`
+"""
+
+import argparse
+import timeit
+from typing import Any, Dict
+
+from sempyro.healthdcatap import HEALTHDCATAPDistribution
+from sempyro.hri_dcat import HRIDataset, HRIDistribution
+from sempyro.synthetic import CatalogGenerator
+
+NESTED_MODELS = {HEALTHDCATAPDistribution: HRIDistribution}
+
+
+def make_record(generator: CatalogGenerator, number: int) -> Dict[str, Any]:
+    """Returns a dataset record in the shape it is stored in a metadata database after validation"""
+    return generator.dataset(number).model_dump(exclude_none=True, serialize_as_any=True)
+
+
+def validate_record(record: Dict[str, Any]) -> HRIDataset:
+    """Validates a record, distributions as HRIDistribution like `read_ndjson` with NESTED_MODELS does"""
+    distributions = [HRIDistribution.model_validate(x) if isinstance(x, dict) else x for x in record["distribution"]]
+    return HRIDataset.model_validate({**record, "distribution": distributions})
+
+
+def main():
+    argument_parser = argparse.ArgumentParser(description=__doc__)
+    argument_parser.add_argument("--records", type=int, default=1000)
+    argument_parser.add_argument("--repeat", type=int, default=3)
+    args = argument_parser.parse_args()
+    # agents and contact points are drawn from pools as large as the number of records, so that emails differ
+    generator = CatalogGenerator(datasets=args.records, agents=args.records, contact_points=args.records)
+    records = [make_record(generator, x) for x in range(args.records)]
+
+    def validated():
+        for record in records:
+            validate_record(record)
+
+    def trusted():
+        for record in records:
+            HRIDataset.construct_trusted(record, nested_models=NESTED_MODELS)
+
+    if validate_record(records[0]) != HRIDataset.construct_trusted(records[0], nested_models=NESTED_MODELS):
+        raise AssertionError("Trusted construction differs from validated construction")
+    # warm up class level caches before timing
+    validated()
+    trusted()
+    validated_time = min(timeit.repeat(validated, number=1, repeat=args.repeat))
+    trusted_time = min(timeit.repeat(trusted, number=1, repeat=args.repeat))
+    print(f"{args.records} HRIDataset records, best of {args.repeat}")
+    print(f"validated construction: {validated_time:.3f} s ({args.records / validated_time:,.0f} records/s)")
+    print(f"trusted construction:   {trusted_time:.3f} s ({args.records / trusted_time:,.0f} records/s)")
+    print(f"speedup: {validated_time / trusted_time:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+# Copyright 2024 Stichting Health-RI
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Measures cold import time of sempyro in fresh interpreters, each statement is run in a new process.
+Run with `python benchmarks/import_time.py [--repeat N]`
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+
+STATEMENTS = {
+    "baseline (rdflib + pydantic)": "import rdflib, pydantic",
+    "import sempyro": "import sempyro",
+    "sempyro.RDFModel": "from sempyro import RDFModel",
+    "sempyro.hri_dcat.HRIAgent": "from sempyro.hri_dcat import HRIAgent",
+    "sempyro.hri_dcat.HRIDataset": "from sempyro.hri_dcat import HRIDataset",
+    "all sempyro models": "from sempyro.hri_dcat import *; from sempyro.dcat import *; from sempyro.time import *",
+}
+
+TIMER = "import time; start = time.perf_counter(); {statement}; print(time.perf_counter() - start)"
+
+
+def measure(statement: str, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        output = subprocess.run([sys.executable, "-c", TIMER.format(statement=statement)],
+                                check=True, capture_output=True, text=True).stdout
+        timings.append(float(output))
+    return statistics.median(timings)
+
+
+def main():
+    argument_parser = argparse.ArgumentParser(description=__doc__)
+    argument_parser.add_argument("--repeat", type=int, default=5)
+    args = argument_parser.parse_args()
+    print(f"median of {args.repeat} cold imports")
+    for name, statement in STATEMENTS.items():
+        print(f"{name:<30} {measure(statement, args.repeat) * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,230 @@
+# Copyright 2024 Stichting Health-RI
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Measures throughput (records/s) and peak memory of construction, `model_dump`, `to_graph` and Turtle/N-Triples
+serialization of representative models of each family at several numbers of records. Results can be saved as a
+baseline JSON file and later runs compared against it, the script exits with status 1 on a regression.
+Run with `python benchmarks/suite.py [--sizes 1 1000 100000] [--models HRIDataset ...] [--repeat N]
+[--save-baseline FILE | --baseline FILE [--tolerance 0.2]]`
+"""
+
+import argparse
+import io
+import json
+import sys
+import timeit
+import tracemalloc
+from datetime import datetime
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+
+from rdflib import URIRef
+
+from sempyro import LiteralField, RDFModel, SerializationSession, serialize_many
+from sempyro.dcat import AccessRights, DCATDataset
+from sempyro.geo import Location
+from sempyro.healthdcatap import HEALTHDCATAPDataset, HEALTHDCATAPKind, HEALTHDCATAPPublisher
+from sempyro.hri_dcat import HRICatalog, HRIDataset
+from sempyro.namespaces import GeoSPARQL
+from sempyro.odrl import ODRLPolicy
+from sempyro.synthetic import CatalogGenerator
+from sempyro.time import PeriodOfTime
+
+
+class Result(NamedTuple):
+    """Measurement of one operation of one model at one number of records"""
+    records_per_second: float
+    peak_memory: int
+
+
+def make_dcat_dataset(number: int) -> DCATDataset:
+    return DCATDataset(title=[f"Dataset {number}"],
+                       description=[LiteralField(value="Een testdataset", language="nl"), "A test dataset"],
+                       identifier=[f"dataset-{number}"],
+                       keyword=["health", "test"],
+                       landing_page=[f"https://example.com/dataset/{number}"],
+                       release_date="2006-09",
+                       modification_date=datetime(2024, 1, 1, 12, 0))
+
+
+def make_healthdcatap_dataset(number: int) -> HEALTHDCATAPDataset:
+    contact_point = HEALTHDCATAPKind(hasEmail="mailto:contact@example.com", formatted_name=["Contact point"])
+    return HEALTHDCATAPDataset(access_rights=AccessRights.public,
+                               contact_point=[contact_point],
+                               publisher=[HEALTHDCATAPPublisher(name=["Health-RI"], identifier="https://health-ri.nl",
+                                                                contact_point=contact_point)],
+                               title=[f"Dataset {number}"],
+                               description=["A test dataset"],
+                               identifier=[f"dataset-{number}"],
+                               distribution=[f"https://example.com/distribution/{number}"],
+                               applicable_legislation=["http://data.europa.eu/eli/reg/2025/327/oj"],
+                               health_category=["http://example.com/category/1"],
+                               number_of_records=100)
+
+
+# HRI models are built by the synthetic catalog generator, the pools of agents and contact points are kept between runs
+HRI_GENERATOR = CatalogGenerator(agents=100, contact_points=100)
+
+
+def make_hri_dataset(number: int) -> HRIDataset:
+    return HRI_GENERATOR.dataset(number)
+
+
+def make_hri_catalog(number: int) -> HRICatalog:
+    return CatalogGenerator(datasets=1, services=0, agents=100, contact_points=100, seed=number).catalog()
+
+
+def make_period_of_time(number: int) -> PeriodOfTime:
+    return PeriodOfTime(start_date=f"{2000 + number % 20}-01-01", end_date="2024-01-01")
+
+
+def make_location(number: int) -> Location:
+    return Location(geometry=LiteralField(value=f"POINT({4 + number % 10 / 10} 52.37)",
+                                          datatype=GeoSPARQL.wktLiteral),
+                    bounding_box=LiteralField(value="POLYGON((3.3 50.7, 7.2 50.7, 7.2 53.5, 3.3 53.5, 3.3 50.7))",
+                                              datatype=GeoSPARQL.wktLiteral))
+
+
+def make_odrl_policy(number: int) -> ODRLPolicy:
+    return ODRLPolicy(uid=[f"https://example.com/policy/{number}"],
+                      permission=["https://example.com/permission/use"],
+                      target=[f"https://example.com/dataset/{number}"],
+                      action=["http://www.w3.org/ns/odrl/2/use"],
+                      assigner=["https://health-ri.nl"])
+
+
+FACTORIES: Dict[str, Callable[[int], RDFModel]] = {
+    "DCATDataset": make_dcat_dataset,
+    "HEALTHDCATAPDataset": make_healthdcatap_dataset,
+    "HRIDataset": make_hri_dataset,
+    "HRICatalog": make_hri_catalog,
+    "PeriodOfTime": make_period_of_time,
+    "Location": make_location,
+    "ODRLPolicy": make_odrl_policy,
+}
+
+
+def _subject(number: int) -> URIRef:
+    return URIRef(f"https://example.com/resource/{number}")
+
+
+def make_operations(factory: Callable[[int], RDFModel], records: int) -> Dict[str, Callable[[], Any]]:
+    """Returns the benchmarked operations over `records` models, models and graphs are built once up front"""
+    models = [factory(x) for x in range(records)]
+    graph = serialize_many((_subject(x), model) for x, model in enumerate(models))
+
+    def construct():
+        return [factory(x) for x in range(records)]
+
+    def model_dump():
+        return [x.model_dump(exclude_none=True, serialize_as_any=True) for x in models]
+
+    def to_graph():
+        return serialize_many((_subject(x), model) for x, model in enumerate(models))
+
+    def turtle():
+        return graph.serialize(format="turtle")
+
+    def ntriples():
+        session = SerializationSession()
+        output = io.StringIO()
+        for number, model in enumerate(models):
+            model.write_ntriples(output, _subject(number), session=session)
+        return output
+
+    return {"construct": construct, "model_dump": model_dump, "to_graph": to_graph, "turtle": turtle,
+            "ntriples": ntriples}
+
+
+def measure(operation: Callable[[], Any], records: int, repeat: int) -> Result:
+    """Times an operation (best of `repeat` runs) and measures its peak memory in a separate traced run"""
+    operation()
+    best_time = min(timeit.repeat(operation, number=1, repeat=repeat))
+    tracemalloc.start()
+    try:
+        operation()
+        _, peak_memory = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return Result(records_per_second=records / best_time, peak_memory=peak_memory)
+
+
+def run(models: List[str], sizes: List[int], repeat: int) -> Dict[str, Result]:
+    """
+    Runs the benchmarks
+    :param models: names of models in FACTORIES
+    :param sizes: numbers of records
+    :param repeat: number of timed runs of each operation, the best one is reported
+    :return: results keyed by "<model>/<records>/<operation>"
+    """
+    results = {}
+    for model in models:
+        for records in sizes:
+            for operation_name, operation in make_operations(FACTORIES[model], records).items():
+                key = f"{model}/{records}/{operation_name}"
+                results[key] = measure(operation, records, repeat)
+                print(f"{key:<40} {results[key].records_per_second:14,.0f} records/s "
+                      f"{results[key].peak_memory / 2 ** 20:10.2f} MiB peak")
+    return results
+
+
+def compare(results: Dict[str, Result], baseline: Dict[str, Dict[str, float]], tolerance: float) -> List[str]:
+    """
+    Compares results against a baseline
+    :param results: results of the current run
+    :param baseline: results of a previous run as saved by --save-baseline
+    :param tolerance: relative slowdown or memory increase tolerated, e.g. 0.2 for 20%
+    :return: descriptions of regressions
+    """
+    regressions = []
+    for key, result in results.items():
+        if key not in baseline:
+            continue
+        expected = Result(**baseline[key])
+        if result.records_per_second < expected.records_per_second * (1 - tolerance):
+            regressions.append(f"{key}: {result.records_per_second:,.0f} records/s, "
+                               f"baseline {expected.records_per_second:,.0f} records/s")
+        if result.peak_memory > expected.peak_memory * (1 + tolerance):
+            regressions.append(f"{key}: {result.peak_memory:,} bytes peak memory, "
+                               f"baseline {expected.peak_memory:,} bytes")
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    argument_parser = argparse.ArgumentParser(description=__doc__)
+    argument_parser.add_argument("--sizes", type=int, nargs="+", default=[1, 1000],
+                                 help="numbers of records, e.g. '1 1000 100000' for the full run")
+    argument_parser.add_argument("--models", nargs="+", choices=sorted(FACTORIES), default=list(FACTORIES))
+    argument_parser.add_argument("--repeat", type=int, default=3)
+    argument_parser.add_argument("--save-baseline", help="file to save the results to as a baseline")
+    argument_parser.add_argument("--baseline", help="baseline file to compare the results against")
+    argument_parser.add_argument("--tolerance", type=float, default=0.2,
+                                 help="relative regression tolerated when comparing against a baseline")
+    args = argument_parser.parse_args(argv)
+    results = run(args.models, args.sizes, args.repeat)
+    if args.save_baseline:
+        with open(args.save_baseline, "w") as baseline_file:
+            json.dump({key: result._asdict() for key, result in results.items()}, baseline_file, indent=2)
+    if args.baseline:
+        with open(args.baseline) as baseline_file:
+            regressions = compare(results, json.load(baseline_file), args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -12,16 +12,25 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from importlib.metadata import version
+from typing import TYPE_CHECKING
 
-from .rdf_model import LiteralField, RDFModel
-from .utils import validator_functions
+from sempyro.utils.lazy import lazy_loader
 
-__version__ = version("sempyro")
+if TYPE_CHECKING:
+    from .parallel import write_ntriples_parallel
+    from .rdf_model import GraphDelta, LiteralField, RDFModel, SerializationSession, serialize_many, validate_many
+    from .registry import warmup
+    from .utils import validator_functions
 
 __all__ = (
+    "GraphDelta",
     "LiteralField",
     "RDFModel",
+    "SerializationSession",
+    "serialize_many",
+    "validate_many",
+    "write_ntriples_parallel",
+    "warmup",
     "adms",
     "dcat",
     "dqv",
@@ -39,5 +48,31 @@ __all__ = (
     )
 
 
+_getattr, _ = lazy_loader(__name__,
+                          attributes={
+                              "GraphDelta": ".rdf_model",
+                              "LiteralField": ".rdf_model",
+                              "RDFModel": ".rdf_model",
+                              "SerializationSession": ".rdf_model",
+                              "serialize_many": ".rdf_model",
+                              "validate_many": ".rdf_model",
+                              "write_ntriples_parallel": ".parallel",
+                              "warmup": ".registry",
+                          },
+                          modules={
+                              **{x: f".{x}" for x in ("adms", "dcat", "dqv", "foaf", "geo", "healthdcatap", "hri_dcat",
+                                                      "namespaces", "odrl", "prov", "spdx", "time", "vcard")},
+                              "validator_functions": ".utils.validator_functions",
+                          })
+
+
+def __getattr__(name: str):
+    if name == "__version__":
+        from importlib.metadata import version
+        globals()["__version__"] = version("sempyro")
+        return globals()["__version__"]
+    return _getattr(name)
+
+
 def __dir__() -> "list[str]":
     return list(__all__)
@@ -12,8 +12,17 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from .identifier import Identifier
+from typing import TYPE_CHECKING
+
+from sempyro.utils.lazy import lazy_loader
+
+if TYPE_CHECKING:
+    from .identifier import Identifier
 
 __all__ = (
     "Identifier"
 )
+
+__getattr__, __dir__ = lazy_loader(__name__, {
+    "Identifier": ".identifier",
+})
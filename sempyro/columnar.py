@@ -0,0 +1,217 @@
+# Copyright 2024 Stichting Health-RI
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Columnar pre-validation of bulk input. Columns of a batch destined for URL, email, temporal and non-negative integer
+fields are checked column by column before any model is built, and a per-row mask tells which rows are worth full
+model validation. Checks are derived from the field metadata of a model; pandas DataFrames are checked with vectorized
+string operations, other batches (a mapping of column names to sequences of values, e.g. `pyarrow.Table.to_pydict()`)
+with precompiled patterns evaluated once per distinct value.
+The checks are a cheap filter: a row passing them can still be rejected by model validation, but a row failing them
+would be rejected too.
+"""
+
+import importlib
+import math
+import numbers
+import re
+from enum import Enum
+from typing import Any, Callable, Dict, List, Mapping, NamedTuple, Optional, Sequence, Type
+
+from pydantic import AnyHttpUrl, AnyUrl
+
+from sempyro.rdf_model import DATETIME_LITERAL_TYPE, RDF_TYPE_KEY, RDFModel, _annotation_classes
+from sempyro.utils.temporal import (
+    DATE_RE,
+    DATE_TIME_RE,
+    DATE_TIME_STAMP_RE,
+    YEAR_MONTH_RE,
+    YEAR_RE,
+    classify_temporal,
+    parse_temporal,
+)
+
+URL_CHECK = "url"
+HTTP_URL_CHECK = "http_url"
+EMAIL_CHECK = "email"
+TEMPORAL_CHECK = "temporal"
+NON_NEGATIVE_INTEGER_CHECK = "non_negative_integer"
+
+# Fields normalized to mailto: URLs by `validate_convert_email` validators
+EMAIL_FIELDS = frozenset({"mbox", "hasEmail"})
+
+CHECK_PATTERNS = {
+    URL_CHECK: re.compile(r"\s*[A-Za-z][A-Za-z0-9+.\-]*:.+"),
+    HTTP_URL_CHECK: re.compile(r"(?i)\s*https?://[^\s/?#]+.*"),
+    EMAIL_CHECK: re.compile(r"(mailto:)?[^@\s:]+@[^@\s]+\.[^@\s.]+"),
+    NON_NEGATIVE_INTEGER_CHECK: re.compile(r"\s*\+?[0-9]+\s*"),
+}
+
+# Lexical forms recognised by `classify_temporal`, other strings are left to `parse_temporal`
+TEMPORAL_PATTERN = re.compile("|".join(f"(?:{x.pattern})" for x in (YEAR_RE, YEAR_MONTH_RE, DATE_RE,
+                                                                     DATE_TIME_STAMP_RE, DATE_TIME_RE)))
+
+
+class BatchValidation(NamedTuple):
+    """
+    Outcome of columnar pre-validation of a batch
+    Attributes
+    ----------
+    mask : List[bool]
+        one flag per row, True if the row passed all checks
+    errors : Dict[int, List[Tuple[str, str]]]
+        indexes of failed rows mapped to (column, check) pairs of the failed checks
+    """
+    mask: List[bool]
+    errors: Dict[int, List[tuple]]
+
+    def valid_rows(self) -> List[int]:
+        """Returns the indexes of rows which passed all checks"""
+        return [index for index, valid in enumerate(self.mask) if valid]
+
+
+def field_checks(model: Type[RDFModel]) -> Dict[str, str]:
+    """
+    Derives the columnar checks applicable to the fields of a model from their metadata
+    :param model: model class
+    :return: field names mapped to one of 'url', 'http_url', 'email', 'temporal' or 'non_negative_integer'
+    """
+    checks = {}
+    for field_name, field_info in model.model_fields.items():
+        rdf_type = (field_info.json_schema_extra or {}).get(RDF_TYPE_KEY)
+        classes = [x for x in _annotation_classes(field_info.annotation) if x is not type(None)]
+        if field_name in EMAIL_FIELDS:
+            checks[field_name] = EMAIL_CHECK
+        elif rdf_type == DATETIME_LITERAL_TYPE:
+            checks[field_name] = TEMPORAL_CHECK
+        elif rdf_type == "xsd:nonNegativeInteger":
+            checks[field_name] = NON_NEGATIVE_INTEGER_CHECK
+        elif classes and all(isinstance(x, type) and issubclass(x, (AnyUrl, Enum)) for x in classes):
+            # enums of vocabularies have IRI values, a field allowing only URLs and enums gets IRIs
+            urls = [x for x in classes if issubclass(x, AnyUrl)]
+            if urls:
+                checks[field_name] = HTTP_URL_CHECK if all(issubclass(x, AnyHttpUrl) for x in urls) else URL_CHECK
+    return checks
+
+
+def _is_missing(value: Any) -> bool:
+    return value is None or value == "" or (isinstance(value, float) and math.isnan(value))
+
+
+def _check_temporal(value: str) -> bool:
+    if classify_temporal(value) is not None:
+        return True
+    try:
+        parse_temporal(value)
+    except (ValueError, OverflowError):
+        return False
+    return True
+
+
+def _is_integral(value: numbers.Real) -> bool:
+    if isinstance(value, numbers.Integral):
+        return True
+    try:
+        return float(value).is_integer()
+    except (OverflowError, ValueError):
+        return False
+
+
+def _check_value(check: str, value: Any) -> bool:
+    if isinstance(value, (list, tuple)):
+        return all(_check_value(check, x) for x in value)
+    if _is_missing(value):
+        return True
+    if check == NON_NEGATIVE_INTEGER_CHECK and isinstance(value, numbers.Real):
+        # integral numbers of any type, e.g. 3.0, True or numpy integers, are coerced to int by model validation
+        return _is_integral(value) and value >= 0
+    if not isinstance(value, str):
+        # already typed values (dates, URL objects, models) are left to model validation
+        return check != NON_NEGATIVE_INTEGER_CHECK
+    if check == TEMPORAL_CHECK:
+        return _check_temporal(value)
+    return CHECK_PATTERNS[check].fullmatch(value) is not None
+
+
+def _check_column(check: str, values: Sequence[Any]) -> List[bool]:
+    """Evaluates a check once per distinct value of a column"""
+    results: Dict[Any, bool] = {}
+    column_mask = []
+    for value in values:
+        # keyed by type as well, equal values of different types (3 and 3.0, 1 and True) may check differently
+        key = (list, tuple((type(x), x) for x in value)) if isinstance(value, list) else (type(value), value)
+        try:
+            valid = results.get(key)
+        except TypeError:
+            column_mask.append(_check_value(check, value))
+            continue
+        if valid is None:
+            valid = results[key] = _check_value(check, value)
+        column_mask.append(valid)
+    return column_mask
+
+
+def _pandas() -> Optional[Any]:
+    try:
+        return importlib.import_module("pandas")
+    except ImportError:
+        return None
+
+
+def _check_series(check: str, series: Any) -> List[bool]:
+    """Evaluates a check on a pandas Series with vectorized string operations"""
+    strings = series.map(lambda x: isinstance(x, str))
+    if not strings.all():
+        # mixed columns (lists, numbers, typed values) are checked per distinct value
+        return _check_column(check, series.tolist())
+    if check == TEMPORAL_CHECK:
+        matches = series.str.fullmatch(TEMPORAL_PATTERN.pattern)
+        unmatched = series[~matches]
+        if len(unmatched):
+            checked = dict(zip(unmatched.unique(), _check_column(TEMPORAL_CHECK, list(unmatched.unique()))))
+            matches = matches | series.map(checked).fillna(False).astype(bool)
+        return (matches | (series == "")).tolist()
+    return (series.str.fullmatch(CHECK_PATTERNS[check].pattern) | (series == "")).tolist()
+
+
+def validate_batch(batch: Any,
+                   model: Type[RDFModel],
+                   columns: Optional[Mapping[str, str]] = None) -> BatchValidation:
+    """
+    Checks columns of a batch destined for URL, email, temporal and non-negative integer fields of a model
+    :param batch: pandas DataFrame, or a mapping of column names to sequences of equal length (cells may be lists
+    for list fields)
+    :param model: model class the rows are destined for
+    :param columns: field names mapped to column names, by default columns are named after the fields; columns
+    missing from the batch are not checked
+    :return: BatchValidation
+    """
+    checks = field_checks(model)
+    if columns is None:
+        columns = {x: x for x in checks}
+    pandas = _pandas()
+    is_frame = pandas is not None and isinstance(batch, pandas.DataFrame)
+    check_column: Callable[[str, Any], List[bool]] = _check_series if is_frame else _check_column
+    size = len(batch) if is_frame else len(next(iter(batch.values()), []))
+    mask = [True] * size
+    errors: Dict[int, List[tuple]] = {}
+    for field_name, column in columns.items():
+        check = checks.get(field_name)
+        if check is None or column not in batch:
+            continue
+        for index, valid in enumerate(check_column(check, batch[column])):
+            if not valid:
+                mask[index] = False
+                errors.setdefault(index, []).append((column, check))
+    return BatchValidation(mask=mask, errors=errors)
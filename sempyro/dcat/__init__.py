@@ -12,15 +12,20 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from .dcat_resource import DCATResource, Status, AccessRights
-from .dcat_dataset import DCATDataset, Frequency
-from .dcat_catalog import DCATCatalog
-from .dataset_series import DCATDatasetSeries
-from .data_service import DCATDataService
-from .dcat_distribution import DCATDistribution
-from .dcat_relationship import Relationship
-from .dcat_attribution import Attribution
-from .dcat_catalog_record import DCATCatalogRecord
+from typing import TYPE_CHECKING
+
+from sempyro.utils.lazy import lazy_loader
+
+if TYPE_CHECKING:
+    from .dcat_resource import DCATResource, Status, AccessRights
+    from .dcat_dataset import DCATDataset, Frequency
+    from .dcat_catalog import DCATCatalog
+    from .dataset_series import DCATDatasetSeries
+    from .data_service import DCATDataService
+    from .dcat_distribution import DCATDistribution
+    from .dcat_relationship import Relationship
+    from .dcat_attribution import Attribution
+    from .dcat_catalog_record import DCATCatalogRecord
 
 
 __all__ = (
@@ -39,3 +44,18 @@ __all__ = (
     "AccessRights",
     "Frequency"
 )
+
+__getattr__, __dir__ = lazy_loader(__name__, {
+    "DCATResource": ".dcat_resource",
+    "Status": ".dcat_resource",
+    "AccessRights": ".dcat_resource",
+    "DCATDataset": ".dcat_dataset",
+    "Frequency": ".dcat_dataset",
+    "DCATCatalog": ".dcat_catalog",
+    "DCATDatasetSeries": ".dataset_series",
+    "DCATDataService": ".data_service",
+    "DCATDistribution": ".dcat_distribution",
+    "Relationship": ".dcat_relationship",
+    "Attribution": ".dcat_attribution",
+    "DCATCatalogRecord": ".dcat_catalog_record",
+})
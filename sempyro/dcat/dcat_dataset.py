@@ -12,7 +12,6 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from enum import Enum
 from pathlib import Path
 from typing import List, Union, Optional
 
@@ -24,9 +23,10 @@ from sempyro.dcat import DCATResource
 from sempyro.namespaces import FREQ, DCATv3, DCATAPv3, ADMS
 from sempyro.adms import Identifier
 from sempyro.prov import Activity
+from sempyro.utils.vocabulary import VocabularyEnum
 
 
-class Frequency(Enum):
+class Frequency(VocabularyEnum):
     triennial = FREQ.triennial
     biennial = FREQ.biennial
     annual = FREQ.annual
@@ -14,7 +14,7 @@
 
 from datetime import date, datetime
 from pathlib import Path
-from typing import List, Union
+from typing import ClassVar, List, Set, Union
 
 from pydantic import AnyHttpUrl, AnyUrl, AwareDatetime, ConfigDict, Field, NaiveDatetime, field_validator
 from rdflib.namespace import DCAT, DCTERMS, ODRL2
@@ -206,7 +206,9 @@ class DCATDistribution(RDFModel):
         }
     )
 
-    @field_validator("title", "description", mode="before")
+    _validate_literal_fields: ClassVar[Set[str]] = {"title", "description"}
+
+    @field_validator(*_validate_literal_fields, mode="before")
     @classmethod
     def validate_literal(cls, value: List[Union[str, LiteralField]]) -> List[LiteralField]:
         return convert_to_literal(value)
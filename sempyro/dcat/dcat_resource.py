@@ -15,7 +15,6 @@
 import logging
 from abc import ABCMeta
 from datetime import date, datetime
-from enum import Enum
 from pathlib import Path
 from typing import List, Union, Optional, ClassVar, Set
 
@@ -29,19 +28,20 @@ from sempyro.namespaces import ADMS, ADMSStatus, DCATv3
 from sempyro.odrl import ODRLPolicy
 from sempyro.time import PeriodOfTime
 from sempyro.utils.validator_functions import date_handler, convert_to_literal
+from sempyro.utils.vocabulary import VocabularyEnum
 from sempyro.vcard import VCard
 
 logger = logging.getLogger("__name__")
 
 
-class Status(Enum):
+class Status(VocabularyEnum):
     Completed = ADMSStatus.Completed
     Deprecated = ADMSStatus.Deprecated
     UnderDevelopment = ADMSStatus.UnderDevelopment
     Withdrawn = ADMSStatus.Withdrawn
 
 
-class AccessRights(Enum):
+class AccessRights(VocabularyEnum):
     public = URIRef("http://publications.europa.eu/resource/authority/access-right/PUBLIC")
     restricted = URIRef("http://publications.europa.eu/resource/authority/access-right/RESTRICTED")
     non_public = URIRef("http://publications.europa.eu/resource/authority/access-right/NON_PUBLIC")
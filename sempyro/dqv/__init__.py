@@ -11,8 +11,17 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from .quality_certificate import QualityCertificate
+from typing import TYPE_CHECKING
+
+from sempyro.utils.lazy import lazy_loader
+
+if TYPE_CHECKING:
+    from .quality_certificate import QualityCertificate
 
 __all__ = [
     "QualityCertificate"
 ]
+
+__getattr__, __dir__ = lazy_loader(__name__, {
+    "QualityCertificate": ".quality_certificate",
+})
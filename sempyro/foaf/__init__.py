@@ -12,10 +12,20 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from .agent import Agent
-from .project import Project
+from typing import TYPE_CHECKING
+
+from sempyro.utils.lazy import lazy_loader
+
+if TYPE_CHECKING:
+    from .agent import Agent
+    from .project import Project
 
 __all__ = (
     "Agent",
     "Project"
 )
+
+__getattr__, __dir__ = lazy_loader(__name__, {
+    "Agent": ".agent",
+    "Project": ".project",
+})
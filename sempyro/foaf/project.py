@@ -13,7 +13,7 @@
 # limitations under the License.
 
 from pathlib import Path
-from typing import List, Union
+from typing import ClassVar, List, Set, Union
 
 from pydantic import AnyHttpUrl, ConfigDict, Field, field_validator
 from rdflib.namespace import DCTERMS, FOAF
@@ -72,7 +72,9 @@ class Project(RDFModel):
         }
     )
 
-    @field_validator("title", "description", mode="before")
+    _validate_literal_fields: ClassVar[Set[str]] = {"title", "description"}
+
+    @field_validator(*_validate_literal_fields, mode="before")
     @classmethod
     def convert_to_literal(cls, value: List[Union[str, LiteralField]]) -> List[LiteralField]:
         if not value:
@@ -12,9 +12,19 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from .spatial import Geometry, Location
+from typing import TYPE_CHECKING
+
+from sempyro.utils.lazy import lazy_loader
+
+if TYPE_CHECKING:
+    from .spatial import Geometry, Location
 
 __all__ = (
     "Geometry",
     "Location"
 )
+
+__getattr__, __dir__ = lazy_loader(__name__, {
+    "Geometry": ".spatial",
+    "Location": ".spatial",
+})
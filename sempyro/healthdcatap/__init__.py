@@ -12,15 +12,20 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from .healthdcatap_agent import HEALTHDCATAPAgent
-from .healthdcatap_catalog import HEALTHDCATAPCatalog
-from .healthdcatap_dataset import HEALTHDCATAPDataset
-from .healthdcatap_data_service import HEALTHDCATAPDataService
-from .healthdcatap_dataset_series import HEALTHDCATAPDatasetSeries
-from .healthdcatap_distribution import HEALTHDCATAPDistribution
-from .healthdcatap_kind import HEALTHDCATAPKind
-from .healthdcatap_hdab import HEALTHDCATAPHdab
-from .healthdcatap_publisher import HEALTHDCATAPPublisher
+from typing import TYPE_CHECKING
+
+from sempyro.utils.lazy import lazy_loader
+
+if TYPE_CHECKING:
+    from .healthdcatap_agent import HEALTHDCATAPAgent
+    from .healthdcatap_catalog import HEALTHDCATAPCatalog
+    from .healthdcatap_dataset import HEALTHDCATAPDataset
+    from .healthdcatap_data_service import HEALTHDCATAPDataService
+    from .healthdcatap_dataset_series import HEALTHDCATAPDatasetSeries
+    from .healthdcatap_distribution import HEALTHDCATAPDistribution
+    from .healthdcatap_kind import HEALTHDCATAPKind
+    from .healthdcatap_hdab import HEALTHDCATAPHdab
+    from .healthdcatap_publisher import HEALTHDCATAPPublisher
 
 __all__ = (
     "HEALTHDCATAPAgent",
@@ -33,3 +38,15 @@ __all__ = (
     "HEALTHDCATAPHdab",
     "HEALTHDCATAPPublisher",
 )
+
+__getattr__, __dir__ = lazy_loader(__name__, {
+    "HEALTHDCATAPAgent": ".healthdcatap_agent",
+    "HEALTHDCATAPCatalog": ".healthdcatap_catalog",
+    "HEALTHDCATAPDataset": ".healthdcatap_dataset",
+    "HEALTHDCATAPDataService": ".healthdcatap_data_service",
+    "HEALTHDCATAPDatasetSeries": ".healthdcatap_dataset_series",
+    "HEALTHDCATAPDistribution": ".healthdcatap_distribution",
+    "HEALTHDCATAPKind": ".healthdcatap_kind",
+    "HEALTHDCATAPHdab": ".healthdcatap_hdab",
+    "HEALTHDCATAPPublisher": ".healthdcatap_publisher",
+})
@@ -12,14 +12,19 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from .hri_agent import HRIAgent
-from .hri_catalog import HRICatalog
-from .hri_dataset import HRIDataset
-from .hri_data_service import HRIDataService
-from .hri_dataset_series import HRIDatasetSeries
-from .hri_distribution import HRIDistribution
-from .hri_vcard import HRIVCard
-from .vocabularies import GeonovumLicences, DatasetTheme, DatasetStatus, DistributionStatus
+from typing import TYPE_CHECKING
+
+from sempyro.utils.lazy import lazy_loader
+
+if TYPE_CHECKING:
+    from .hri_agent import HRIAgent
+    from .hri_catalog import HRICatalog
+    from .hri_dataset import HRIDataset
+    from .hri_data_service import HRIDataService
+    from .hri_dataset_series import HRIDatasetSeries
+    from .hri_distribution import HRIDistribution
+    from .hri_vcard import HRIVCard
+    from .vocabularies import GeonovumLicences, DatasetTheme, DatasetStatus, DistributionStatus
 
 __all__ = (
     "HRICatalog",
@@ -35,3 +40,17 @@ __all__ = (
     "DatasetStatus",
     "DistributionStatus"
 )
+
+__getattr__, __dir__ = lazy_loader(__name__, {
+    "HRIAgent": ".hri_agent",
+    "HRICatalog": ".hri_catalog",
+    "HRIDataset": ".hri_dataset",
+    "HRIDataService": ".hri_data_service",
+    "HRIDatasetSeries": ".hri_dataset_series",
+    "HRIDistribution": ".hri_distribution",
+    "HRIVCard": ".hri_vcard",
+    "GeonovumLicences": ".vocabularies",
+    "DatasetTheme": ".vocabularies",
+    "DatasetStatus": ".vocabularies",
+    "DistributionStatus": ".vocabularies",
+})
@@ -12,12 +12,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from enum import Enum
-
 from rdflib import URIRef
 
+from sempyro.utils.vocabulary import VocabularyEnum
+
 
-class GeonovumLicences(Enum):
+class GeonovumLicences(VocabularyEnum):
     cc0 = URIRef("https://definities.geostandaarden.nl/dcat-ap-nl/id/waardelijst/licenties/cc0")
     cc_by_10 = URIRef("https://definities.geostandaarden.nl/dcat-ap-nl/id/waardelijst/licenties/naamsvermelding10")
     cc_by_20 = URIRef("https://definities.geostandaarden.nl/dcat-ap-nl/id/waardelijst/licenties/naamsvermelding20")
@@ -47,7 +47,7 @@ class GeonovumLicences(Enum):
     public_domain_mark = URIRef("https://definities.geostandaarden.nl/dcat-ap-nl/id/waardelijst/licenties/public_domain_mark")
 
 
-class DatasetTheme(Enum):
+class DatasetTheme(VocabularyEnum):
     agri = URIRef("http://publications.europa.eu/resource/authority/data-theme/AGRI")
     econ = URIRef("http://publications.europa.eu/resource/authority/data-theme/ECON")
     educ = URIRef("http://publications.europa.eu/resource/authority/data-theme/EDUC")
@@ -64,7 +64,7 @@ class DatasetTheme(Enum):
     tran = URIRef("http://publications.europa.eu/resource/authority/data-theme/TRAN")
 
 
-class DatasetStatus(Enum):
+class DatasetStatus(VocabularyEnum):
     develop = URIRef("http://publications.europa.eu/resource/authority/dataset-status/DEVELOP")
     completed = URIRef("http://publications.europa.eu/resource/authority/dataset-status/COMPLETED")
     deprecated = URIRef("http://publications.europa.eu/resource/authority/dataset-status/DEPRECATED")
@@ -73,7 +73,7 @@ class DatasetStatus(Enum):
     discontinued = URIRef("http://publications.europa.eu/resource/authority/dataset-status/DISCONT")
 
 
-class DistributionStatus(Enum):
+class DistributionStatus(VocabularyEnum):
     develop = URIRef("http://publications.europa.eu/resource/authority/distribution-status/DEVELOP")
     completed = URIRef("http://publications.europa.eu/resource/authority/distribution-status/COMPLETED")
     deprecated = URIRef("http://publications.europa.eu/resource/authority/distribution-status/DEPRECATED")
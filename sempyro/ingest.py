@@ -0,0 +1,344 @@
+# Copyright 2024 Stichting Health-RI
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Streaming ingestion of delimited files: rows are read in chunks, mapped to model fields through a declarative column
+mapping, validated and written to an N-Triples file or an rdflib graph chunk by chunk, so memory use is bounded by
+the chunk size and not by the size of the input.
+"""
+
+import contextlib
+import csv
+import itertools
+import logging
+import re
+import string
+import time
+from pathlib import Path
+from typing import IO, Any, Callable, Dict, Iterator, List, NamedTuple, Optional, Type, Union
+
+from rdflib import BNode, Graph, URIRef
+
+from sempyro.columnar import validate_batch
+from sempyro.rdf_model import RDFModel, SerializationSession, _annotation_classes, _is_list_annotation, validate_many
+
+logger = logging.getLogger("__name__")
+
+DEFAULT_CHUNK_SIZE = 1000
+
+# Characters not allowed in IRIs, a subject containing them can not be serialized
+INVALID_IRI_CHARACTERS = re.compile(r'[\s<>"{}|\\^`]')
+
+
+class Column(NamedTuple):
+    """
+    Mapping of a column of the input to a field value
+    Attributes
+    ----------
+    name : str
+        name of the column
+    split : str, Optional
+        if provided, the cell is split by this separator into a list of stripped values
+    transform : Callable, Optional
+        callable applied to the cell (or to every value after splitting), e.g. `int`
+    """
+    name: str
+    split: Optional[str] = None
+    transform: Optional[Callable[[str], Any]] = None
+
+
+# Field names mapped to a column name, a Column, a Constant or a Nested mapping
+ColumnMapping = Dict[str, Any]
+
+
+class Constant(NamedTuple):
+    """Constant value of a field, the same for all rows"""
+    value: Any
+
+
+class Nested(NamedTuple):
+    """
+    Mapping of columns to a nested model
+    Attributes
+    ----------
+    model : Type[RDFModel]
+        class of the nested model
+    mapping : ColumnMapping
+        mapping of the fields of the nested model
+    """
+    model: Type[RDFModel]
+    mapping: ColumnMapping
+
+
+class RowError(NamedTuple):
+    """
+    Row rejected during ingestion
+    Attributes
+    ----------
+    row : int
+        number of the row in the input, the first data row after the header being 1
+    errors : List[Dict[str, Any]]
+        errors in pydantic `ValidationError.errors()` format
+    """
+    row: int
+    errors: List[Dict[str, Any]]
+
+
+class IngestionProgress(NamedTuple):
+    """
+    Progress of an ingestion, reported after every chunk
+    Attributes
+    ----------
+    rows : int
+        rows read so far
+    written : int
+        models written so far
+    errors : int
+        rows rejected so far
+    rows_per_second : float
+        average throughput since the start of the ingestion
+    """
+    rows: int
+    written: int
+    errors: int
+    rows_per_second: float
+
+
+class IngestionResult(NamedTuple):
+    """
+    Outcome of an ingestion
+    Attributes
+    ----------
+    rows : int
+        rows read
+    written : int
+        models written to the sink
+    triples : int
+        statements written to a file sink, or number of triples a graph sink grew by
+    errors : List[RowError]
+        rejected rows
+    seconds : float
+        duration of the ingestion
+    """
+    rows: int
+    written: int
+    triples: int
+    errors: List[RowError]
+    seconds: float
+
+
+def _cell_value(spec: Any, row: Dict[str, str]) -> Any:
+    if isinstance(spec, Constant):
+        return spec.value
+    if isinstance(spec, str):
+        spec = Column(spec)
+    cell = row.get(spec.name)
+    if cell is None or cell == "":
+        return None
+    if spec.split is None:
+        return cell if spec.transform is None else spec.transform(cell)
+    values = [x.strip() for x in cell.split(spec.split) if x.strip()]
+    return values if spec.transform is None else [spec.transform(x) for x in values]
+
+
+def map_row(model: Type[RDFModel], mapping: ColumnMapping, row: Dict[str, str]) -> Dict[str, Any]:
+    """
+    Builds the input of a model from a row of the file. Empty cells are left out, single values of list fields are
+    wrapped in a list. A Nested mapping builds the input of a nested model, a plain dictionary can be used instead
+    when the field allows a single model class.
+    :param model: model class
+    :param mapping: field names mapped to column names, Column, Constant, Nested or dictionaries
+    :param row: row as a dictionary of column names to cells
+    :return: dictionary to validate the model with
+    """
+    record = {}
+    for field_name, spec in mapping.items():
+        field_info = model.model_fields[field_name]
+        if isinstance(spec, dict):
+            spec = Nested(model=_nested_model(model, field_name), mapping=spec)
+        if isinstance(spec, Nested):
+            value = map_row(spec.model, spec.mapping, row) or None
+        else:
+            value = _cell_value(spec, row)
+        if value is None:
+            continue
+        if _is_list_annotation(field_info.annotation) and not isinstance(value, list):
+            value = [value]
+        record[field_name] = value
+    return record
+
+
+def _nested_model(model: Type[RDFModel], field_name: str) -> Type[RDFModel]:
+    models = [x for x in _annotation_classes(model.model_fields[field_name].annotation)
+              if isinstance(x, type) and issubclass(x, RDFModel)]
+    if len(models) != 1:
+        raise ValueError(f"Field '{field_name}' of {model.__name__} allows {len(models)} model classes, "
+                         f"map it with Nested(model, mapping)")
+    return models[0]
+
+
+def resolve_mapping(model: Type[RDFModel], mapping: ColumnMapping) -> ColumnMapping:
+    """
+    Checks a column mapping against the fields of a model and replaces dictionaries by Nested mappings
+    :param model: model class
+    :param mapping: column mapping
+    :return: mapping without dictionaries
+    :raises: ValueError if a field does not exist or a dictionary maps a field allowing several model classes
+    """
+    resolved = {}
+    for field_name, spec in mapping.items():
+        if field_name not in model.model_fields:
+            raise ValueError(f"{model.__name__} has no field '{field_name}'")
+        if isinstance(spec, dict):
+            spec = Nested(model=_nested_model(model, field_name), mapping=spec)
+        if isinstance(spec, Nested):
+            spec = Nested(model=spec.model, mapping=resolve_mapping(spec.model, spec.mapping))
+        resolved[field_name] = spec
+    return resolved
+
+
+def _row_errors(error: ValueError) -> List[Dict[str, Any]]:
+    if hasattr(error, "errors"):
+        # inputs are left out, they would keep every rejected row in memory
+        return error.errors(include_url=False, include_context=False, include_input=False)
+    return [{"type": "value_error", "loc": (), "msg": str(error)}]
+
+
+def _prevalidation_columns(mapping: ColumnMapping) -> Dict[str, Column]:
+    return {field_name: Column(spec) if isinstance(spec, str) else spec for field_name, spec in mapping.items()
+            if isinstance(spec, (str, Column))}
+
+
+def _prevalidate(model: Type[RDFModel], columns: Dict[str, Column], chunk: List[Dict[str, str]]) -> Dict[int, list]:
+    # cells are checked as read (split but not transformed), transforms may fail on the values being filtered out
+    batch = {x.name: [_cell_value(Column(x.name, split=x.split), row) for row in chunk] for x in columns.values()}
+    return validate_batch(batch, model, columns={x: y.name for x, y in columns.items()}).errors
+
+
+def _check_subject_template(subject: str, header: List[str]) -> None:
+    columns = {x[1] for x in string.Formatter().parse(subject) if x[1] is not None}
+    missing = sorted(columns - set(header))
+    if missing:
+        raise ValueError(f"Subject template refers to columns missing from the header: {', '.join(missing)}")
+
+
+def _subject_node(subject: Optional[str], row: Dict[str, str]) -> Union[URIRef, BNode]:
+    if subject is None:
+        return BNode()
+    iri = subject.format(**row)
+    if INVALID_IRI_CHARACTERS.search(iri):
+        raise ValueError(f"'{iri}' is not a valid IRI")
+    return URIRef(iri)
+
+
+def _read_rows(source: Union[str, Path, IO[str]], delimiter: str, subject: Optional[str]) -> Iterator[Dict[str, str]]:
+    with contextlib.ExitStack() as stack:
+        if isinstance(source, (str, Path)):
+            source = stack.enter_context(open(source, newline="", encoding="utf-8"))
+        reader = csv.DictReader(source, delimiter=delimiter)
+        if subject is not None:
+            # checked on the header, before the first row is read
+            _check_subject_template(subject, reader.fieldnames or [])
+        yield from reader
+
+
+def ingest_csv(source: Union[str, Path, IO[str]],
+               model: Type[RDFModel],
+               mapping: ColumnMapping,
+               sink: Union[IO, Graph],
+               subject: Optional[str] = None,
+               delimiter: str = ",",
+               chunk_size: int = DEFAULT_CHUNK_SIZE,
+               session: Optional[SerializationSession] = None,
+               progress: Optional[Callable[[IngestionProgress], None]] = None,
+               prevalidate: bool = False) -> IngestionResult:
+    """
+    Reads a delimited file in chunks, maps its rows to models, validates them and writes their triples to a sink.
+    Rows which fail mapping or validation are collected as errors, the ingestion continues with the next row.
+    :param source: path or text file-like object of the delimited file, the first line being the header
+    :param model: model class, e.g. HRIDataset or DCATDataset
+    :param mapping: field names mapped to column names, Column, Constant or Nested mappings, see `map_row`
+    :param sink: file-like object the models are streamed to as N-Triples (text or binary, see
+    `RDFModel.write_ntriples`), or an rdflib.Graph the triples are added to
+    :param subject: template of the subject IRI of a row formatted with its cells, e.g.
+    'https://example.com/dataset/{id}', blank nodes are used if not provided. Rows which cells make an invalid IRI are
+    rejected.
+    :param delimiter: delimiter of the file
+    :param chunk_size: number of rows read, validated and written at once
+    :param session: optional serialization session, e.g. to deduplicate nested nodes shared between rows; with a graph
+    sink, a session without graph is attached to the sink
+    :param progress: optional callable receiving an IngestionProgress after every chunk
+    :param prevalidate: check the URL, email, temporal and non-negative integer columns of every chunk at once with
+    `sempyro.columnar.validate_batch` first, rows failing the checks are rejected without building their models
+    :return: IngestionResult
+    :raises: ValueError if the mapping does not match the fields of the model, the subject template refers to
+    columns missing from the header or the session targets another graph than the sink
+    """
+    # errors in the mapping itself are raised before reading, not reported for every row
+    mapping = resolve_mapping(model, mapping)
+    to_graph = isinstance(sink, Graph)
+    if session is None:
+        session = SerializationSession(graph=sink if to_graph else None)
+    elif to_graph and session.graph is None:
+        session.graph = sink
+    elif to_graph and session.graph is not sink:
+        raise ValueError("The serialization session targets another graph than the sink")
+    start = time.perf_counter()
+    rows = written = triples = 0
+    initial_size = len(sink) if to_graph else 0
+    errors = []
+    row_iterator = _read_rows(source, delimiter, subject)
+    prevalidation_columns = _prevalidation_columns(mapping) if prevalidate else {}
+    while True:
+        chunk = list(itertools.islice(row_iterator, chunk_size))
+        if not chunk:
+            break
+        rejected = _prevalidate(model, prevalidation_columns, chunk) if prevalidation_columns else {}
+        chunk_errors = {index: [{"type": check, "loc": (column,), "msg": f"Invalid {check} in column {column}"}
+                                for column, check in failed] for index, failed in rejected.items()}
+        records = []
+        for index, row in enumerate(chunk):
+            if index in chunk_errors:
+                continue
+            try:
+                records.append((index, map_row(model, mapping, row)))
+            except ValueError as e:
+                chunk_errors[index] = _row_errors(e)
+        # the chunk is validated at once, errors are keyed by the position of the record in the batch
+        validation = validate_many(model, [x for _, x in records])
+        chunk_errors.update({records[x][0]: y for x, y in validation.errors.items()})
+        instances = []
+        for instance, record_index in zip(validation.models, validation.indexes):
+            index = records[record_index][0]
+            try:
+                instances.append((_subject_node(subject, chunk[index]), instance))
+            except ValueError as e:
+                chunk_errors[index] = [{"type": "subject", "loc": ("subject",), "msg": str(e)}]
+        errors.extend(RowError(row=rows + x + 1, errors=chunk_errors[x]) for x in sorted(chunk_errors))
+        rows += len(chunk)
+        for node, instance in instances:
+            if to_graph:
+                instance.to_graph(node, graph=sink, session=session)
+            else:
+                triples += instance.write_ntriples(sink, node, session=session)
+            written += 1
+        if progress is not None:
+            progress(IngestionProgress(rows=rows, written=written, errors=len(errors),
+                                       rows_per_second=rows / max(time.perf_counter() - start, 1e-9)))
+    if to_graph:
+        triples = len(sink) - initial_size
+    if errors:
+        logger.warning(f"{len(errors)} of {rows} rows were rejected")
+    return IngestionResult(rows=rows, written=written, triples=triples, errors=errors,
+                           seconds=time.perf_counter() - start)
@@ -0,0 +1,168 @@
+# Copyright 2024 Stichting Health-RI
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Streaming of models as newline delimited JSON (NDJSON), one model per line. Lines are parsed by the JSON parser of
+pydantic-core straight into models and models are read and written one at a time, so memory use does not depend on
+the size of the file. Paths ending with `.gz` are written gzip compressed, gzip compressed input is detected.
+Nested models are written with their own fields; to read them back as the same classes when fields are annotated with
+a base class (e.g. HRIDistribution in HRIDataset.distribution), pass the substitutions as `nested_models`, as for
+`RDFModel.from_graph`.
+"""
+
+import gzip
+import io
+import logging
+from pathlib import Path
+from typing import IO, Any, Dict, Iterable, Iterator, Literal, Optional, Type, Union
+
+from pydantic import ValidationError
+from pydantic_core import from_json
+
+from sempyro.rdf_model import RDFModel
+
+logger = logging.getLogger("__name__")
+
+GZIP_MAGIC = b"\x1f\x8b"
+
+
+def _open_read(path: Union[str, Path]) -> IO[bytes]:
+    with open(path, "rb") as source_file:
+        compressed = source_file.read(2) == GZIP_MAGIC
+    return gzip.open(path, "rb") if compressed else open(path, "rb")
+
+
+def _open_write(path: Union[str, Path]) -> IO[bytes]:
+    return gzip.open(path, "wb") if str(path).endswith(".gz") else open(path, "wb")
+
+
+NestedModels = Dict[Type[RDFModel], Type[RDFModel]]
+
+
+def _resolve_item(item: Any, nested: tuple, nested_models: NestedModels) -> Any:
+    if not isinstance(item, dict):
+        return item
+    substitutes = [nested_models[x] for x in nested if x in nested_models]
+    if substitutes:
+        return substitutes[0].model_validate(_resolve_nested(substitutes[0], item, nested_models))
+    return _resolve_nested(nested[0], item, nested_models)
+
+
+def _resolve_nested(model_cls: Type[RDFModel], data: Dict[str, Any], nested_models: NestedModels) -> Dict[str, Any]:
+    """
+    Validates nested dictionaries of fields annotated with a substituted model class as the substitute, deepest
+    first; the instances are then accepted by validation of the enclosing model, other values are left as they are
+    """
+    plans = model_cls._field_parsing_plans()
+    resolved = dict(data)
+    for name, value in data.items():
+        field = plans.get(name)
+        if field is None or not field.nested:
+            continue
+        if isinstance(value, list):
+            resolved[name] = [_resolve_item(item, field.nested, nested_models) for item in value]
+        else:
+            resolved[name] = _resolve_item(value, field.nested, nested_models)
+    return resolved
+
+
+def _validate_line(line: Union[str, bytes], model_cls: Type[RDFModel], nested_models: NestedModels) -> RDFModel:
+    if not nested_models:
+        return model_cls.model_validate_json(line)
+    data = from_json(line)
+    if not isinstance(data, dict):
+        return model_cls.model_validate(data)
+    return model_cls.model_validate(_resolve_nested(model_cls, data, nested_models))
+
+
+def _read_lines(fileobj: IO,
+                model_cls: Type[RDFModel],
+                on_error: str,
+                nested_models: NestedModels) -> Iterator[RDFModel]:
+    for number, line in enumerate(fileobj, start=1):
+        if not line.strip():
+            continue
+        try:
+            yield _validate_line(line, model_cls, nested_models)
+        except ValidationError as e:
+            if on_error == "raise":
+                raise
+            logger.warning(f"Line {number} skipped, it is not a valid {model_cls.__name__}: "
+                           f"{e.error_count()} validation errors")
+
+
+def _iter_ndjson(source: Union[str, Path, IO],
+                 model_cls: Type[RDFModel],
+                 on_error: str,
+                 nested_models: NestedModels) -> Iterator[RDFModel]:
+    if not isinstance(source, (str, Path)):
+        yield from _read_lines(source, model_cls, on_error, nested_models)
+        return
+    with _open_read(source) as source_file:
+        yield from _read_lines(source_file, model_cls, on_error, nested_models)
+
+
+def read_ndjson(source: Union[str, Path, IO],
+                model_cls: Type[RDFModel],
+                on_error: Literal["raise", "skip"] = "raise",
+                nested_models: Optional[NestedModels] = None) -> Iterator[RDFModel]:
+    """
+    Lazily reads models from newline delimited JSON, one model per line, empty lines are ignored
+    :param source: path of the file, plain or gzip compressed, or a text or binary file-like object
+    :param model_cls: model class of the lines, e.g. HRIDataset
+    :param on_error: 'raise' to raise the ValidationError of an invalid line, 'skip' to log and skip it
+    :param nested_models: optional substitutions of nested model classes, e.g.
+    `{HEALTHDCATAPDistribution: HRIDistribution}` to read distributions of an HRIDataset as HRIDistribution. Nested
+    objects of substituted classes are validated as the substitute only, its validation errors are raised.
+    :return: iterator over models, a path is opened on the first model and closed once the iterator is exhausted
+    :raises: ValidationError while iterating if a line is invalid and `on_error` is 'raise'
+    """
+    if on_error not in ("raise", "skip"):
+        raise ValueError(f"on_error should be 'raise' or 'skip', got '{on_error}'")
+    return _iter_ndjson(source, model_cls, on_error, nested_models or {})
+
+
+def dump_json(model: RDFModel) -> str:
+    """
+    Dumps a model to compact JSON as written by `write_ndjson`, fields without value are left out
+    :param model: model instance
+    :return: JSON string
+    """
+    # HRI models are nested in fields annotated with their HealthDCAT-AP base classes, `serialize_as_any` dumps
+    # their own fields
+    return model.model_dump_json(exclude_none=True, serialize_as_any=True)
+
+
+def _write_lines(fileobj: IO, models: Iterable[RDFModel]) -> int:
+    binary = not isinstance(fileobj, io.TextIOBase)
+    count = 0
+    for model in models:
+        line = dump_json(model) + "\n"
+        fileobj.write(line.encode("utf-8") if binary else line)
+        count += 1
+    return count
+
+
+def write_ndjson(destination: Union[str, Path, IO], models: Iterable[RDFModel]) -> int:
+    """
+    Writes models as newline delimited JSON, one model per line, models are consumed from the iterable one by one
+    :param destination: path of the file, gzip compressed if it ends with `.gz`, or a text or binary file-like object
+    (e.g. opened with `gzip.open(path, "wb")`)
+    :param models: iterable of models
+    :return: number of models written
+    """
+    if not isinstance(destination, (str, Path)):
+        return _write_lines(destination, models)
+    with _open_write(destination) as destination_file:
+        return _write_lines(destination_file, models)
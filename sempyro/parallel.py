@@ -0,0 +1,136 @@
+# Copyright 2024 Stichting Health-RI
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import io
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import IO, Any, Iterable, Iterator, List, Optional, Tuple, Type, Union
+
+from rdflib import RDF, BNode, URIRef
+
+from sempyro.rdf_model import RDFModel, SerializationSession
+from sempyro.utils.ntriples import ntriples_line
+
+CHUNKS_PER_WORKER = 4
+
+
+def _statement_lines(statements: Iterable[Tuple], graph_name: Optional[Union[URIRef, BNode]]) -> Iterator[str]:
+    for statement in statements:
+        yield ntriples_line(statement if graph_name is None else (*statement, graph_name))
+
+
+def _serialize_chunk(model_class: Type[RDFModel],
+                     field_name: str,
+                     subject: Union[URIRef, BNode],
+                     values: List[Any],
+                     graph_name: Optional[Union[URIRef, BNode]],
+                     skolem_base: Optional[str]) -> Tuple[str, int]:
+    """Serializes a chunk of values of a model field to N-Triples/N-Quads text, runs in a worker process"""
+    field_plan = next(x for x in model_class.serialization_plan().fields if x.name == field_name)
+    session = SerializationSession(content_ids=True, skolem_base=skolem_base)
+    lines = list(_statement_lines(RDFModel._iter_values_triples(node=subject,
+                                                                field_plan=field_plan,
+                                                                values=values,
+                                                                session=session),
+                                  graph_name=graph_name))
+    return "".join(lines), len(lines)
+
+
+def write_ntriples_parallel(fileobj: IO,
+                            model: RDFModel,
+                            subject: Union[URIRef, BNode],
+                            shard_field: str = "dataset",
+                            graph_name: Optional[Union[URIRef, BNode]] = None,
+                            workers: Optional[int] = None,
+                            chunk_size: Optional[int] = None,
+                            skolem_base: Optional[str] = None) -> int:
+    """
+    Streams a model to a file-like object as N-Triples (or N-Quads if a graph name is provided), serializing the
+    values of one list field, e.g. the datasets of a catalog, in a pool of worker processes. Values are split into
+    chunks, chunks are serialized by the workers and written in their original order, other fields are serialized in
+    the calling process.
+    Nested nodes are identified by content (see `SerializationSession(content_ids=True)`), so the output is
+    byte-identical to `model.write_ntriples(fileobj, subject, session=SerializationSession(content_ids=True))`
+    whatever the number of workers.
+    :param fileobj: text or binary file-like object to write to
+    :param model: model to serialize, e.g. an HRICatalog
+    :param subject: subject of the model
+    :param shard_field: name of the list field which values are serialized in parallel
+    :param graph_name: optional graph name to write N-Quads
+    :param workers: number of worker processes, defaults to the number of CPUs, 1 serializes in the calling process
+    :param chunk_size: number of values serialized per worker task, by default values are split into
+    `CHUNKS_PER_WORKER` chunks per worker
+    :param skolem_base: optional base of skolem IRIs used instead of blank nodes for nested nodes
+    :return: number of statements written
+    """
+    plan = model.serialization_plan()
+    field_names = [x.name for x in plan.fields]
+    if shard_field not in field_names:
+        raise ValueError(f"{type(model).__name__} has no RDF field '{shard_field}', expected one of {field_names}")
+    if workers is None:
+        workers = os.cpu_count() or 1
+    values = model.__dict__.get(shard_field) or []
+    if not isinstance(values, list):
+        values = [values]
+    if chunk_size is None:
+        chunk_size = max(1, math.ceil(len(values) / (workers * CHUNKS_PER_WORKER)))
+    chunks = [values[i:i + chunk_size] for i in range(0, len(values), chunk_size)]
+
+    binary = not isinstance(fileobj, io.TextIOBase)
+    count = 0
+
+    def write(text: str):
+        fileobj.write(text.encode("utf-8") if binary else text)
+
+    session = SerializationSession(content_ids=True, skolem_base=skolem_base)
+    for line in _statement_lines([(subject, RDF.type, plan.rdf_type)], graph_name=graph_name):
+        write(line)
+        count += 1
+    executor = ProcessPoolExecutor(max_workers=workers) if workers > 1 and len(chunks) > 1 else None
+    try:
+        for field_plan in plan.fields:
+            if field_plan.name == shard_field:
+                if executor is None:
+                    results = (_serialize_chunk(type(model), shard_field, subject, chunk, graph_name, skolem_base)
+                               for chunk in chunks)
+                else:
+                    n_chunks = len(chunks)
+                    results = executor.map(_serialize_chunk,
+                                           [type(model)] * n_chunks,
+                                           [shard_field] * n_chunks,
+                                           [subject] * n_chunks,
+                                           chunks,
+                                           [graph_name] * n_chunks,
+                                           [skolem_base] * n_chunks)
+                for text, chunk_count in results:
+                    write(text)
+                    count += chunk_count
+                continue
+            value = model.__dict__.get(field_plan.name)
+            if not value:
+                continue
+            if not isinstance(value, list):
+                value = [value]
+            for line in _statement_lines(RDFModel._iter_values_triples(node=subject,
+                                                                       field_plan=field_plan,
+                                                                       values=value,
+                                                                       session=session),
+                                         graph_name=graph_name):
+                write(line)
+                count += 1
+    finally:
+        if executor is not None:
+            executor.shutdown()
+    return count
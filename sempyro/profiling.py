@@ -0,0 +1,219 @@
+# Copyright 2024 Stichting Health-RI
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Opt-in profiling of RDFModel serialization. A session created with `SerializationSession(profile=True)` records per
+model class and per field how often they are serialized, how many triples they emit and how much time is spent in
+them. Sessions created without profiling skip all of it, the serializer only checks `session.profiler` once per model.
+"""
+
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, NamedTuple, Optional, Tuple, Union
+
+from rdflib import BNode, URIRef
+from rdflib.term import Node
+
+if TYPE_CHECKING:
+    from sempyro.rdf_model import RDFModel, SerializationSession
+
+
+class FieldProfile(NamedTuple):
+    """
+    Serialization statistics of a field of a model class
+    Attributes
+    ----------
+    model : str
+        name of the model class
+    field : str
+        name of the field
+    calls : int
+        number of serialized models having a value for the field
+    values : int
+        number of values serialized, items of list fields are counted separately
+    triples : int
+        number of triples emitted, triples of nested models included
+    seconds : float
+        cumulative time spent serializing the field, nested models included
+    self_seconds : float
+        cumulative time spent serializing the field, nested models excluded, e.g. literal and date conversion
+    """
+    model: str
+    field: str
+    calls: int
+    values: int
+    triples: int
+    seconds: float
+    self_seconds: float
+
+
+class ModelProfile(NamedTuple):
+    """
+    Serialization statistics of a model class, totals of its fields
+    Attributes
+    ----------
+    model : str
+        name of the model class
+    calls : int
+        number of serialized models of the class, nested ones included
+    triples : int
+        number of triples emitted by the fields of the models, nested models included
+    seconds : float
+        cumulative time spent serializing the fields of the models, nested models included
+    self_seconds : float
+        cumulative time spent serializing the fields of the models, nested models excluded
+    """
+    model: str
+    calls: int
+    triples: int
+    seconds: float
+    self_seconds: float
+
+
+class ProfileReport(NamedTuple):
+    """
+    Serialization statistics collected by a profiling session
+    Attributes
+    ----------
+    models : List[ModelProfile]
+        statistics per model class, sorted by decreasing self time
+    fields : List[FieldProfile]
+        statistics per model class and field, sorted by decreasing self time
+    namespace_bindings : int
+        number of namespace binding requests
+    binding_seconds : float
+        cumulative time spent binding namespaces
+    """
+    models: List[ModelProfile]
+    fields: List[FieldProfile]
+    namespace_bindings: int
+    binding_seconds: float
+
+    def format(self, limit: Optional[int] = None) -> str:
+        """
+        Formats the report as a text table
+        :param limit: maximal number of fields to list, all by default
+        :return: str
+        """
+        lines = [f"{'model':<30} {'calls':>9} {'triples':>10} {'total s':>10} {'self s':>10}"]
+        for model in self.models:
+            lines.append(f"{model.model:<30} {model.calls:>9} {model.triples:>10} {model.seconds:>10.4f} "
+                         f"{model.self_seconds:>10.4f}")
+        lines.append("")
+        lines.append(f"{'model.field':<50} {'calls':>9} {'values':>9} {'triples':>10} {'total s':>10} {'self s':>10}")
+        for field in self.fields[:limit]:
+            lines.append(f"{field.model + '.' + field.field:<50} {field.calls:>9} {field.values:>9} "
+                         f"{field.triples:>10} {field.seconds:>10.4f} {field.self_seconds:>10.4f}")
+        lines.append("")
+        lines.append(f"namespace bindings: {self.namespace_bindings} ({self.binding_seconds:.4f} s)")
+        return "\n".join(lines)
+
+
+class _Counters:
+    __slots__ = ("calls", "values", "triples", "seconds", "self_seconds")
+
+    def __init__(self):
+        self.calls = 0
+        self.values = 0
+        self.triples = 0
+        self.seconds = 0.0
+        self.self_seconds = 0.0
+
+
+class SerializationProfiler:
+    """
+    Collects serialization statistics of a profiling SerializationSession, see `SerializationSession.profile_report`
+    """
+    def __init__(self):
+        self._models: Dict[str, _Counters] = {}
+        self._fields: Dict[Tuple[str, str], _Counters] = {}
+        # time spent in nested models by each serialization step in progress, innermost last
+        self._nested_seconds: List[float] = []
+        self._bindings = _Counters()
+
+    def profile_model(self,
+                      model: "RDFModel",
+                      node: Union[URIRef, BNode],
+                      session: "SerializationSession") -> Iterator[Tuple[Node, Node, Node]]:
+        """
+        Yields the field triples of a model, as `RDFModel._iter_field_triples` does, recording their statistics
+        """
+        plan = model.serialization_plan()
+        model_counters = self._models.setdefault(plan.model, _Counters())
+        model_counters.calls += 1
+        values = model.__dict__
+        for field_plan in plan.fields:
+            value = values.get(field_plan.name)
+            if not value:
+                continue
+            if not isinstance(value, list):
+                value = [value]
+            field_counters = self._fields.setdefault((plan.model, field_plan.name), _Counters())
+            field_counters.calls += 1
+            field_counters.values += len(value)
+            triples = model._iter_values_triples(node=node, field_plan=field_plan, values=value, session=session)
+            yield from self._timed(triples, field_counters, model_counters)
+
+    def _timed(self,
+               triples: Iterator[Tuple[Node, Node, Node]],
+               field_counters: _Counters,
+               model_counters: _Counters) -> Iterator[Tuple[Node, Node, Node]]:
+        # only time spent producing triples is measured, not the time the consumer spends on them
+        while True:
+            self._nested_seconds.append(0.0)
+            start = perf_counter()
+            try:
+                triple = next(triples)
+            except StopIteration:
+                triple = None
+            finally:
+                # also on errors, the entry of this level must not be left for the enclosing one to pop
+                elapsed = perf_counter() - start
+                self_elapsed = elapsed - self._nested_seconds.pop()
+                if self._nested_seconds:
+                    self._nested_seconds[-1] += elapsed
+                for counters in (field_counters, model_counters):
+                    counters.seconds += elapsed
+                    counters.self_seconds += self_elapsed
+            if triple is None:
+                return
+            field_counters.triples += 1
+            model_counters.triples += 1
+            yield triple
+
+    def timed_bind(self, bind: Callable[[str, Any], None]) -> Callable[[str, Any], None]:
+        """
+        Wraps the namespace binding of a session to record binding requests
+        """
+        def profiled_bind(prefix: str, namespace: Any) -> None:
+            start = perf_counter()
+            bind(prefix, namespace)
+            self._bindings.calls += 1
+            self._bindings.seconds += perf_counter() - start
+        return profiled_bind
+
+    def report(self) -> ProfileReport:
+        """
+        Returns the statistics collected so far
+        :return: ProfileReport
+        """
+        models = [ModelProfile(model=name, calls=x.calls, triples=x.triples, seconds=x.seconds,
+                               self_seconds=x.self_seconds)
+                  for name, x in self._models.items()]
+        fields = [FieldProfile(model=model, field=field, calls=x.calls, values=x.values, triples=x.triples,
+                               seconds=x.seconds, self_seconds=x.self_seconds)
+                  for (model, field), x in self._fields.items()]
+        return ProfileReport(models=sorted(models, key=lambda x: -x.self_seconds),
+                             fields=sorted(fields, key=lambda x: -x.self_seconds),
+                             namespace_bindings=self._bindings.calls,
+                             binding_seconds=self._bindings.seconds)
@@ -12,7 +12,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from .prov_classes import Activity, Association, End, EntityInfluence, InstantaneousEvent, Start
+from typing import TYPE_CHECKING
+
+from sempyro.utils.lazy import lazy_loader
+
+if TYPE_CHECKING:
+    from .prov_classes import Activity, Association, End, EntityInfluence, InstantaneousEvent, Start
 
 __all__ = (
     "Activity",
@@ -22,3 +27,12 @@ __all__ = (
     "InstantaneousEvent",
     "Start"
 )
+
+__getattr__, __dir__ = lazy_loader(__name__, {
+    "Activity": ".prov_classes",
+    "Association": ".prov_classes",
+    "End": ".prov_classes",
+    "EntityInfluence": ".prov_classes",
+    "InstantaneousEvent": ".prov_classes",
+    "Start": ".prov_classes",
+})
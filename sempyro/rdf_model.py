@@ -12,13 +12,35 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import copy
+import hashlib
+import io
+import itertools
 import json
 import logging
-import re
 import sys
+import typing
+import weakref
 from datetime import date, datetime
+from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, List, Type, Union
+from typing import (
+    IO,
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    Union,
+)
 from typing import Literal as typing_Literal
 
 import ruamel.yaml
@@ -29,18 +51,35 @@ from pydantic import (
     ConfigDict,
     Field,
     NaiveDatetime,
+    TypeAdapter,
+    ValidationError,
     field_validator,
     model_validator,
 )
 from pydantic.fields import PydanticUndefined
 from rdflib import XSD, BNode, Graph, Literal, URIRef
 from rdflib.namespace import RDF, DefinedNamespaceMeta
+from rdflib.term import Node
 
-from sempyro.utils.constants import year_month_pattern, year_pattern
+from sempyro.profiling import ProfileReport, SerializationProfiler
+from sempyro.utils.ntriples import ntriples_line, ntriples_term
+from sempyro.utils.temporal import classify_temporal
+from sempyro.utils.terms import literal_term, uri_term
 
 RDF_KEY = "rdf_term"
 RDF_TYPE_KEY = "rdf_type"
 BIND_NAMESPACE_KEY = "bind_namespace"
+DATETIME_LITERAL_TYPE = "datetime_literal"
+
+# Reasons of warnings collected by serialization sessions
+MISSING_RDF_TYPE = "missing_rdf_type"
+UNKNOWN_TEMPORAL_FORMAT = "unknown_temporal_format"
+
+# Kinds of values a field may hold, used to skip per-item type dispatch where the annotation allows it
+NESTED_KIND = "nested"
+LITERAL_FIELD_KIND = "literal_field"
+VALUE_KIND = "value"
+MIXED_KIND = "mixed"
 
 logger = logging.getLogger("__name__")
 
@@ -136,12 +175,14 @@ class LiteralField(BaseModel):
                 logger.warning(f"{value} not found in XSD namespace")
         return value
 
-    def flatten_to_literal(self, graph, subject, node_predicate):
+    def to_literal(self) -> Literal:
         datatype = None
         if self.datatype:
-            datatype = URIRef(self.datatype)
-        value = Literal(self.value, lang=self.language, datatype=datatype)
-        graph.add((subject, node_predicate, value))
+            datatype = uri_term(self.datatype)
+        return Literal(self.value, lang=self.language, datatype=datatype)
+
+    def flatten_to_literal(self, graph, subject, node_predicate):
+        graph.add((subject, node_predicate, self.to_literal()))
         return graph
 
 
@@ -149,71 +190,1172 @@ class RDFModelError(AttributeError):
     """An error thrown in case of incorrect defined model"""
 
 
+class FieldSerializationPlan(NamedTuple):
+    """
+    Precompiled serialization instructions for a single field of an RDFModel
+    Attributes
+    ----------
+    name : str
+        name of the model field
+    predicate : rdflib.URIRef
+        RDF predicate the field values are serialized with
+    rdf_type : Any
+        raw `rdf_type` value from the field schema, kept for reference
+    converter : Callable, Optional
+        callable converting a plain (non-model) field value to an rdflib term, None if no `rdf_type` is provided
+    bind_namespace : Tuple[str, rdflib.URIRef], Optional
+        prefix and namespace to bind to the graph when the field is serialized
+    kind : str
+        one of 'nested', 'literal_field', 'value' or 'mixed', describes which values the field annotation allows
+    model : str
+        name of the model class the plan belongs to, used to report serialization warnings
+    temporal : bool
+        True for `datetime_literal` fields, which converter leaves values matching no XSD temporal type untyped
+    """
+    name: str
+    predicate: URIRef
+    rdf_type: Any
+    converter: Optional[Callable[[Any], Union[URIRef, Literal]]]
+    bind_namespace: Optional[Tuple[str, URIRef]]
+    kind: str
+    model: str
+    temporal: bool
+
+
+class SerializationPlan(NamedTuple):
+    """
+    Precompiled serialization instructions for an RDFModel class, see `RDFModel.serialization_plan`
+    Attributes
+    ----------
+    model : str
+        name of the model class
+    rdf_type : rdflib.URIRef, Optional
+        `$IRI` of the model, used as rdf:type of serialized nodes
+    prefix : str, Optional
+        `$prefix` of the model namespace
+    namespace : str, Optional
+        `$namespace` of the model
+    fields : Tuple[FieldSerializationPlan, ...]
+        serialization instructions for every field of the model carrying an `rdf_term`
+    """
+    model: str
+    rdf_type: Optional[URIRef]
+    prefix: Optional[str]
+    namespace: Optional[str]
+    fields: Tuple[FieldSerializationPlan, ...]
+
+
+class FieldParsingPlan(NamedTuple):
+    """
+    Precomputed instructions to read values of a single RDFModel field from a graph, see `RDFModel.parsing_index`
+    Attributes
+    ----------
+    name : str
+        name of the model field
+    is_list : bool
+        if the field holds a list of values
+    nested : Tuple[Type[RDFModel], ...]
+        RDFModel classes allowed by the field annotation, in annotation order
+    literal_field : bool
+        if the field annotation allows LiteralField values
+    accepts_str : bool
+        if the field annotation allows plain string values
+    value_types : Tuple[type, ...]
+        other classes allowed by the field annotation
+    datatype : rdflib.URIRef, Optional
+        XSD datatype of the field if its `rdf_type` is `xsd:<type>`
+    rdf_type : Any
+        raw `rdf_type` value from the field schema
+    force_literal : bool
+        if string values of the field are converted to LiteralField on validation
+    """
+    name: str
+    is_list: bool
+    nested: Tuple[Type["RDFModel"], ...]
+    literal_field: bool
+    accepts_str: bool
+    value_types: Tuple[type, ...]
+    datatype: Optional[URIRef]
+    rdf_type: Any
+    force_literal: bool
+
+
+class TrustedConstructionPlan(NamedTuple):
+    """
+    Precomputed instructions to construct instances of an RDFModel class without validation, see
+    `RDFModel.construct_trusted`
+    Attributes
+    ----------
+    fields : FrozenSet[str]
+        names of the model fields
+    defaults : Dict[str, Any]
+        every field in definition order, mapped to its immutable default value or to a placeholder, copied for
+        every instance so that attributes keep the field order
+    default_factories : Dict[str, Callable[[], Any]]
+        factories of mutable default values, called for every instance not given the field
+    required : FrozenSet[str]
+        names of fields without default, left unset if not given
+    converters : Dict[str, Callable[[Any, Dict], Any]]
+        constructors of values of fields holding nested models or LiteralField, other values are used as given
+    direct : bool
+        if instances can be created by setting their attributes directly, False for models with private attributes,
+        extra fields or `model_post_init`, which are created with `model_construct`
+    """
+    fields: FrozenSet[str]
+    defaults: Dict[str, Any]
+    default_factories: Dict[str, Callable[[], Any]]
+    required: FrozenSet[str]
+    converters: Dict[str, Callable[[Any, Dict], Any]]
+    direct: bool
+
+
+class GraphDelta(NamedTuple):
+    """
+    Changes of the RDF description of a model since its previous serialization, see `RDFModel.graph_delta`
+    Attributes
+    ----------
+    removed : List[Tuple[Node, Node, Node]]
+        triples to remove from the previously serialized graph
+    added : List[Tuple[Node, Node, Node]]
+        triples to add to the previously serialized graph
+    """
+    removed: List[Tuple[Node, Node, Node]]
+    added: List[Tuple[Node, Node, Node]]
+
+    def apply(self, graph: Graph) -> Graph:
+        """
+        Applies the delta to a graph holding the previous serialization of the model
+        :param graph: graph to update in place
+        :return: the updated graph
+        """
+        for triple in self.removed:
+            graph.remove(triple)
+        for triple in self.added:
+            graph.add(triple)
+        return graph
+
+
+class _SerializationBaseline(NamedTuple):
+    subject: Union[URIRef, BNode]
+    skolem_base: Optional[str]
+    field_triples: Dict[str, List[Tuple[Node, Node, Node]]]
+    # change stamp the baseline is up to date with
+    stamp: int
+
+
+# Change tracking state is kept out of the model instances (and so out of pydantic equality and dumps), keyed by
+# `id` of the tracked model and dropped when the model is garbage collected. Models are tracked once they are part of
+# a `graph_delta` call, other models only pay a dictionary lookup on assignment. Assignments record a stamp per field
+# instead of a flag, so every baseline (a model can be nested in several serialized models, or in several fields of
+# one) compares them with its own stamp and no call resets changes another baseline has not seen yet.
+_field_changes: Dict[int, Dict[str, int]] = {}
+_baselines: Dict[int, _SerializationBaseline] = {}
+_change_stamps = itertools.count(1)
+
+
+def _track_changes(model: "RDFModel") -> None:
+    """Starts tracking assignments to fields of a model and of all its nested models"""
+    model_id = id(model)
+    if model_id not in _field_changes:
+        _field_changes[model_id] = {}
+        weakref.finalize(model, _forget_model, model_id)
+    for nested_model in model._nested_models():
+        _track_changes(nested_model)
+
+
+def _record_changes(model: "RDFModel", field_names: Iterable[str]) -> None:
+    stamp = next(_change_stamps)
+    field_changes = _field_changes[id(model)]
+    for field_name in field_names:
+        field_changes[field_name] = stamp
+
+
+def _forget_model(model_id: int) -> None:
+    _field_changes.pop(model_id, None)
+    _baselines.pop(model_id, None)
+
+
+def _changed_since(model: "RDFModel", stamp: int) -> bool:
+    """Checks if fields of a model or of any of its nested models were assigned after a change stamp"""
+    field_changes = _field_changes.get(id(model))
+    if field_changes is None or any(x > stamp for x in field_changes.values()):
+        # untracked models were not part of the baseline
+        return True
+    return any(_changed_since(nested_model, stamp) for nested_model in model._nested_models())
+
+
+def _field_models(value: Any) -> Iterator["RDFModel"]:
+    for item in (value if isinstance(value, list) else [value]):
+        if isinstance(item, RDFModel):
+            yield item
+
+
+def _is_list_annotation(annotation: Any) -> bool:
+    if typing.get_origin(annotation) in (list, List):
+        return True
+    if typing.get_origin(annotation) is Union:
+        return any(_is_list_annotation(x) for x in typing.get_args(annotation))
+    return False
+
+
+def _annotation_classes(annotation: Any) -> List[Any]:
+    """Collects all classes allowed by a (possibly nested) type annotation"""
+    args = typing.get_args(annotation)
+    if not args:
+        return [annotation]
+    classes = []
+    for arg in args:
+        classes.extend(_annotation_classes(arg))
+    return classes
+
+
+def _field_kind(annotation: Any) -> str:
+    classes = [x for x in _annotation_classes(annotation) if x is not type(None)]
+    if any(not isinstance(x, type) for x in classes):
+        return MIXED_KIND
+    models = [x for x in classes if issubclass(x, (RDFModel, LiteralField))]
+    if not models:
+        return VALUE_KIND
+    if len(models) == len(classes):
+        if all(issubclass(x, RDFModel) for x in models):
+            return NESTED_KIND
+        if all(issubclass(x, LiteralField) for x in models):
+            return LITERAL_FIELD_KIND
+    return MIXED_KIND
+
+
+def _raising_converter(error: Exception) -> Callable[[Any], Union[URIRef, Literal]]:
+    """Defers an error in field schema until a value of the field actually has to be converted"""
+    def convert(value: Any) -> Union[URIRef, Literal]:
+        raise error
+    return convert
+
+
+def _uri_converter(value: Any) -> URIRef:
+    return uri_term(value)
+
+
+LITERAL_FIELD_KEYS = frozenset(LiteralField.model_fields)
+
+
+def _new_instance(model_cls: Type[BaseModel], values: Dict[str, Any], fields_set: Set[str]) -> BaseModel:
+    """Creates a model instance by setting the attributes `model_construct` sets, without its per-field work"""
+    instance = model_cls.__new__(model_cls)
+    object.__setattr__(instance, "__dict__", values)
+    object.__setattr__(instance, "__pydantic_fields_set__", fields_set)
+    object.__setattr__(instance, "__pydantic_extra__", None)
+    object.__setattr__(instance, "__pydantic_private__", None)
+    return instance
+
+
+def _trusted_literal(data: Dict[str, Any]) -> LiteralField:
+    return _new_instance(LiteralField, {"datatype": None, "language": None, **data}, set(data))
+
+
+def _ensure_built(model_cls: Type[BaseModel]) -> None:
+    """
+    Builds the deferred validator and serializer of a model class, instances created without validation (trusted
+    construction, unpickling) would otherwise be dumped with the mock serializer of an unbuilt class
+    """
+    if not model_cls.__pydantic_complete__:
+        model_cls.model_rebuild()
+
+
+def _trusted_converter(field: FieldParsingPlan) -> Optional[Callable[[Any, Dict], Any]]:
+    """Returns the constructor of field values for `RDFModel.construct_trusted`, None if values are used as given"""
+    if not (field.nested or field.literal_field or field.force_literal):
+        return None
+    nested = field.nested[0] if field.nested else None
+
+    def convert_item(value: Any, nested_models: Dict[Type["RDFModel"], Type["RDFModel"]]) -> Any:
+        if isinstance(value, dict):
+            # LiteralField dictionaries are recognised by their keys, as fields may allow both, e.g. Location.geometry
+            if field.literal_field and "value" in value and value.keys() <= LITERAL_FIELD_KEYS:
+                datatype = value.get("datatype")
+                if isinstance(datatype, str) and datatype.startswith("xsd:"):
+                    value = {**value, "datatype": getattr(XSD, datatype.split(":")[-1])}
+                return _trusted_literal(value)
+            if nested is not None:
+                return nested_models.get(nested, nested).construct_trusted(value, nested_models=nested_models)
+        elif field.force_literal and isinstance(value, str):
+            return _trusted_literal({"value": value})
+        return value
+
+    def convert(value: Any, nested_models: Dict[Type["RDFModel"], Type["RDFModel"]]) -> Any:
+        if isinstance(value, list):
+            return [convert_item(item, nested_models) for item in value]
+        return convert_item(value, nested_models)
+
+    return convert
+
+
+def _copied_default(default: Any) -> Callable[[], Any]:
+    return lambda: copy.deepcopy(default)
+
+
+def _jsonld_coercion(rdf_type: Any) -> Optional[str]:
+    """Returns JSON-LD type coercion of a field with the given `rdf_type`, None if values are not coerced"""
+    if rdf_type == "uri":
+        return "@id"
+    if isinstance(rdf_type, str) and rdf_type.startswith("xsd:"):
+        return str(XSD) + rdf_type.split(":")[-1]
+    return None
+
+
+def _jsonld_literal(literal: Literal, coercion: Optional[str]) -> Union[str, Dict[str, str]]:
+    """Returns compacted JSON-LD representation of a literal in a term with the given type coercion"""
+    if literal.language:
+        return {"@value": str(literal), "@language": literal.language}
+    if literal.datatype is None:
+        return str(literal) if coercion is None else {"@value": str(literal)}
+    if str(literal.datatype) == coercion:
+        return str(literal)
+    return {"@value": str(literal), "@type": str(literal.datatype)}
+
+
+class SerializationWarning(NamedTuple):
+    """
+    Summary of warnings of one kind recorded by a serialization session
+    Attributes
+    ----------
+    model : str
+        name of the model class
+    field : str
+        name of the field
+    reason : str
+        cause of the warning, 'missing_rdf_type' or 'unknown_temporal_format'
+    count : int
+        number of occurrences within the session
+    message : str
+        message of the first occurrence, the only one logged
+    """
+    model: str
+    field: str
+    reason: str
+    count: int
+    message: str
+
+
+class SerializationSession:
+    """
+    State shared by all models serialized within one export, e.g. a number of models serialized into the same graph.
+    Keeps a registry of namespaces already bound to the target graph, so binding a namespace is a set lookup and
+    happens once per namespace per export. Serialization warnings are collected per model class, field and reason,
+    only their first occurrence is logged, see `warnings_summary`.
+    Attributes
+    ----------
+    graph : rdflib.Graph, Optional
+        target graph, None when triples are streamed instead of added to a graph
+    content_ids : bool
+        if True, nested model nodes get deterministic identifiers derived from a hash of their content instead of
+        fresh blank nodes
+    deduplicate : bool
+        if True, identical nested nodes are emitted only once per session, other occurrences only link to the node.
+        Implies `content_ids`
+    skolem_base : str, Optional
+        if provided, content-derived identifiers are skolem IRIs with this base (e.g.
+        'https://example.com/.well-known/genid/') instead of blank nodes. Implies `content_ids`
+    profiler : SerializationProfiler, Optional
+        collects per model class and field statistics if the session was created with `profile=True`, None otherwise
+    """
+    def __init__(self,
+                 graph: Optional[Graph] = None,
+                 content_ids: bool = False,
+                 deduplicate: bool = False,
+                 skolem_base: Optional[str] = None,
+                 profile: bool = False):
+        self.graph = graph
+        self.deduplicate = deduplicate
+        self.skolem_base = skolem_base
+        self.content_ids = content_ids or deduplicate or skolem_base is not None
+        self._bound_namespaces: Set[Tuple[str, str]] = set()
+        self._emitted_nodes: Set[Node] = set()
+        self._warnings: Dict[Tuple[str, str, str], List[Any]] = {}
+        self.profiler = None
+        if profile:
+            self.profiler = SerializationProfiler()
+            self.bind = self.profiler.timed_bind(self.bind)
+
+    def warn(self, field_plan: FieldSerializationPlan, reason: str, message: str) -> None:
+        """
+        Records a serialization warning, only the first warning per model class, field and reason is logged, further
+        ones are counted, see `warnings_summary`
+        :param field_plan: serialization plan of the field the warning is about
+        :param reason: short identifier of the cause, e.g. 'missing_rdf_type'
+        :param message: message logged for the first occurrence
+        """
+        key = (field_plan.model, field_plan.name, reason)
+        recorded = self._warnings.get(key)
+        if recorded is not None:
+            recorded[0] += 1
+            return
+        self._warnings[key] = [1, message]
+        logger.warning(f"{message} (further occurrences within the serialization session are not logged, "
+                       f"see SerializationSession.warnings_summary)")
+
+    def warnings_summary(self) -> List[SerializationWarning]:
+        """
+        Returns the warnings recorded during the session, one entry per model class, field and reason
+        :return: list of SerializationWarning, in order of first occurrence
+        """
+        return [SerializationWarning(model=model, field=field, reason=reason, count=count, message=message)
+                for (model, field, reason), (count, message) in self._warnings.items()]
+
+    def profile_report(self) -> ProfileReport:
+        """
+        Returns serialization statistics per model class and field collected by a profiling session
+        :return: ProfileReport
+        :raises: ValueError if the session was not created with `profile=True`
+        """
+        if self.profiler is None:
+            raise ValueError("Serialization session was not created with profile=True")
+        return self.profiler.report()
+
+    def content_node(self, node_type: List[URIRef], statements: List[str]) -> Union[URIRef, BNode]:
+        """
+        Derives a node identifier from the types of a node and its (predicate, object) statements in N-Triples form
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        for line in itertools.chain(sorted(str(x) for x in node_type), sorted(statements)):
+            digest.update(line.encode("utf-8"))
+            digest.update(b"\n")
+        if self.skolem_base is not None:
+            return URIRef(f"{self.skolem_base}{digest.hexdigest()}")
+        return BNode(f"c{digest.hexdigest()}")
+
+    def is_emitted(self, node: Node) -> bool:
+        """
+        Checks if a content-identified node was emitted before within the session and registers it otherwise
+        """
+        if node in self._emitted_nodes:
+            return True
+        self._emitted_nodes.add(node)
+        return False
+
+    def bind(self, prefix: str, namespace: Union[str, URIRef]) -> None:
+        """
+        Binds a prefix to a namespace in the target graph unless it was already bound within the session
+        """
+        key = (prefix, str(namespace))
+        if key in self._bound_namespaces:
+            return
+        self._bound_namespaces.add(key)
+        if self.graph is not None:
+            self.graph.bind(prefix, namespace)
+
+
+def _graph_session(graph: Optional[Graph], session: Optional[SerializationSession]) -> SerializationSession:
+    """Returns a serialization session targeting a graph, a new graph is created if neither provides one"""
+    if session is None:
+        session = SerializationSession(graph)
+    elif graph is not None and graph is not session.graph:
+        raise ValueError("Provided graph differs from the target graph of the serialization session")
+    if session.graph is None:
+        session.graph = Graph(bind_namespaces="rdflib")
+    return session
+
+
 class RDFModel(BaseModel):
     """Base class for creating pydantic models convertible to RDF graph"""
     model_config = ConfigDict(extra="forbid",
                               use_enum_values=True,
                               arbitrary_types_allowed=True,
-                              validate_assignment=True
+                              validate_assignment=True,
+                              # validators and serializers are built on first use, see `sempyro.warmup`
+                              defer_build=True
                               )
 
+    _serialization_plan: ClassVar[Optional[SerializationPlan]] = None
+
+    @classmethod
+    def serialization_plan(cls) -> SerializationPlan:
+        """
+        Returns precompiled serialization instructions of the model. The plan is built once per class on first use
+        from the `json_schema_extra` of the model and its fields, and can be inspected for debugging purposes.
+        :return: SerializationPlan
+        """
+        plan = cls.__dict__.get("_serialization_plan")
+        if plan is None:
+            plan = cls._build_serialization_plan()
+            cls._serialization_plan = plan
+        return plan
+
+    @classmethod
+    def _build_serialization_plan(cls) -> SerializationPlan:
+        model_extra = cls.model_config.get("json_schema_extra") or {}
+        model_iri = model_extra.get("$IRI")
+        fields = []
+        for field_name, field_info in cls.model_fields.items():
+            field_extra = field_info.json_schema_extra or {}
+            if RDF_KEY not in field_extra:
+                continue
+            rdf_type = field_extra.get(RDF_TYPE_KEY)
+            bind_namespace = field_extra.get(BIND_NAMESPACE_KEY)
+            if bind_namespace:
+                bind_namespace = (bind_namespace[0], URIRef(bind_namespace[1]))
+            temporal = rdf_type == DATETIME_LITERAL_TYPE
+            if temporal:
+                # values matching no temporal type are reported by the serialization session instead of logged
+                converter = cls._temporal_literal
+            else:
+                converter = None if rdf_type is None else cls._resolve_converter(rdf_type)
+            fields.append(FieldSerializationPlan(
+                name=field_name,
+                predicate=field_extra[RDF_KEY],
+                rdf_type=rdf_type,
+                converter=converter,
+                bind_namespace=bind_namespace,
+                kind=_field_kind(field_info.annotation),
+                model=cls.__name__,
+                temporal=temporal
+            ))
+        return SerializationPlan(model=cls.__name__,
+                                 rdf_type=None if model_iri is None else URIRef(model_iri),
+                                 prefix=model_extra.get("$prefix"),
+                                 namespace=model_extra.get("$namespace"),
+                                 fields=tuple(fields))
+
+    @classmethod
+    def _resolve_converter(cls, rdf_type: str) -> Callable[[Any], Union[URIRef, Literal]]:
+        """Resolves `rdf_type` of a field schema to a callable converting a field value to an rdflib term"""
+        if not isinstance(rdf_type, str):
+            return _raising_converter(RDFModelError(f"{rdf_type} does not match any of allowed types.\n"
+                                                    f"Expected types: 'literal', 'uri' or one of XSD types formatted "
+                                                    f"`xsd:<type>`"))
+        if rdf_type.startswith("xsd:"):
+            xsd_attribute = getattr(XSD, rdf_type.split(":")[-1])
+
+            def convert_xsd(value: Any) -> Literal:
+                return literal_term(value, datatype=xsd_attribute)
+            return convert_xsd
+        if rdf_type in ("literal", "rdfs_literal"):
+            return literal_term
+        elif rdf_type == "uri":
+            return _uri_converter
+        elif rdf_type == DATETIME_LITERAL_TYPE:
+            return cls._convert_to_datetime_literal
+        else:
+            return _raising_converter(RDFModelError(f"{rdf_type} does not match any of allowed types.\n"
+                                                    f"Expected types: 'literal', 'uri' or one of XSD types formatted "
+                                                    f"`xsd:<type>`"))
+
+    _parsing_index: ClassVar[Optional[Dict[URIRef, FieldParsingPlan]]] = None
+
+    @classmethod
+    def parsing_index(cls) -> Dict[URIRef, FieldParsingPlan]:
+        """
+        Returns the reverse index of the model, mapping RDF predicates to instructions for reading field values, used
+        by `from_graph`. The index is built once per class on first use from the same field schema as
+        `serialization_plan`. If several fields share a predicate, values are read into the first one, see
+        `shared_predicates`.
+        :return: dictionary with predicates as keys and FieldParsingPlan as values
+        """
+        index = cls.__dict__.get("_parsing_index")
+        if index is None:
+            index = cls._build_parsing_index()
+            cls._parsing_index = index
+        return index
+
+    @classmethod
+    def _build_parsing_index(cls) -> Dict[URIRef, FieldParsingPlan]:
+        index = {}
+        field_plans = cls._field_parsing_plans()
+        for field_plan in cls.serialization_plan().fields:
+            index.setdefault(field_plan.predicate, field_plans[field_plan.name])
+        return index
+
+    _shared_predicates: ClassVar[Optional[Dict[URIRef, Tuple[str, ...]]]] = None
+
+    @classmethod
+    def shared_predicates(cls) -> Dict[URIRef, Tuple[str, ...]]:
+        """
+        Returns the predicates shared by several fields of the model, e.g. dct:conformsTo of `conforms_to` and
+        `application_profile` of HRIDataService. `from_graph` cannot tell their values apart and reads them into the
+        first field, the others stay empty.
+        :return: dictionary with predicates as keys and names of the fields sharing them, in field order, as values
+        """
+        shared = cls.__dict__.get("_shared_predicates")
+        if shared is None:
+            names: Dict[URIRef, List[str]] = {}
+            for field_plan in cls.serialization_plan().fields:
+                names.setdefault(field_plan.predicate, []).append(field_plan.name)
+            shared = {predicate: tuple(fields) for predicate, fields in names.items() if len(fields) > 1}
+            cls._shared_predicates = shared
+        return shared
+
+    _field_parsing_plans_cache: ClassVar[Optional[Dict[str, FieldParsingPlan]]] = None
+
+    @classmethod
+    def _field_parsing_plans(cls) -> Dict[str, FieldParsingPlan]:
+        """Returns FieldParsingPlan of every RDF field of the model by field name, built once per class"""
+        plans = cls.__dict__.get("_field_parsing_plans_cache")
+        if plans is not None:
+            return plans
+        plans = {}
+        literal_fields = getattr(cls, "_validate_literal_fields", set())
+        for field_plan in cls.serialization_plan().fields:
+            annotation = cls.model_fields[field_plan.name].annotation
+            classes = [x for x in _annotation_classes(annotation) if isinstance(x, type) and x is not type(None)]
+            datatype = None
+            if isinstance(field_plan.rdf_type, str) and field_plan.rdf_type.startswith("xsd:"):
+                datatype = getattr(XSD, field_plan.rdf_type.split(":")[-1])
+            plans[field_plan.name] = FieldParsingPlan(
+                name=field_plan.name,
+                is_list=_is_list_annotation(annotation),
+                nested=tuple(x for x in classes if issubclass(x, RDFModel)),
+                literal_field=any(issubclass(x, LiteralField) for x in classes),
+                accepts_str=any(issubclass(x, str) for x in classes),
+                value_types=tuple(x for x in classes if not issubclass(x, (RDFModel, LiteralField))),
+                datatype=datatype,
+                rdf_type=field_plan.rdf_type,
+                force_literal=field_plan.name in literal_fields
+            )
+        cls._field_parsing_plans_cache = plans
+        return plans
+
+    _trusted_construction_plan: ClassVar[Optional[TrustedConstructionPlan]] = None
+
+    @classmethod
+    def construct_trusted(cls,
+                          data: Dict[str, Any],
+                          nested_models: Optional[Dict[Type["RDFModel"], Type["RDFModel"]]] = None) -> "RDFModel":
+        """
+        Creates a model instance from trusted, already validated data without running validation, e.g. for records
+        read back from a store they were validated for. Expects data in the shape of `model_dump()`: nested models
+        and LiteralField values may be given as dictionaries and are constructed recursively (dictionaries with
+        LiteralField keys only become LiteralField if the field allows it, other nested dictionaries the first
+        RDFModel class of the field annotation), strings in fields converted to LiteralField on validation
+        (`_validate_literal_fields`) are converted as well. Values are NOT checked nor normalised (e.g. emails are
+        not converted to `mailto:` URIs), invalid data leads to an invalid instance. Instances are created from a
+        per-class `trusted_construction_plan`, without the per-field work of `model_construct`.
+        :param data: field values by field name
+        :param nested_models: optional substitutions of nested model classes, as for `from_graph`
+        :return: model instance
+        """
+        plan = cls.trusted_construction_plan()
+        nested_models = nested_models or {}
+        converters = plan.converters
+        values = plan.defaults.copy()
+        fields_set = set(plan.fields.intersection(data))
+        for name in fields_set:
+            value = data[name]
+            converter = converters.get(name)
+            values[name] = value if converter is None or value is None else converter(value, nested_models)
+        for name, factory in plan.default_factories.items():
+            if name not in fields_set:
+                values[name] = factory()
+        for name in plan.required.difference(fields_set):
+            del values[name]
+        if not plan.direct:
+            return cls.model_construct(_fields_set=fields_set, **values)
+        return _new_instance(cls, values, fields_set)
+
+    @classmethod
+    def trusted_construction_plan(cls) -> TrustedConstructionPlan:
+        """Returns the TrustedConstructionPlan of the model, built once per class"""
+        plan = cls.__dict__.get("_trusted_construction_plan")
+        if plan is not None:
+            return plan
+        _ensure_built(cls)
+        defaults = {}
+        default_factories = {}
+        required = set()
+        for name, field_info in cls.model_fields.items():
+            defaults[name] = None
+            if field_info.default_factory is not None:
+                default_factories[name] = field_info.default_factory
+            elif field_info.default is PydanticUndefined:
+                required.add(name)
+            elif isinstance(field_info.default, (list, dict, set, BaseModel)):
+                default_factories[name] = _copied_default(field_info.default)
+            else:
+                defaults[name] = field_info.default
+        converters = {}
+        for name, field in cls._field_parsing_plans().items():
+            converter = _trusted_converter(field)
+            if converter is not None:
+                converters[name] = converter
+        direct = not cls.__private_attributes__ and cls.model_config.get("extra") != "allow" and \
+            cls.model_post_init is BaseModel.model_post_init
+        plan = TrustedConstructionPlan(fields=frozenset(cls.model_fields), defaults=defaults,
+                                       default_factories=default_factories, required=frozenset(required),
+                                       converters=converters, direct=direct)
+        cls._trusted_construction_plan = plan
+        return plan
+
+    _list_adapter: ClassVar[Optional[TypeAdapter]] = None
+
+    @classmethod
+    def list_adapter(cls) -> TypeAdapter:
+        """
+        Returns the TypeAdapter validating lists of the model used by `validate_many`, built once per class on first
+        use
+        :return: TypeAdapter of List[cls]
+        """
+        adapter = cls.__dict__.get("_list_adapter")
+        if adapter is None:
+            adapter = TypeAdapter(List[cls])
+            cls._list_adapter = adapter
+        return adapter
+
+    _jsonld_context: ClassVar[Optional[Dict[str, Any]]] = None
+
+    @classmethod
+    def jsonld_context(cls) -> Dict[str, Any]:
+        """
+        Returns the JSON-LD @context of the model used by `to_jsonld`: the `$prefix` of the model and namespaces
+        bound by its fields as prefixes, and a term definition per RDF field with the `rdf_term` as @id, the
+        `rdf_type` as type coercion and a @set container for list fields. The context is built once per class on
+        first use and shared between all documents, it must not be modified.
+        :return: JSON-LD context dictionary
+        """
+        context = cls.__dict__.get("_jsonld_context")
+        if context is None:
+            context = cls._build_jsonld_context()
+            cls._jsonld_context = context
+        return context
+
+    @classmethod
+    def _build_jsonld_context(cls) -> Dict[str, Any]:
+        plan = cls.serialization_plan()
+        context = {}
+        if plan.prefix and plan.namespace:
+            context[plan.prefix] = str(plan.namespace)
+        for field_plan in plan.fields:
+            if field_plan.bind_namespace:
+                context.setdefault(field_plan.bind_namespace[0], str(field_plan.bind_namespace[1]))
+        for field_plan in plan.fields:
+            term = {"@id": str(field_plan.predicate)}
+            coercion = _jsonld_coercion(field_plan.rdf_type)
+            if coercion is not None:
+                term["@type"] = coercion
+            if _is_list_annotation(cls.model_fields[field_plan.name].annotation):
+                term["@container"] = "@set"
+            context[field_plan.name] = term
+        return context
+
+    @classmethod
+    def from_graph(cls,
+                   graph: Graph,
+                   subject: Union[URIRef, BNode],
+                   nested_models: Optional[Dict[Type["RDFModel"], Type["RDFModel"]]] = None) -> "RDFModel":
+        """
+        Creates a model instance from the triples of a subject in a graph. Triples of the subject are read in a single
+        pass and matched to fields with `parsing_index`, nested nodes typed as (or, for blank nodes, allowed as) a
+        nested model of a field are parsed recursively. Predicates not corresponding to any field are ignored, values
+        of predicates shared by several fields (`shared_predicates`) are read into the first of them with a warning.
+        :param graph: graph to read from
+        :param subject: subject of the model
+        :param nested_models: optional substitutions of nested model classes, e.g.
+        `{HEALTHDCATAPDistribution: HRIDistribution}` to read distributions of an HRIDataset as HRIDistribution
+        :return: validated model instance
+        """
+        return cls._from_graph(graph=graph, subject=subject, nested_models=nested_models or {}, parents=frozenset())
+
+    @classmethod
+    def _from_graph(cls,
+                    graph: Graph,
+                    subject: Union[URIRef, BNode],
+                    nested_models: Dict[Type["RDFModel"], Type["RDFModel"]],
+                    parents: FrozenSet[Node]) -> "RDFModel":
+        index = cls.parsing_index()
+        shared = cls.shared_predicates()
+        parents = parents | {subject}
+        values: Dict[str, List[Any]] = {}
+        for predicate, graph_object in graph.predicate_objects(subject):
+            field = index.get(predicate)
+            if field is None:
+                continue
+            if predicate in shared:
+                logger.warning(f"Predicate {predicate} is shared by fields {', '.join(shared[predicate])} of "
+                               f"{cls.__name__}, its value {graph_object} is read into '{field.name}'")
+            values.setdefault(field.name, []).append(cls._parse_graph_object(graph=graph,
+                                                                             graph_object=graph_object,
+                                                                             field=field,
+                                                                             nested_models=nested_models,
+                                                                             parents=parents))
+        data = {}
+        for field in index.values():
+            field_values = values.get(field.name)
+            if not field_values:
+                continue
+            if field.is_list:
+                data[field.name] = field_values
+            else:
+                if len(field_values) > 1:
+                    logger.warning(f"{len(field_values)} values found for single-valued field '{field.name}' of "
+                                   f"{cls.__name__}, only the first one is used")
+                data[field.name] = field_values[0]
+        return cls.model_validate(data)
+
+    @staticmethod
+    def _parse_graph_object(graph: Graph,
+                            graph_object: Node,
+                            field: FieldParsingPlan,
+                            nested_models: Dict[Type["RDFModel"], Type["RDFModel"]],
+                            parents: FrozenSet[Node]) -> Any:
+        if isinstance(graph_object, Literal):
+            return RDFModel._parse_literal(graph_object, field)
+        if field.nested and graph_object not in parents:
+            candidates = [nested_models.get(x, x) for x in field.nested]
+            node_types = set(graph.objects(graph_object, RDF.type))
+            for nested_model in candidates:
+                if nested_model.serialization_plan().rdf_type in node_types:
+                    return nested_model._from_graph(graph=graph,
+                                                    subject=graph_object,
+                                                    nested_models=nested_models,
+                                                    parents=parents)
+            if isinstance(graph_object, BNode):
+                return candidates[0]._from_graph(graph=graph,
+                                                 subject=graph_object,
+                                                 nested_models=nested_models,
+                                                 parents=parents)
+        if isinstance(graph_object, URIRef) and not any(issubclass(x, (Enum, Node)) for x in field.value_types):
+            # a URIRef never equals a plain string, which typing.Literal annotations (e.g. hasTRS) compare to
+            return str(graph_object)
+        return graph_object
+
+    @staticmethod
+    def _parse_literal(literal: Literal, field: FieldParsingPlan) -> Any:
+        if field.datatype is not None and literal.datatype == field.datatype or \
+                field.rdf_type == "datetime_literal" and literal.datatype in (XSD.date, XSD.dateTime,
+                                                                              XSD.dateTimeStamp):
+            value = literal.toPython()
+            if field.value_types and isinstance(value, field.value_types) and not isinstance(value, Literal):
+                return value
+        if field.literal_field and (not field.accepts_str or literal.language or
+                                    literal.datatype not in (None, XSD.string)):
+            literal_data = {"value": str(literal)}
+            if literal.language:
+                literal_data["language"] = literal.language
+            elif literal.datatype:
+                literal_data["datatype"] = literal.datatype
+            return LiteralField(**literal_data)
+        return str(literal)
+
     def to_graph_node(self,
                       graph: Graph,
                       subject: Union[URIRef, BNode],
                       node_predicate: URIRef,
                       node_type: Union[URIRef, List[URIRef]]) -> Graph:
+        session = SerializationSession(graph)
+        for triple in self._iter_node_triples(subject=subject,
+                                              node_predicate=node_predicate,
+                                              node_type=node_type,
+                                              session=session):
+            graph.add(triple)
+        return graph
+
+    def to_graph(self,
+                 subject: Union[URIRef, BNode],
+                 graph: Optional[Graph] = None,
+                 session: Optional[SerializationSession] = None) -> Graph:
+        """
+        Converts the model to an RDF graph
+        :param subject: subject of the model
+        :param graph: optional existing graph (or a graph backed by any rdflib store) to add the triples to, a new
+        graph is created if not provided
+        :param session: optional serialization session shared between several calls, e.g. to bind namespaces to
+        the target graph only once, its graph is used as target graph
+        :return: the graph containing the model triples
+        """
+        session = _graph_session(graph=graph, session=session)
+        graph = session.graph
+        plan = self.serialization_plan()
+        graph.add((subject, RDF.type, plan.rdf_type))
+        session.bind(plan.prefix, plan.namespace)
+        for triple in self._iter_field_triples(node=subject, session=session):
+            graph.add(triple)
+        return graph
+
+    def iter_triples(self,
+                     subject: Union[URIRef, BNode],
+                     graph_name: Optional[Union[URIRef, BNode]] = None,
+                     session: Optional[SerializationSession] = None) -> Iterator[Tuple[Node, ...]]:
+        """
+        Lazily yields the triples describing the model, walking nested models as they are reached, without
+        building an intermediate rdflib.Graph
+        :param subject: subject of the model
+        :param graph_name: optional graph name, if provided quads (subject, predicate, object, graph_name) are yielded
+        :param session: optional serialization session shared between several calls
+        :return: iterator over triples or quads
+        """
+        if session is None:
+            session = SerializationSession()
+        triples = itertools.chain([(subject, RDF.type, self.serialization_plan().rdf_type)],
+                                  self._iter_field_triples(node=subject, session=session))
+        if graph_name is None:
+            yield from triples
+        else:
+            for triple_subject, triple_predicate, triple_object in triples:
+                yield triple_subject, triple_predicate, triple_object, graph_name
+
+    def write_ntriples(self,
+                       fileobj: IO,
+                       subject: Union[URIRef, BNode],
+                       graph_name: Optional[Union[URIRef, BNode]] = None,
+                       session: Optional[SerializationSession] = None) -> int:
+        """
+        Streams the model to a file-like object as N-Triples, or as N-Quads if a graph name is provided. Both text
+        and binary file objects are supported, binary ones (e.g. opened with `gzip.open(path, "wb")`) receive UTF-8.
+        :param fileobj: file-like object to write to
+        :param subject: subject of the model
+        :param graph_name: optional graph name to write N-Quads
+        :param session: optional serialization session shared between several calls
+        :return: number of statements written
+        """
+        binary = not isinstance(fileobj, io.TextIOBase)
+        count = 0
+        for statement in self.iter_triples(subject=subject, graph_name=graph_name, session=session):
+            line = ntriples_line(statement)
+            fileobj.write(line.encode("utf-8") if binary else line)
+            count += 1
+        return count
+
+    def __setstate__(self, state: Dict[Any, Any]) -> None:
+        _ensure_built(type(self))
+        super().__setstate__(state)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if id(self) in _field_changes:
+            _record_changes(self, (name,))
+
+    def mark_changed(self, *field_names: str) -> None:
+        """
+        Marks fields as changed for `graph_delta`. Assignments are detected automatically, in place modifications of
+        field values (e.g. appending to a list) are not and have to be marked explicitly.
+        :param field_names: names of the changed fields
+        """
+        _track_changes(self)
+        _record_changes(self, field_names)
+
+    def graph_delta(self, subject: Union[URIRef, BNode], skolem_base: Optional[str] = None) -> GraphDelta:
+        """
+        Returns the triples to remove and to add to bring the previous serialization of the model in line with its
+        current state. Only fields assigned since the previous call, or containing nested models with assigned fields,
+        are serialized again. The first call (or a call with another subject) returns the full description of the
+        model as added triples and records it as the baseline for the next calls. Nested nodes are identified by
+        content (see `SerializationSession(content_ids=True)`), so unchanged nested nodes keep their identifiers.
+        :param subject: subject of the model
+        :param skolem_base: optional base of skolem IRIs used instead of blank nodes for nested nodes
+        :return: GraphDelta
+        """
+        plan = self.serialization_plan()
+        values = self.__dict__
+        session = SerializationSession(content_ids=True, skolem_base=skolem_base)
+        baseline = _baselines.get(id(self))
+        if baseline is None or baseline.subject != subject or baseline.skolem_base != skolem_base:
+            removed = []
+            if baseline is not None:
+                removed.append((baseline.subject, RDF.type, plan.rdf_type))
+                removed.extend(itertools.chain.from_iterable(baseline.field_triples.values()))
+            field_triples = {x.name: self._field_triples(subject, x, values.get(x.name), session) for x in plan.fields}
+            _track_changes(self)
+            _baselines[id(self)] = _SerializationBaseline(subject=subject,
+                                                          skolem_base=skolem_base,
+                                                          field_triples=field_triples,
+                                                          stamp=next(_change_stamps))
+            added = [(subject, RDF.type, plan.rdf_type)]
+            added.extend(itertools.chain.from_iterable(field_triples.values()))
+            return GraphDelta(removed=removed, added=added)
+        field_changes = _field_changes[id(self)]
+        removed, added = [], []
+        for field_plan in plan.fields:
+            value = values.get(field_plan.name)
+            if (field_changes.get(field_plan.name, 0) <= baseline.stamp
+                    and not any(_changed_since(x, baseline.stamp) for x in _field_models(value))):
+                continue
+            old_triples = baseline.field_triples[field_plan.name]
+            new_triples = self._field_triples(subject, field_plan, value, session)
+            old_set, new_set = set(old_triples), set(new_triples)
+            removed.extend(x for x in old_triples if x not in new_set)
+            added.extend(x for x in new_triples if x not in old_set)
+            baseline.field_triples[field_plan.name] = new_triples
+        if removed:
+            # nested nodes are identified by content, fields may share a node the changed field no longer links to
+            current = set(itertools.chain.from_iterable(baseline.field_triples.values()))
+            removed = [x for x in dict.fromkeys(removed) if x not in current]
+        added = list(dict.fromkeys(added))
+        # models nested since the previous call are tracked from now on
+        _track_changes(self)
+        _baselines[id(self)] = baseline._replace(stamp=next(_change_stamps))
+        return GraphDelta(removed=removed, added=added)
+
+    def _field_triples(self,
+                       subject: Union[URIRef, BNode],
+                       field_plan: FieldSerializationPlan,
+                       value: Any,
+                       session: SerializationSession) -> List[Tuple[Node, Node, Node]]:
+        if not value:
+            return []
+        return list(self._iter_values_triples(node=subject,
+                                              field_plan=field_plan,
+                                              values=value if isinstance(value, list) else [value],
+                                              session=session))
+
+    def _nested_models(self) -> Iterator["RDFModel"]:
+        values = self.__dict__
+        for field_plan in self.serialization_plan().fields:
+            if field_plan.kind != VALUE_KIND:
+                yield from _field_models(values.get(field_plan.name))
+
+    def to_jsonld(self, subject: Optional[Union[URIRef, BNode]] = None) -> Dict[str, Any]:
+        """
+        Converts the model to a compacted JSON-LD document directly from the field values, without building an
+        intermediate graph. The document uses the shared `jsonld_context` of the model class, nested models of other
+        classes carry the context of their class.
+        :param subject: optional subject of the model, the document describes a blank node if not provided
+        :return: JSON-LD document as a dictionary, ready to be dumped with `json.dumps`
+        """
+        return self._jsonld_node(subject=subject, context_class=None)
+
+    def _jsonld_node(self,
+                     subject: Optional[Union[URIRef, BNode]],
+                     context_class: Optional[Type["RDFModel"]]) -> Dict[str, Any]:
+        plan = self.serialization_plan()
+        context = self.jsonld_context()
+        node = {}
+        if context_class is not type(self):
+            node["@context"] = context
+        if subject is not None:
+            node["@id"] = f"_:{subject}" if isinstance(subject, BNode) else str(subject)
+        if plan.rdf_type is not None:
+            node_type = str(plan.rdf_type)
+            if plan.prefix and context.get(plan.prefix) == str(plan.namespace) and \
+                    node_type.startswith(str(plan.namespace)):
+                node_type = f"{plan.prefix}:{node_type[len(str(plan.namespace)):]}"
+            node["@type"] = node_type
+        values = self.__dict__
+        for field_plan in plan.fields:
+            value = values.get(field_plan.name)
+            if not value:
+                continue
+            coercion = context[field_plan.name].get("@type")
+            items = [self._jsonld_value(item, field_plan, coercion) for item in
+                     (value if isinstance(value, list) else [value])]
+            node[field_plan.name] = items if isinstance(value, list) else items[0]
+        return node
+
+    def _jsonld_value(self, item: Any, field_plan: FieldSerializationPlan, coercion: Optional[str]) -> Any:
+        if field_plan.kind != VALUE_KIND and isinstance(item, RDFModel):
+            return item._jsonld_node(subject=None, context_class=type(self))
+        if field_plan.kind != VALUE_KIND and isinstance(item, LiteralField):
+            return _jsonld_literal(item.to_literal(), coercion)
+        if field_plan.converter is None:
+            logger.warning(f"No {RDF_TYPE_KEY} provided in schema, that may cause errors")
+            term = item if isinstance(item, Node) else Literal(item)
+        else:
+            term = field_plan.converter(item)
+            if field_plan.temporal and term.datatype is None:
+                logger.warning(f"{item} does not match any of gYear, gYearMonth, date or dateTime patterns")
+        if isinstance(term, Literal):
+            return _jsonld_literal(term, coercion)
+        if isinstance(term, BNode):
+            return {"@id": f"_:{term}"}
+        return str(term) if coercion == "@id" else {"@id": str(term)}
+
+    def _iter_node_triples(self,
+                           subject: Union[URIRef, BNode],
+                           node_predicate: URIRef,
+                           node_type: Union[URIRef, List[URIRef]],
+                           session: SerializationSession) -> Iterator[Tuple[Node, Node, Node]]:
+        if session.content_ids:
+            yield from self._iter_content_node_triples(subject=subject,
+                                                       node_predicate=node_predicate,
+                                                       node_type=node_type,
+                                                       session=session)
+            return
         node_to_add = BNode()
-        graph.add((subject, node_predicate, node_to_add))
-        graph = self._check_and_add_namespaces(graph)
+        yield subject, node_predicate, node_to_add
+        plan = self.serialization_plan()
+        session.bind(plan.prefix, plan.namespace)
         if isinstance(node_type, URIRef):
             node_type = [node_type]
         for n_type in node_type:
-            graph.add((node_to_add, RDF.type, n_type))
-        self._add_fields_to_graph(graph=graph, node_to_add=node_to_add)
-        return graph
+            yield node_to_add, RDF.type, n_type
+        yield from self._iter_field_triples(node=node_to_add, session=session)
 
-    def to_graph(self, subject):
-        graph = Graph(bind_namespaces="rdflib")
-        graph.add((subject, RDF.type, URIRef(self.model_config["json_schema_extra"]["$IRI"])))
-        graph = self._check_and_add_namespaces(graph)
-        self._add_fields_to_graph(graph=graph, node_to_add=subject)
-        return graph
+    def _iter_content_node_triples(self,
+                                   subject: Union[URIRef, BNode],
+                                   node_predicate: URIRef,
+                                   node_type: Union[URIRef, List[URIRef]],
+                                   session: SerializationSession) -> Iterator[Tuple[Node, Node, Node]]:
+        """
+        Yields triples of a nested node identified by a hash of its content. The triples of the node are buffered
+        to compute the hash, nested nodes are hashed first, so a node identifier covers the whole subtree.
+        """
+        plan = self.serialization_plan()
+        session.bind(plan.prefix, plan.namespace)
+        if isinstance(node_type, URIRef):
+            node_type = [node_type]
+        placeholder = BNode()
+        triples = list(self._iter_field_triples(node=placeholder, session=session))
+        statements = [f"{ntriples_term(p)} {ntriples_term(o)}" for s, p, o in triples if s is placeholder]
+        node_to_add = session.content_node(node_type=node_type, statements=statements)
+        yield subject, node_predicate, node_to_add
+        if session.deduplicate and session.is_emitted(node_to_add):
+            return
+        for n_type in node_type:
+            yield node_to_add, RDF.type, n_type
+        for triple_subject, triple_predicate, triple_object in triples:
+            yield (node_to_add if triple_subject is placeholder else triple_subject), triple_predicate, triple_object
 
-    def _check_and_add_namespaces(self, graph):
-        if self.model_config["json_schema_extra"]["$namespace"] not in [x[1] for x in graph.namespaces()]:
-            graph.bind(self.model_config["json_schema_extra"]["$prefix"],
-                       self.model_config["json_schema_extra"]["$namespace"])
-        return graph
+    def _iter_field_triples(self,
+                            node: Union[URIRef, BNode],
+                            session: SerializationSession) -> Iterator[Tuple[Node, Node, Node]]:
+        if session.profiler is not None:
+            yield from session.profiler.profile_model(self, node=node, session=session)
+            return
+        # field values are read from __dict__ directly, as `iter(self)` does, to not trigger deprecation warnings
+        values = self.__dict__
+        for field_plan in self.serialization_plan().fields:
+            value = values.get(field_plan.name)
+            if not value:
+                continue
+            if not isinstance(value, list):
+                value = [value]
+            yield from self._iter_values_triples(node=node, field_plan=field_plan, values=value, session=session)
 
-    def _add_fields_to_graph(self, graph, node_to_add):
-        for field, value in iter(self):
-            if value:
-                rdf_predicate = self.model_fields[field].json_schema_extra[RDF_KEY]
-                rdf_type = self.model_fields[field].json_schema_extra.get(RDF_TYPE_KEY)
-                bind_namespace = self.model_fields[field].json_schema_extra.get(BIND_NAMESPACE_KEY)
-                if not isinstance(value, List):
-                    value = [value]
-                for item in value:
-                    if issubclass(type(item), RDFModel):
-                        item.to_graph_node(graph=graph,
-                                           subject=node_to_add,
-                                           node_predicate=rdf_predicate,
-                                           node_type=item.model_config["json_schema_extra"]["$IRI"])
-                    elif issubclass(type(item), LiteralField):
-                        item.flatten_to_literal(graph=graph,
-                                                subject=node_to_add,
-                                                node_predicate=rdf_predicate)
-                    else:
-                        if rdf_type is None:
-                            logger.warning(f"No {RDF_TYPE_KEY} provided in schema, that may cause errors")
-                        else:
-                            item = self._convert_to_rdf_type(rdf_type, item)
-                        graph.add((node_to_add, rdf_predicate, item))
-                    if bind_namespace:
-                        graph.bind(bind_namespace[0], URIRef(bind_namespace[1]))
+    @staticmethod
+    def _iter_values_triples(node: Union[URIRef, BNode],
+                             field_plan: FieldSerializationPlan,
+                             values: List[Any],
+                             session: SerializationSession) -> Iterator[Tuple[Node, Node, Node]]:
+        rdf_predicate = field_plan.predicate
+        for item in values:
+            if field_plan.kind != VALUE_KIND and isinstance(item, RDFModel):
+                yield from item._iter_node_triples(subject=node,
+                                                   node_predicate=rdf_predicate,
+                                                   node_type=item.serialization_plan().rdf_type,
+                                                   session=session)
+            elif field_plan.kind != VALUE_KIND and isinstance(item, LiteralField):
+                yield node, rdf_predicate, item.to_literal()
+            elif field_plan.converter is None:
+                session.warn(field_plan, MISSING_RDF_TYPE,
+                             f"No {RDF_TYPE_KEY} provided in schema of {field_plan.model}.{field_plan.name}, "
+                             f"that may cause errors")
+                # values are emitted as plain literals, rdflib terms as they are
+                yield node, rdf_predicate, item if isinstance(item, Node) else Literal(item)
+            else:
+                term = field_plan.converter(item)
+                if field_plan.temporal and term.datatype is None:
+                    session.warn(field_plan, UNKNOWN_TEMPORAL_FORMAT,
+                                 f"{item} does not match any of gYear, gYearMonth, date or dateTime patterns")
+                yield node, rdf_predicate, term
+            if field_plan.bind_namespace:
+                session.bind(*field_plan.bind_namespace)
 
     @staticmethod
     def _convert_to_datetime_literal(value: Union[str, date, datetime, AwareDatetime, NaiveDatetime]) -> Literal:
+        literal = RDFModel._temporal_literal(value)
+        if literal.datatype is None:
+            logger.warning(f"{value} does not match any of gYear, gYearMonth, date or dateTime patterns")
+        return literal
+
+    @staticmethod
+    def _temporal_literal(value: Union[str, date, datetime, AwareDatetime, NaiveDatetime]) -> Literal:
+        """Converts a temporal value to a literal, strings matching no XSD temporal type are left untyped"""
         literal_format = None
         if isinstance(value, (datetime, AwareDatetime, NaiveDatetime)):
             literal_format = XSD.dateTime
@@ -222,32 +1364,16 @@ class RDFModel(BaseModel):
             literal_format = XSD.date
             value = value.isoformat()
         elif isinstance(value, str):
-            if re.match(year_month_pattern, value):
-                literal_format = XSD.gYearMonth
-            elif re.match(year_pattern, value):
-                literal_format = XSD.gYear
-            else:
-                logging.warning(f"{str} does not match neither gYear nor gYearMonth pattern")
+            literal_format = classify_temporal(value)
+            if literal_format == XSD.dateTimeStamp:
+                literal_format = XSD.dateTime
         else:
             raise TypeError(f"Value {value} is of unsupported type {type(value)}, either str, date, datetime, "
                             f"pydantic.AwareDatetime or pydantic.NaiveDatetime are expected")
-        return Literal(value, datatype=literal_format)
+        return literal_term(value, datatype=literal_format)
 
     def _convert_to_rdf_type(self, rdf_type: str, value: Any) -> Union[URIRef, Literal]:
-        if rdf_type.startswith("xsd:"):
-            xsd_attribute = getattr(XSD, rdf_type.split(":")[-1])
-            return Literal(value, datatype=xsd_attribute)
-        if rdf_type == "literal":
-            return Literal(value)
-        elif rdf_type == "uri":
-            return URIRef(str(value))
-        elif rdf_type == "rdfs_literal":
-            return Literal(value)
-        elif rdf_type == "datetime_literal":
-            return self._convert_to_datetime_literal(value)
-        else:
-            raise RDFModelError(f"{rdf_type} does not match any of allowed types.\n"
-                                f"Expected types: 'literal', 'uri' or one of XSD types formatted `xsd:<type>`")
+        return self._resolve_converter(rdf_type)(value)
 
     @classmethod
     def annotate_model(cls):
@@ -270,21 +1396,111 @@ class RDFModel(BaseModel):
         except (FileNotFoundError, TypeError, AttributeError) as e:
             logger.error(f"Following error occurred while saving model to file: {e}")
 
+    @classmethod
+    def schema_to_string(cls, file_format: typing_Literal["json", "yaml"] = "json") -> str:
+        """
+        Returns the JSON schema of the model in the form written by `save_schema_to_file`
+        :param file_format: either 'json' or 'yaml'
+        :return: str
+        """
+        if file_format not in ["yaml", "json"]:
+            raise TypeError(f"Incorrect file format {file_format}, either 'json' or 'yaml expected")
+        return getattr(cls, f"_dump_{file_format}")(cls.model_json_schema())
+
     @classmethod
     def _save_to_json(cls, path: Union[str, Path], model_schema: Dict):
         with open(path, "w") as schema_file:
-            json.dump(model_schema, schema_file, indent=2)
+            schema_file.write(cls._dump_json(model_schema))
 
     @classmethod
     def _save_to_yaml(cls, path: Union[str, Path], model_schema: Dict):
-        yaml = ruamel.yaml.YAML()
         with open(path, "w") as schema_yaml:
-            model_schema = {key: (str(value) if isinstance(value, (URIRef, DefinedNamespaceMeta)) else value) for
-                            key, value in model_schema.items()}
-            new_defs = {}
-            for def_model_name, def_model_json in (model_schema.get("$defs") or {}).items():
-                new_model_json = {k: (str(v) if isinstance(v, (URIRef, DefinedNamespaceMeta)) else v) for
-                                  k, v in def_model_json.items()}
-                new_defs[def_model_name] = new_model_json
-            model_schema["$defs"] = new_defs
-            yaml.dump(model_schema, schema_yaml)
+            schema_yaml.write(cls._dump_yaml(model_schema))
+
+    @staticmethod
+    def _dump_json(model_schema: Dict) -> str:
+        return json.dumps(model_schema, indent=2)
+
+    @staticmethod
+    def _dump_yaml(model_schema: Dict) -> str:
+        yaml = ruamel.yaml.YAML()
+        model_schema = {key: (str(value) if isinstance(value, (URIRef, DefinedNamespaceMeta)) else value) for
+                        key, value in model_schema.items()}
+        new_defs = {}
+        for def_model_name, def_model_json in (model_schema.get("$defs") or {}).items():
+            new_model_json = {k: (str(v) if isinstance(v, (URIRef, DefinedNamespaceMeta)) else v) for
+                              k, v in def_model_json.items()}
+            new_defs[def_model_name] = new_model_json
+        model_schema["$defs"] = new_defs
+        output = io.StringIO()
+        yaml.dump(model_schema, output)
+        return output.getvalue()
+
+
+def serialize_many(models: Iterable[Tuple[Union[URIRef, BNode], RDFModel]],
+                   graph: Optional[Graph] = None,
+                   session: Optional[SerializationSession] = None) -> Graph:
+    """
+    Serializes a number of models into a single graph, the graph is created and its namespaces are bound only once,
+    and triples are added to it directly instead of merging per-model graphs
+    :param models: iterable of (subject, model) pairs
+    :param graph: optional existing graph (or a graph backed by any rdflib store) to add the triples to
+    :param session: optional serialization session, e.g. to deduplicate nested nodes shared between the models
+    :return: the graph containing triples of all models
+    """
+    session = _graph_session(graph=graph, session=session)
+    for subject, model in models:
+        model.to_graph(subject, session=session)
+    return session.graph
+
+
+class ValidationResult(NamedTuple):
+    """
+    Outcome of the validation of a batch of records by `validate_many`
+    Attributes
+    ----------
+    models : List[RDFModel]
+        instances of the valid records, in input order
+    indexes : List[int]
+        indexes of the valid records in the input, parallel to `models`
+    errors : Dict[int, List[Dict[str, Any]]]
+        indexes of the invalid records mapped to their errors in pydantic `ValidationError.errors()` format, without
+        the input values and with `loc` relative to the record
+    """
+    models: List[RDFModel]
+    indexes: List[int]
+    errors: Dict[int, List[Dict[str, Any]]]
+
+
+def validate_many(model_cls: Type[RDFModel],
+                  records: Iterable[Any],
+                  on_error: typing_Literal["collect", "raise"] = "collect") -> ValidationResult:
+    """
+    Validates a batch of records at once with a TypeAdapter of List[model_cls], looping over the records in
+    pydantic-core instead of Python. If the batch contains invalid records their errors are collected per record and
+    the remaining records are validated again, the valid instances are returned either way.
+    :param model_cls: model class, e.g. HRIDataset, HRIDistribution or DCATDataset
+    :param records: dictionaries or model instances
+    :param on_error: 'collect' to return errors of invalid records in the result, 'raise' to raise the
+    ValidationError of the batch
+    :return: ValidationResult
+    :raises: ValidationError if a record is invalid and `on_error` is 'raise'
+    """
+    if on_error not in ("collect", "raise"):
+        raise ValueError(f"on_error should be 'collect' or 'raise', got '{on_error}'")
+    records = list(records)
+    adapter = model_cls.list_adapter()
+    try:
+        return ValidationResult(models=adapter.validate_python(records), indexes=list(range(len(records))),
+                                errors={})
+    except ValidationError as e:
+        if on_error == "raise":
+            raise
+        errors: Dict[int, List[Dict[str, Any]]] = {}
+        # inputs are left out, they would keep every invalid record in memory
+        for error in e.errors(include_url=False, include_context=False, include_input=False):
+            index, *loc = error["loc"]
+            errors.setdefault(index, []).append({**error, "loc": tuple(loc)})
+    indexes = [x for x in range(len(records)) if x not in errors]
+    return ValidationResult(models=adapter.validate_python([records[x] for x in indexes]), indexes=indexes,
+                            errors=errors)
@@ -0,0 +1,85 @@
+# Copyright 2024 Stichting Health-RI
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import importlib
+import logging
+import pkgutil
+import threading
+from types import ModuleType
+from typing import Iterable, List, Optional, Type
+
+import sempyro
+from sempyro.rdf_model import RDFModel
+
+logger = logging.getLogger("__name__")
+
+
+def iter_modules(package: ModuleType = sempyro) -> Iterable[ModuleType]:
+    """
+    Imports and yields every module of a package, subpackages included
+    :param package: package to walk, sempyro by default
+    :return: iterator over imported modules
+    """
+    for module_info in pkgutil.walk_packages(package.__path__, prefix=f"{package.__name__}."):
+        yield importlib.import_module(module_info.name)
+
+
+def discover_models(package: ModuleType = sempyro) -> List[Type[RDFModel]]:
+    """
+    Imports all modules of a package and returns the RDFModel subclasses defined in them
+    :param package: package to search, sempyro by default
+    :return: list of model classes sorted by module and class name
+    """
+    for _ in iter_modules(package):
+        pass
+    models = set()
+    subclasses = list(RDFModel.__subclasses__())
+    while subclasses:
+        model = subclasses.pop()
+        if model in models:
+            continue
+        models.add(model)
+        subclasses.extend(model.__subclasses__())
+    prefix = f"{package.__name__}."
+    return sorted((x for x in models if x.__module__.startswith(prefix)), key=lambda x: (x.__module__, x.__name__))
+
+
+def _build_models(models: Optional[Iterable[Type[RDFModel]]]) -> None:
+    for model in (discover_models() if models is None else models):
+        model.model_rebuild()
+        model.serialization_plan()
+        model.parsing_index()
+        model.shared_predicates()
+        model.jsonld_context()
+    logger.debug("sempyro models are built")
+
+
+def warmup(models: Optional[Iterable[Type[RDFModel]]] = None,
+           background: bool = False) -> Optional[threading.Thread]:
+    """
+    Builds pydantic validators and serializers of models, which are otherwise built on first use, together with
+    their serialization plans. Long running services can call it at startup to avoid latency of first requests,
+    one-shot tools can skip it and build only the models they use.
+    :param models: model classes to build, all models of sempyro by default (which imports all of them)
+    :param background: if True, models are built in a daemon thread which is returned
+    :return: the started thread if `background` is True, None otherwise
+    """
+    if models is not None:
+        models = list(models)
+    if not background:
+        _build_models(models)
+        return None
+    thread = threading.Thread(target=_build_models, args=(models,), name="sempyro-warmup", daemon=True)
+    thread.start()
+    return thread
@@ -0,0 +1,126 @@
+# Copyright 2024 Stichting Health-RI
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Regenerates JSON and YAML schemas of all sempyro models (the `models/` folder of the repository) in one interpreter.
+Run with `python -m sempyro.schema_export [--output models] [--workers N]`
+"""
+
+import argparse
+import hashlib
+import importlib
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple, Type
+
+from sempyro.rdf_model import RDFModel
+from sempyro.registry import discover_models
+
+logger = logging.getLogger("__name__")
+
+SCHEMA_FORMATS = ("json", "yaml")
+# output folders differing from the name of the subpackage defining the models
+MODEL_FOLDERS = {"healthdcatap": "health_dcat"}
+
+
+class SchemaExportResult(NamedTuple):
+    """
+    Outcome of a schema export
+    Attributes
+    ----------
+    written : List[pathlib.Path]
+        schema files created or changed
+    unchanged : List[pathlib.Path]
+        schema files which content was already up to date and were not rewritten
+    """
+    written: List[Path]
+    unchanged: List[Path]
+
+
+def model_folder(model: Type[RDFModel]) -> str:
+    """
+    Returns the folder of `models/` schemas of a model are written to, named after the sempyro subpackage of the model
+    :param model: model class
+    :return: folder name
+    """
+    subpackage = model.__module__.split(".")[1]
+    return MODEL_FOLDERS.get(subpackage, subpackage)
+
+
+def _render_schemas(model_path: Tuple[str, str]) -> Dict[str, str]:
+    """Renders schemas of a model given by (module, class name) in all formats, runs in a worker process"""
+    module_name, class_name = model_path
+    model = getattr(importlib.import_module(module_name), class_name)
+    return {file_format: model.schema_to_string(file_format) for file_format in SCHEMA_FORMATS}
+
+
+def _write_if_changed(path: Path, content: str) -> bool:
+    """Writes a file unless it already has the same content hash, returns if the file was written"""
+    data = content.encode("utf-8")
+    if path.is_file() and hashlib.sha256(path.read_bytes()).digest() == hashlib.sha256(data).digest():
+        return False
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+    return True
+
+
+def export_schemas(output: Path,
+                   models: Optional[Iterable[Type[RDFModel]]] = None,
+                   workers: Optional[int] = None) -> SchemaExportResult:
+    """
+    Writes JSON and YAML schemas of models to `<output>/<model folder>/<model name>.<format>`, rendering them in a
+    pool of worker processes. Files which content is unchanged are not rewritten.
+    :param output: root folder of the schemas
+    :param models: model classes to export, all sempyro models by default
+    :param workers: number of worker processes, defaults to the number of CPUs, 1 renders in the calling process
+    :return: SchemaExportResult
+    """
+    models = discover_models() if models is None else list(models)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    model_paths = [(x.__module__, x.__name__) for x in models]
+    if workers > 1 and len(model_paths) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            rendered = list(executor.map(_render_schemas, model_paths))
+    else:
+        rendered = [_render_schemas(x) for x in model_paths]
+    result = SchemaExportResult(written=[], unchanged=[])
+    for model, schemas in zip(models, rendered):
+        for file_format, content in schemas.items():
+            path = Path(output, model_folder(model), f"{model.__name__}.{file_format}")
+            if _write_if_changed(path, content):
+                result.written.append(path)
+            else:
+                result.unchanged.append(path)
+    return result
+
+
+def main(argv: Optional[Sequence[str]] = None) -> SchemaExportResult:
+    argument_parser = argparse.ArgumentParser(description=__doc__)
+    argument_parser.add_argument("--output", type=Path, default=Path("models"),
+                                 help="root folder of the schemas, 'models' by default")
+    argument_parser.add_argument("--workers", type=int, default=None,
+                                 help="number of worker processes, the number of CPUs by default")
+    args = argument_parser.parse_args(argv)
+    result = export_schemas(output=args.output, workers=args.workers)
+    for path in result.written:
+        print(f"Written {path}")
+    print(f"{len(result.written)} schema files written, {len(result.unchanged)} unchanged")
+    return result
+
+
+if __name__ == "__main__":
+    main()
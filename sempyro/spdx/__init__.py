@@ -12,9 +12,19 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from .spdx_classes import SPDX, Checksum
+from typing import TYPE_CHECKING
+
+from sempyro.utils.lazy import lazy_loader
+
+if TYPE_CHECKING:
+    from .spdx_classes import SPDX, Checksum
 
 __all__ = (
     "Checksum",
     "SPDX"
 )
+
+__getattr__, __dir__ = lazy_loader(__name__, {
+    "SPDX": ".spdx_classes",
+    "Checksum": ".spdx_classes",
+})
@@ -0,0 +1,355 @@
+# Copyright 2024 Stichting Health-RI
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Seeded generator of synthetic HRI catalogs for load testing. Field values are derived from the field annotations of
+the models (enums, URLs, literals, numbers, dates), so generated models stay valid as models evolve; the catalog
+structure (datasets, distributions, data services, agents, contact points, temporal and spatial coverage) is
+configurable. Every object is generated from its own seeded random generator, so datasets can be produced lazily
+one by one and streamed as JSON or NDJSON without holding the catalog in memory.
+Run with `python -m sempyro.synthetic [--datasets N] [--seed N] [--format json|ndjson] [--output FILE]`
+"""
+
+import argparse
+import random
+import sys
+import typing
+from datetime import date, datetime, timedelta
+from enum import Enum
+from pathlib import Path
+from typing import IO, Any, Callable, Dict, Iterator, List, Optional, Type, Union
+
+from pydantic import AnyUrl
+from pydantic.fields import FieldInfo
+
+from sempyro.geo import Location
+from sempyro.hri_dcat import HRIAgent, HRICatalog, HRIDataService, HRIDataset, HRIDistribution, HRIVCard
+from sempyro.io import dump_json, write_ndjson
+from sempyro.namespaces import GeoSPARQL
+from sempyro.rdf_model import LiteralField, RDFModel, _annotation_classes, _is_list_annotation
+from sempyro.time import PeriodOfTime
+
+WORDS = ("health", "cohort", "patient", "registry", "clinical", "study", "genomic", "imaging", "biobank", "survey",
+         "hospital", "care", "trial", "outcome", "population", "disease", "treatment", "sample", "record", "data")
+
+FILE_TYPES = ("CSV", "JSON", "XML", "TSV", "PARQUET", "ZIP")
+LANGUAGES = ("ENG", "NLD", "DEU", "FRA")
+
+# Values of fields which generic annotation based values would not make sense for, by field name
+FIELD_HINTS: Dict[str, Callable[[random.Random, str], Any]] = {
+    "mbox": lambda rng, key: f"{key.replace('/', '.')}@example.org",
+    "hasEmail": lambda rng, key: f"{key.replace('/', '.')}@example.org",
+    "format": lambda rng, key: f"http://publications.europa.eu/resource/authority/file-type/{rng.choice(FILE_TYPES)}",
+    "language": lambda rng, key: [f"http://publications.europa.eu/resource/authority/language/"
+                                  f"{rng.choice(LANGUAGES)}"],
+    "applicable_legislation": lambda rng, key: ["http://data.europa.eu/eli/reg/2025/327/oj"],
+    "byte_size": lambda rng, key: rng.randint(1, 10 ** 10),
+    "spatial_resolution": lambda rng, key: [round(rng.uniform(1, 1000), 1)],
+    "temporal_resolution": lambda rng, key: f"P{rng.randint(1, 30)}D",
+}
+
+# Nesting depth up to which models are generated for required fields which only allow nested models
+MAX_NESTING = 2
+
+
+def _sentence(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(words)).capitalize()
+
+
+def _date(rng: random.Random) -> date:
+    return date(2000, 1, 1) + timedelta(days=rng.randrange(9000))
+
+
+class CatalogGenerator:
+    """
+    Seeded generator of valid HRICatalog trees
+    Attributes
+    ----------
+    datasets : int
+        number of datasets of the catalog
+    distributions : int
+        number of distributions per dataset
+    services : int
+        number of data services of the catalog
+    agents : int
+        size of the pool of agents used as publishers and creators, at least 1
+    contact_points : int
+        size of the pool of contact points, at least 1
+    temporal_coverage : int
+        number of periods of time per dataset
+    spatial_coverage : int
+        number of locations per dataset
+    optional_fields : float
+        probability between 0 and 1 of filling each optional field of plain values (URLs, literals, enums, numbers
+        and dates)
+    seed : int
+        seed of the generator, equal settings and seeds generate equal catalogs
+    base_iri : str
+        base of generated IRIs
+    """
+    def __init__(self,
+                 datasets: int = 100,
+                 distributions: int = 2,
+                 services: int = 1,
+                 agents: int = 10,
+                 contact_points: int = 10,
+                 temporal_coverage: int = 1,
+                 spatial_coverage: int = 1,
+                 optional_fields: float = 0.3,
+                 seed: int = 0,
+                 base_iri: str = "https://example.org/"):
+        counts = {"datasets": datasets, "distributions": distributions, "services": services,
+                  "temporal_coverage": temporal_coverage, "spatial_coverage": spatial_coverage}
+        for name, value in counts.items():
+            if value < 0:
+                raise ValueError(f"{name} should be 0 or more, got {value}")
+        # agents and contact points are required by datasets and services, their pools cannot be empty
+        for name, value in {"agents": agents, "contact_points": contact_points}.items():
+            if value < 1:
+                raise ValueError(f"{name} should be 1 or more, got {value}")
+        if not 0 <= optional_fields <= 1:
+            raise ValueError(f"optional_fields should be a probability between 0 and 1, got {optional_fields}")
+        self.datasets = datasets
+        self.distributions = distributions
+        self.services = services
+        self.agents = agents
+        self.contact_points = contact_points
+        self.temporal_coverage = temporal_coverage
+        self.spatial_coverage = spatial_coverage
+        self.optional_fields = optional_fields
+        self.seed = seed
+        self.base_iri = base_iri
+        # agents and contact points are shared by many datasets, their pools are bounded by their sizes
+        self._agents: Dict[int, HRIAgent] = {}
+        self._contact_points: Dict[int, HRIVCard] = {}
+
+    def _random(self, key: str) -> random.Random:
+        return random.Random(f"{self.seed}:{key}")
+
+    def _iri(self, key: str) -> str:
+        return f"{self.base_iri}{key}"
+
+    def _value(self, annotation: Any, field_name: str, rng: random.Random, key: str, depth: int) -> Any:
+        """Generates a value for a field annotation, None if the annotation only allows values it can not generate"""
+        if field_name in FIELD_HINTS:
+            value = FIELD_HINTS[field_name](rng, key)
+            if _is_list_annotation(annotation) == isinstance(value, list):
+                return value
+            return value[0] if isinstance(value, list) else [value]
+        if _is_list_annotation(annotation):
+            item_annotation = next(typing.get_args(x)[0] for x in [annotation, *typing.get_args(annotation)]
+                                   if typing.get_origin(x) in (list, List))
+            values = [self._value(item_annotation, field_name, rng, f"{key}/{x}", depth)
+                      for x in range(rng.randint(1, 2))]
+            values = [x for x in values if x is not None]
+            return values or None
+        classes = [x for x in _annotation_classes(annotation) if x is not type(None) and isinstance(x, type)]
+        enums = [x for x in classes if issubclass(x, Enum)]
+        if enums:
+            return rng.choice(list(enums[0]))
+        if any(issubclass(x, (date, datetime)) for x in classes):
+            return _date(rng).isoformat()
+        if any(issubclass(x, AnyUrl) for x in classes):
+            return self._iri(f"{key}/{field_name}")
+        if str in classes or any(issubclass(x, LiteralField) for x in classes):
+            text = _sentence(rng, rng.randint(2, 6))
+            if str in classes and rng.random() < 0.5:
+                return text
+            return LiteralField(value=text, language="en")
+        if bool in classes:
+            return rng.random() < 0.5
+        if int in classes:
+            return rng.randint(0, 10 ** 6)
+        if float in classes:
+            return round(rng.uniform(0, 1000), 2)
+        models = [x for x in classes if issubclass(x, RDFModel)]
+        if models and depth < MAX_NESTING:
+            return self.fill(models[0], rng=rng, key=f"{key}/{field_name}", depth=depth + 1)
+        return None
+
+    def fill(self,
+             model: Type[RDFModel],
+             rng: random.Random,
+             key: str,
+             values: Optional[Dict[str, Any]] = None,
+             depth: int = 0) -> RDFModel:
+        """
+        Builds a model from its field metadata: given values are used as they are, required fields are always
+        generated, optional ones with `optional_fields` probability
+        :param model: model class
+        :param rng: random generator
+        :param key: unique key of the generated object, used in generated IRIs
+        :param values: values of fields set by the catalog structure
+        :param depth: nesting depth of the model, nested models are not generated beyond MAX_NESTING
+        :return: model instance
+        """
+        values = dict(values or {})
+        for field_name, field_info in model.model_fields.items():
+            if field_name in values:
+                continue
+            if not field_info.is_required() and not self._fill_optional(field_info, rng):
+                continue
+            value = self._value(field_info.annotation, field_name, rng, key, depth)
+            if value is not None:
+                values[field_name] = value
+        return model(**values)
+
+    def _fill_optional(self, field_info: FieldInfo, rng: random.Random) -> bool:
+        classes = _annotation_classes(field_info.annotation)
+        # optional nested models are only added through the catalog structure
+        if any(isinstance(x, type) and issubclass(x, RDFModel) for x in classes) and not any(
+                isinstance(x, type) and issubclass(x, AnyUrl) for x in classes):
+            return False
+        return rng.random() < self.optional_fields
+
+    def agent(self, index: int) -> HRIAgent:
+        """Returns agent `index` of the pool"""
+        index %= self.agents
+        if index not in self._agents:
+            key = f"agent/{index}"
+            self._agents[index] = self.fill(HRIAgent, self._random(key), key,
+                                            {"name": [f"Organisation {index}"], "identifier": [self._iri(key)],
+                                             "homepage": self._iri(f"{key}/home")})
+        return self._agents[index]
+
+    def contact_point(self, index: int) -> HRIVCard:
+        """Returns contact point `index` of the pool"""
+        index %= self.contact_points
+        if index not in self._contact_points:
+            key = f"contact/{index}"
+            self._contact_points[index] = self.fill(HRIVCard, self._random(key), key,
+                                                    {"formatted_name": f"Contact point {index}"})
+        return self._contact_points[index]
+
+    def period_of_time(self, key: str) -> PeriodOfTime:
+        rng = self._random(key)
+        start = _date(rng)
+        return PeriodOfTime(start_date=start.isoformat(),
+                            end_date=(start + timedelta(days=rng.randrange(1, 3650))).isoformat())
+
+    def location(self, key: str) -> Location:
+        rng = self._random(key)
+        longitude, latitude = round(rng.uniform(3.3, 7.2), 4), round(rng.uniform(50.7, 53.5), 4)
+        return Location(geometry=LiteralField(value=f"POINT({longitude} {latitude})", datatype=GeoSPARQL.wktLiteral),
+                        centroid=LiteralField(value=f"POINT({longitude} {latitude})", datatype=GeoSPARQL.wktLiteral))
+
+    def distribution(self, dataset_index: int, index: int) -> HRIDistribution:
+        """Returns distribution `index` of dataset `dataset_index`"""
+        key = f"dataset/{dataset_index}/distribution/{index}"
+        return self.fill(HRIDistribution, self._random(key), key,
+                         {"access_url": self._iri(f"{key}/access")})
+
+    def dataset(self, index: int) -> HRIDataset:
+        """Returns dataset `index` of the catalog"""
+        key = f"dataset/{index}"
+        rng = self._random(key)
+        values = {"identifier": f"dataset-{index}",
+                  "title": [f"{_sentence(rng, 3)} {index}"],
+                  "publisher": self.agent(rng.randrange(self.agents)),
+                  "creator": [self.agent(rng.randrange(self.agents))],
+                  "contact_point": self.contact_point(rng.randrange(self.contact_points)),
+                  "keyword": [LiteralField(value=rng.choice(WORDS), language="en") for _ in range(3)],
+                  "distribution": [self.distribution(index, x) for x in range(self.distributions)]}
+        if self.temporal_coverage:
+            values["temporal_coverage"] = [self.period_of_time(f"{key}/temporal/{x}")
+                                           for x in range(self.temporal_coverage)]
+        if self.spatial_coverage:
+            values["geographical_coverage"] = [self.location(f"{key}/spatial/{x}")
+                                               for x in range(self.spatial_coverage)]
+        return self.fill(HRIDataset, rng, key, values)
+
+    def service(self, index: int) -> HRIDataService:
+        """Returns data service `index` of the catalog"""
+        key = f"service/{index}"
+        rng = self._random(key)
+        return self.fill(HRIDataService, rng, key,
+                         {"identifier": f"service-{index}",
+                          "publisher": self.agent(rng.randrange(self.agents)),
+                          "contact_point": self.contact_point(rng.randrange(self.contact_points)),
+                          "serves_dataset": [self._iri(f"dataset/{rng.randrange(max(self.datasets, 1))}")]})
+
+    def iter_datasets(self) -> Iterator[HRIDataset]:
+        """Lazily yields the datasets of the catalog"""
+        for index in range(self.datasets):
+            yield self.dataset(index)
+
+    def catalog(self, with_datasets: bool = True) -> HRICatalog:
+        """
+        Returns the catalog, with all its datasets in memory
+        :param with_datasets: if False, datasets are replaced by their IRIs
+        :return: HRICatalog
+        """
+        rng = self._random("catalog")
+        datasets = (list(self.iter_datasets()) if with_datasets else
+                    [self._iri(f"dataset/{x}") for x in range(self.datasets)])
+        return self.fill(HRICatalog, rng, "catalog",
+                         {"title": ["Synthetic catalog"],
+                          "publisher": self.agent(0),
+                          "contact_point": self.contact_point(0),
+                          "dataset": datasets,
+                          "service": [self.service(x) for x in range(self.services)]})
+
+    def write_json(self, fileobj: IO[str]) -> None:
+        """
+        Streams the catalog as one JSON document, datasets are generated and written one by one
+        :param fileobj: text file-like object
+        """
+        shell = self.catalog(with_datasets=False).model_dump_json(exclude_none=True, exclude={"dataset"},
+                                                                  serialize_as_any=True)
+        fileobj.write(shell[:-1])
+        fileobj.write(',"dataset":[' if shell != "{}" else '"dataset":[')
+        for index, dataset in enumerate(self.iter_datasets()):
+            if index:
+                fileobj.write(",")
+            fileobj.write(dump_json(dataset))
+        fileobj.write("]}")
+
+    def write_ndjson(self, destination: Union[str, Path, IO]) -> int:
+        """
+        Streams the datasets of the catalog as newline delimited JSON, one dataset per line
+        :param destination: path (gzip compressed if it ends with `.gz`) or file-like object, see
+        `sempyro.io.write_ndjson`
+        :return: number of datasets written
+        """
+        return write_ndjson(destination, self.iter_datasets())
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    argument_parser = argparse.ArgumentParser(description=__doc__)
+    argument_parser.add_argument("--datasets", type=int, default=100)
+    argument_parser.add_argument("--distributions", type=int, default=2)
+    argument_parser.add_argument("--services", type=int, default=1)
+    argument_parser.add_argument("--agents", type=int, default=10)
+    argument_parser.add_argument("--contact-points", type=int, default=10)
+    argument_parser.add_argument("--optional-fields", type=float, default=0.3)
+    argument_parser.add_argument("--seed", type=int, default=0)
+    argument_parser.add_argument("--format", choices=("json", "ndjson"), default="ndjson")
+    argument_parser.add_argument("--output", help="output file, standard output by default")
+    args = argument_parser.parse_args(argv)
+    generator = CatalogGenerator(datasets=args.datasets, distributions=args.distributions, services=args.services,
+                                 agents=args.agents, contact_points=args.contact_points,
+                                 optional_fields=args.optional_fields, seed=args.seed)
+    if args.format == "ndjson":
+        generator.write_ndjson(sys.stdout if args.output is None else args.output)
+        return
+    output = sys.stdout if args.output is None else open(args.output, "w", encoding="utf-8")
+    try:
+        generator.write_json(output)
+    finally:
+        if output is not sys.stdout:
+            output.close()
+
+
+if __name__ == "__main__":
+    main()
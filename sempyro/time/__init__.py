@@ -12,15 +12,20 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from .dcat_time_models import (
-    DateTimeDescription,
-    DayOfWeek,
-    GeneralDateTimeDescription,
-    MonthOfYear,
-    PeriodOfTime,
-    TimeInstant,
-    TimePosition,
-)
+from typing import TYPE_CHECKING
+
+from sempyro.utils.lazy import lazy_loader
+
+if TYPE_CHECKING:
+    from .dcat_time_models import (
+        DateTimeDescription,
+        DayOfWeek,
+        GeneralDateTimeDescription,
+        MonthOfYear,
+        PeriodOfTime,
+        TimeInstant,
+        TimePosition,
+    )
 
 __all__ = (
     "TimePosition",
@@ -32,3 +37,13 @@ __all__ = (
     "MonthOfYear",
     "DayOfWeek"
 )
+
+__getattr__, __dir__ = lazy_loader(__name__, {
+    "DateTimeDescription": ".dcat_time_models",
+    "DayOfWeek": ".dcat_time_models",
+    "GeneralDateTimeDescription": ".dcat_time_models",
+    "MonthOfYear": ".dcat_time_models",
+    "PeriodOfTime": ".dcat_time_models",
+    "TimeInstant": ".dcat_time_models",
+    "TimePosition": ".dcat_time_models",
+})
@@ -15,7 +15,6 @@
 import logging
 import typing
 from datetime import date
-from enum import Enum
 from pathlib import Path
 from typing import Any, Dict, Union
 
@@ -26,6 +25,7 @@ from sempyro import LiteralField, RDFModel
 from sempyro.namespaces import Greg
 from sempyro.utils.constants import year_month_pattern, year_pattern
 from sempyro.utils.validator_functions import force_literal_field
+from sempyro.utils.vocabulary import VocabularyEnum
 
 logger = logging.getLogger("__name__")
 
@@ -79,7 +79,7 @@ class TimePosition(RDFModel):
         return data
 
 
-class DayOfWeek(Enum):
+class DayOfWeek(VocabularyEnum):
     Monday = TIME.Monday
     Tuesday = TIME.Tuesday
     Wednesday = TIME.Wednesday
@@ -89,7 +89,7 @@ class DayOfWeek(Enum):
     Sunday = TIME.Sunday
 
 
-class MonthOfYear(Enum):
+class MonthOfYear(VocabularyEnum):
     January = Greg.January
     February = Greg.February
     March = Greg.March
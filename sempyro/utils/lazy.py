@@ -0,0 +1,49 @@
+# Copyright 2024 Stichting Health-RI
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import importlib
+import sys
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+def lazy_loader(package: str,
+                attributes: Dict[str, str],
+                modules: Optional[Dict[str, str]] = None) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """
+    Builds module level `__getattr__` and `__dir__` (PEP 562) importing the public names of a package on first
+    access only, so importing a package does not import (and build the models of) all its modules. A loaded name is
+    stored in the package namespace, further accesses do not go through `__getattr__`.
+    Names must differ from the names of submodules: importing a submodule sets the package attribute of the same name
+    to the module, which then shadows the lazy name (packages like `sempyro.namespaces` are imported eagerly instead).
+    :param package: name of the package, `__name__` of its `__init__`
+    :param attributes: names provided by the package mapped to the (relative) module defining them
+    :param modules: names of modules provided by the package as attributes mapped to their (relative) module path
+    :return: `__getattr__` and `__dir__` functions for the package
+    """
+    modules = modules or {}
+
+    def __getattr__(name: str) -> Any:
+        if name in attributes:
+            value = getattr(importlib.import_module(attributes[name], package), name)
+        elif name in modules:
+            value = importlib.import_module(modules[name], package)
+        else:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(sys.modules[package])) | set(attributes) | set(modules))
+
+    return __getattr__, __dir__
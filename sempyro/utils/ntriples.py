@@ -0,0 +1,50 @@
+# Copyright 2024 Stichting Health-RI
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import Tuple
+
+from rdflib import Literal
+from rdflib.term import Node
+
+
+def quote_literal(literal: Literal) -> str:
+    """
+    Formats a literal as N-Triples term, the same way rdflib N-Triples serializer does
+    :param literal: rdflib.Literal
+    :return: str, quoted literal with language tag or datatype if any
+    """
+    encoded = '"%s"' % (str(literal).replace("\\", "\\\\")
+                        .replace("\n", "\\n")
+                        .replace('"', '\\"')
+                        .replace("\r", "\\r"))
+    if literal.language:
+        return f"{encoded}@{literal.language}"
+    elif literal.datatype:
+        return f"{encoded}^^<{literal.datatype}>"
+    return encoded
+
+
+def ntriples_term(term: Node) -> str:
+    if isinstance(term, Literal):
+        return quote_literal(term)
+    return term.n3()
+
+
+def ntriples_line(statement: Tuple[Node, ...]) -> str:
+    """
+    Formats a triple as N-Triples line, or a quad (subject, predicate, object, graph name) as N-Quads line
+    :param statement: triple or quad of rdflib terms
+    :return: str, a line terminated with a newline
+    """
+    return " ".join(ntriples_term(term) for term in statement) + " .\n"
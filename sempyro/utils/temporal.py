@@ -0,0 +1,112 @@
+# Copyright 2024 Stichting Health-RI
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Classification and parsing of temporal strings as XSD temporal types (gYear, gYearMonth, date, dateTime and
+dateTimeStamp). ISO 8601 input is recognised with precompiled patterns and parsed with `datetime.fromisoformat`,
+`dateutil` is only used for other (free form) input. Results are cached, as the same dates repeat across records.
+"""
+
+import re
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from typing import Optional, Union
+
+from dateutil import parser
+from rdflib import XSD, URIRef
+
+from sempyro.utils.constants import year_month_pattern, year_pattern
+
+TEMPORAL_CACHE_SIZE = 4096
+
+_timezone = r"(Z|(\+|-)((0[0-9]|1[0-3]):[0-5][0-9]|14:00))"
+_date = r"-?([1-9][0-9]{3,}|0[0-9]{3})-(0[1-9]|1[0-2])-(0[1-9]|[12][0-9]|3[01])"
+_time = r"(([01][0-9]|2[0-3]):[0-5][0-9]:[0-5][0-9](\.[0-9]+)?|(24:00:00(\.0+)?))"
+
+YEAR_RE = re.compile(year_pattern)
+YEAR_MONTH_RE = re.compile(year_month_pattern)
+DATE_RE = re.compile(f"{_date}{_timezone}?")
+DATE_TIME_RE = re.compile(f"{_date}T{_time}{_timezone}?")
+DATE_TIME_STAMP_RE = re.compile(f"{_date}T{_time}{_timezone}")
+TIMEZONE_RE = re.compile(f"{_timezone}$")
+
+
+@lru_cache(maxsize=TEMPORAL_CACHE_SIZE)
+def classify_temporal(value: str) -> Optional[URIRef]:
+    """
+    Classifies a string as an XSD temporal type by its lexical form
+    :param value: str, input value
+    :return: one of XSD.gYear, XSD.gYearMonth, XSD.date, XSD.dateTimeStamp (a dateTime with a time zone) or
+    XSD.dateTime, None if the value is none of them
+    """
+    if YEAR_RE.fullmatch(value):
+        return XSD.gYear
+    if YEAR_MONTH_RE.fullmatch(value):
+        return XSD.gYearMonth
+    if DATE_RE.fullmatch(value):
+        return XSD.date
+    if DATE_TIME_STAMP_RE.fullmatch(value):
+        return XSD.dateTimeStamp
+    if DATE_TIME_RE.fullmatch(value):
+        return XSD.dateTime
+    return None
+
+
+def _from_iso_format(value: str, datatype: URIRef) -> Optional[Union[date, datetime]]:
+    """
+    Parses an ISO 8601 date or dateTime, returns None for values `fromisoformat` does not support. The time zone of a
+    date is dropped, as :class:`datetime.date` has none, and the time 24:00:00 is parsed as midnight of the next day.
+    """
+    if datatype == XSD.date:
+        value = TIMEZONE_RE.sub("", value)
+    elif value.endswith("Z"):
+        value = f"{value[:-1]}+00:00"
+    end_of_day = "T24:" in value
+    if end_of_day:
+        value = value.replace("T24:", "T00:", 1)
+    try:
+        if datatype == XSD.date:
+            return date.fromisoformat(value)
+        parsed = datetime.fromisoformat(value)
+        return parsed + timedelta(days=1) if end_of_day else parsed
+    except (ValueError, OverflowError):
+        return None
+
+
+@lru_cache(maxsize=TEMPORAL_CACHE_SIZE)
+def parse_temporal(value: str) -> Union[str, date, datetime]:
+    """
+    Parses a temporal string: xsd:gYear and xsd:gYearMonth values are returned unchanged, ISO 8601 dates and
+    datetimes are parsed to :class:`datetime.date` and :class:`datetime.datetime` objects, other input is parsed to
+    :class:`datetime.datetime` with `dateutil`
+    :param value: str, input value
+    :return: str, date or datetime
+    :raises: ValueError in case the value can not be parsed
+    """
+    datatype = classify_temporal(value)
+    if datatype in (XSD.gYear, XSD.gYearMonth):
+        return value
+    if datatype is not None:
+        parsed = _from_iso_format(value, datatype)
+        if parsed is not None:
+            return parsed
+    return parser.parse(value)
+
+
+def temporal_cache_info():
+    """
+    Returns hit and miss statistics of the classification and parsing caches
+    :return: dictionary with `functools` cache info of `classify_temporal` and `parse_temporal`
+    """
+    return {"classify": classify_temporal.cache_info(), "parse": parse_temporal.cache_info()}
@@ -0,0 +1,80 @@
+# Copyright 2024 Stichting Health-RI
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Bounded interning caches for rdflib terms created during serialization. The same IRIs (vocabulary enum values,
+licences, EU authority URIs, datatypes) and many literal values repeat across every serialized model, interning
+makes them share one object and skips rdflib normalisation of repeated values.
+"""
+
+from datetime import date
+from functools import lru_cache
+from typing import Any, Dict, Optional
+
+from rdflib import Literal, URIRef
+
+TERM_CACHE_SIZE = 4096
+
+# Literal values are only interned for types which equal values have a single lexical form, e.g. datetimes are not:
+# equal datetimes may have different time zones
+_INTERNED_LITERAL_TYPES = frozenset({str, int, bool, date})
+
+
+@lru_cache(maxsize=TERM_CACHE_SIZE)
+def _intern_uri(value: str) -> URIRef:
+    return URIRef(value)
+
+
+@lru_cache(maxsize=TERM_CACHE_SIZE)
+def _intern_literal(value_type: type, value: Any, datatype: Optional[URIRef]) -> Literal:
+    return Literal(value, datatype=datatype)
+
+
+def uri_term(value: Any) -> URIRef:
+    """
+    Returns an interned URIRef for a value, e.g. a pydantic URL or an enum value
+    :param value: value to convert, its string representation is used as IRI
+    :return: rdflib.URIRef
+    """
+    return _intern_uri(str(value))
+
+
+def literal_term(value: Any, datatype: Optional[URIRef] = None) -> Literal:
+    """
+    Returns an interned Literal for a value with an optional datatype, values of other types than str, int, bool and
+    date are not interned
+    :param value: literal value
+    :param datatype: optional datatype IRI
+    :return: rdflib.Literal
+    """
+    value_type = type(value)
+    if value_type not in _INTERNED_LITERAL_TYPES:
+        return Literal(value, datatype=datatype)
+    if datatype is not None:
+        datatype = _intern_uri(str(datatype))
+    return _intern_literal(value_type, value, datatype)
+
+
+def term_cache_info() -> Dict[str, Any]:
+    """
+    Returns hit and miss statistics of the term caches
+    :return: dictionary with `functools` cache info of the "uri" and "literal" caches
+    """
+    return {"uri": _intern_uri.cache_info(), "literal": _intern_literal.cache_info()}
+
+
+def clear_term_cache() -> None:
+    """Empties the term caches and resets their statistics"""
+    _intern_uri.cache_clear()
+    _intern_literal.cache_clear()
@@ -13,15 +13,17 @@
 # limitations under the License.
 
 import re
-from datetime import datetime
-from typing import Any, Union, List
+from datetime import date, datetime
+from functools import lru_cache
+from typing import Any, List, Union
 
-from dateutil import parser
-from pydantic import ValidationError, AnyUrl
+from pydantic import AnyUrl
 from pydantic.networks import validate_email
 
 from sempyro import LiteralField
-from sempyro.utils.constants import year_month_pattern, year_pattern
+from sempyro.utils.temporal import parse_temporal
+
+EMAIL_CACHE_SIZE = 1024
 
 
 def convert_to_literal(value: Union[List[Union[str, LiteralField]], Union[str, LiteralField]]
@@ -45,36 +47,54 @@ def force_literal_field(value: Union[str, LiteralField]) -> LiteralField:
     return value
 
 
-def date_handler(value: Union[str, Any]) -> Union[str, datetime, Any]:
+def date_handler(value: Union[str, Any]) -> Union[str, date, datetime, Any]:
     """
-    Checks if a string input matches xsd:gYear or xsd:gYearMonth, or can be parsed to a datetime
+    Checks if a string input matches xsd:gYear or xsd:gYearMonth, or can be parsed to a date or datetime, see
+    `sempyro.utils.temporal.parse_temporal`
     :param value: str, input value
-    :return: a string if input matches xsd:gYear or xsd:gYearMonth or a :class:`datetime.datetime` object, 
-    non-string inputs are returned unchanged
-    :raises: pydantic.ValidationError in case a string can not be parsed to datetime.datetime
+    :return: a string if input matches xsd:gYear or xsd:gYearMonth, a :class:`datetime.date` object for an ISO 8601
+    date or a :class:`datetime.datetime` object otherwise, non-string inputs are returned unchanged
+    :raises: ValueError in case a string can not be parsed to datetime.datetime, turned into pydantic.ValidationError
+    by field validators
     """
     if isinstance(value, str):
-        if not (re.match(year_pattern, value) or re.match(year_month_pattern, value)):
-            try:
-                value = parser.parse(value)
-            except TypeError:
-                raise ValidationError
+        value = parse_temporal(value)
     return value
 
 
+@lru_cache(maxsize=EMAIL_CACHE_SIZE)
+def _cached_convert_to_mailto(value: str) -> AnyUrl:
+    mail_part = value
+    if value.startswith("mailto:"):
+        mail_part = re.split(r":|//", value)[-1]
+    mail_part = validate_email(mail_part)[1]
+    return AnyUrl(f"mailto:{mail_part}")
+
+
 def convert_to_mailto(value: str) -> AnyUrl:
     """
     Checks if a string starts with `mailto:`, and if not, prefixes it with this. After that it uses a
-    `validate_email` from Pydantic to validate the email.
+    `validate_email` from Pydantic to validate the email. Results are cached, see `email_cache_info`.
     :param value: str, input value
     :return: a variable of type `AnyUrl` containing a valid email address with the `mailto:` prefix.
     :raises: PydanticCustomError in case the email is not valid.
     """
-    mail_part = value
-    if value.startswith("mailto:"):
-        mail_part = re.split(r":|//", value)[-1]
-    mail_part = validate_email(mail_part)[1]
-    return AnyUrl(f"mailto:{mail_part}")
+    return _cached_convert_to_mailto(str(value))
+
+
+def email_cache_info():
+    """
+    Returns hit and miss statistics of the mailto normalization cache
+    :return: `functools` cache info
+    """
+    return _cached_convert_to_mailto.cache_info()
+
+
+def email_cache_clear() -> None:
+    """
+    Empties the mailto normalization cache, e.g. between benchmark runs
+    """
+    _cached_convert_to_mailto.cache_clear()
 
 
 def validate_convert_email(value: Union[str, None, AnyUrl, List[Union[str, AnyUrl]]]) -> Union[None, List[AnyUrl], AnyUrl]:
@@ -0,0 +1,131 @@
+# Copyright 2024 Stichting Health-RI
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Reverse lookup of controlled-vocabulary enums. Enum values are IRIs (`URIRef`), which never equal plain strings, so
+input read from JSON, CSV or user forms is resolved through an index of aliases built once per enum: the IRI, CURIEs
+of the vocabulary namespace, the code (last segment of the IRI) and the member name, all case-insensitive.
+"""
+
+import difflib
+from enum import Enum
+from typing import Any, Dict, List
+
+from pydantic import GetCoreSchemaHandler
+from pydantic_core import core_schema
+from rdflib.namespace import TIME
+
+# Prefixes accepted in CURIEs besides the last segment of the vocabulary namespace (e.g. 'data-theme:HEAL')
+VOCABULARY_PREFIXES = {
+    "adms": "http://purl.org/adms/status/",
+    "freq": "http://purl.org/cld/freq/",
+    "greg": "http://www.w3.org/ns/time/gregorian#",
+    "time": str(TIME),
+}
+
+MAX_SUGGESTIONS = 3
+
+_indexes: Dict[type, Dict[str, "VocabularyEnum"]] = {}
+
+
+def _split_iri(value: str) -> List[str]:
+    """Splits an IRI into its namespace and code, on the last '#' or '/'"""
+    position = max(value.rfind("#"), value.rfind("/"))
+    return [value[:position + 1], value[position + 1:]]
+
+
+def _namespace_prefixes(namespace: str) -> List[str]:
+    prefixes = [prefix for prefix, prefix_namespace in VOCABULARY_PREFIXES.items() if prefix_namespace == namespace]
+    segment = namespace.rstrip("/#").rsplit("/", 1)[-1]
+    if segment:
+        prefixes.append(segment)
+    return prefixes
+
+
+def _build_index(enum_class: type) -> Dict[str, "VocabularyEnum"]:
+    index = {}
+    for member in enum_class:
+        namespace, code = _split_iri(str(member.value))
+        aliases = [str(member.value), code, member.name]
+        aliases.extend(f"{prefix}:{code}" for prefix in _namespace_prefixes(namespace))
+        for alias in aliases:
+            # earlier members win on clashing aliases
+            index.setdefault(alias.casefold(), member)
+    return index
+
+
+class VocabularyEnum(Enum):
+    """
+    Enum of a controlled vocabulary with IRI values, which members can also be looked up by CURIE, code or name,
+    case-insensitively, e.g. `DatasetTheme("heal")`. Model fields annotated with a VocabularyEnum accept the same
+    input and report unknown values with close matches.
+    """
+
+    @classmethod
+    def aliases(cls) -> Dict[str, "VocabularyEnum"]:
+        """
+        Returns the alias index of the vocabulary, casefolded aliases mapped to members, built once on first use
+        :return: dictionary, which must not be modified
+        """
+        index = _indexes.get(cls)
+        if index is None:
+            index = _indexes[cls] = _build_index(cls)
+        return index
+
+    @classmethod
+    def lookup(cls, value: Any) -> "VocabularyEnum":
+        """
+        Resolves a member from its IRI, a CURIE, its code or its name
+        :param value: member or str
+        :return: member
+        :raises: ValueError if the value is unknown, with suggestions of close matches
+        """
+        if isinstance(value, cls):
+            return value
+        member = cls.aliases().get(str(value).strip().casefold()) if isinstance(value, str) else None
+        if member is None:
+            raise ValueError(cls._unknown_value_message(value))
+        return member
+
+    @classmethod
+    def _unknown_value_message(cls, value: Any) -> str:
+        message = f"'{value}' is not a value of {cls.__name__}"
+        if not isinstance(value, str):
+            return message
+        codes = {}
+        for member in cls:
+            codes.setdefault(member.name.casefold(), member)
+            codes.setdefault(_split_iri(str(member.value))[1].casefold(), member)
+        key = _split_iri(value.strip())[1].rsplit(":", 1)[-1].casefold()
+        matches = difflib.get_close_matches(key, codes, n=MAX_SUGGESTIONS)
+        suggestions = list(dict.fromkeys(codes[x].name for x in matches))
+        if suggestions:
+            message += f", did you mean {', '.join(suggestions)}?"
+        return message
+
+    @classmethod
+    def _missing_(cls, value: Any) -> Any:
+        if isinstance(value, str):
+            return cls.aliases().get(value.strip().casefold())
+        return None
+
+    @classmethod
+    def __get_pydantic_core_schema__(cls, source: Any, handler: GetCoreSchemaHandler) -> core_schema.CoreSchema:
+        return core_schema.no_info_before_validator_function(cls._validate, handler(source))
+
+    @classmethod
+    def _validate(cls, value: Any) -> Any:
+        if isinstance(value, str):
+            return cls.lookup(value)
+        return value
@@ -12,9 +12,19 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from .vcard import VCARD, VCard
+from typing import TYPE_CHECKING
+
+from sempyro.utils.lazy import lazy_loader
+
+if TYPE_CHECKING:
+    from .vcard import VCARD, VCard
 
 __all__ = (
     "VCARD",
     "VCard"
 )
+
+__getattr__, __dir__ = lazy_loader(__name__, {
+    "VCARD": ".vcard",
+    "VCard": ".vcard",
+})